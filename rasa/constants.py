@@ -2,6 +2,8 @@ import os
 
 DEFAULT_REQUEST_TIMEOUT = 60 * 5  # 5 minutes
 DEFAULT_RESPONSE_TIMEOUT = 60 * 60  # 1 hour
+DEFAULT_CONNECTION_LIMIT = 100
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 0  # no limit
 
 TEST_DATA_FILE = "test.md"
 TRAIN_DATA_FILE = "train.md"
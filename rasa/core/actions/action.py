@@ -1,7 +1,9 @@
 import copy
+import itertools
 import json
 import logging
-from typing import List, Text, Optional, Dict, Any, Set, TYPE_CHECKING
+from collections import OrderedDict
+from typing import List, Text, Optional, Dict, Any, Set, Tuple, TYPE_CHECKING
 
 import aiohttp
 
@@ -48,6 +50,7 @@ from rasa.shared.core.events import (
     Restarted,
     SessionStarted,
 )
+from rasa.shared.utils.io import DEFAULT_ENCODING
 from rasa.utils.endpoints import EndpointConfig, ClientResponseError
 from rasa.shared.core.domain import Domain
 
@@ -59,6 +62,13 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Name of the action endpoint setting which enables the compact payload protocol
+COMPACT_PAYLOAD_KEY = "compact_payload"
+
+# Maximum number of conversations for which the number of events which the action
+# server acknowledged is remembered
+MAX_ACKNOWLEDGED_CONVERSATIONS = 10000
+
 
 def default_actions(action_endpoint: Optional[EndpointConfig] = None) -> List["Action"]:
     """List default actions."""
@@ -494,6 +504,83 @@ class ActionDeactivateLoop(Action):
         return [ActiveLoop(None), SlotSet(REQUESTED_SLOT, None)]
 
 
+class AcknowledgedPayload:
+    """Keeps track of the parts of the payload an action server already received.
+
+    An action server acknowledges the domain and the events of a conversation in
+    the `acknowledged` object of its response. Following action calls then only
+    reference the domain by its fingerprint and include the events which were
+    added to the conversation since the acknowledged number of events.
+
+    The acknowledged number of events is only used as long as the tracker still
+    has the last acknowledged event at the same position. This isn't the case
+    anymore e.g. if the tracker store only loaded the events of a new
+    conversation session, in which case the full tracker is sent again.
+    """
+
+    def __init__(self) -> None:
+        self.domain_fingerprint: Optional[Text] = None
+        # number of acknowledged events and type name and timestamp of the last
+        # acknowledged event by conversation
+        self._acknowledged_events: Dict[Text, Tuple[int, Tuple]] = OrderedDict()
+
+    @staticmethod
+    def _event_key(event: Event) -> Tuple[Text, float]:
+        return event.type_name, event.timestamp
+
+    def events_offset(self, tracker: "DialogueStateTracker") -> int:
+        """Returns the number of events of the tracker the server received."""
+        acknowledged_events = self._acknowledged_events.get(tracker.sender_id)
+        if not acknowledged_events:
+            return 0
+
+        number_of_events, last_event = acknowledged_events
+        if (
+            number_of_events > len(tracker.events)
+            or self._event_key(tracker.events[number_of_events - 1]) != last_event
+        ):
+            # the acknowledged events can't be matched with the events of the tracker
+            return 0
+
+        return number_of_events
+
+    def update(
+        self, tracker: "DialogueStateTracker", acknowledged: Dict[Text, Any]
+    ) -> None:
+        """Stores what the action server acknowledged in its response.
+
+        Args:
+            tracker: The tracker which was sent to the action server.
+            acknowledged: The `acknowledged` object of the response.
+        """
+        if "domain_fingerprint" in acknowledged:
+            self.domain_fingerprint = acknowledged["domain_fingerprint"]
+
+        if "number_of_events" not in acknowledged:
+            return
+
+        sender_id = tracker.sender_id
+        number_of_events = acknowledged["number_of_events"]
+        if not 0 < number_of_events <= len(tracker.events):
+            self._acknowledged_events.pop(sender_id, None)
+            return
+
+        last_event = self._event_key(tracker.events[number_of_events - 1])
+        self._acknowledged_events[sender_id] = (number_of_events, last_event)
+        self._acknowledged_events.move_to_end(sender_id)
+        if len(self._acknowledged_events) > MAX_ACKNOWLEDGED_CONVERSATIONS:
+            self._acknowledged_events.popitem(last=False)
+
+    def reset(self, sender_id: Text) -> None:
+        """Forgets what the action server acknowledged for a conversation."""
+        self.domain_fingerprint = None
+        self._acknowledged_events.pop(sender_id, None)
+
+
+# acknowledged payloads by URL of the action server
+_acknowledged_payloads: Dict[Text, AcknowledgedPayload] = {}
+
+
 class RemoteAction(Action):
     def __init__(self, name: Text, action_endpoint: Optional[EndpointConfig]) -> None:
 
@@ -516,6 +603,86 @@ class RemoteAction(Action):
             "version": rasa.__version__,
         }
 
+    def _compact_action_call_format(
+        self,
+        tracker: "DialogueStateTracker",
+        domain: "Domain",
+        acknowledged: AcknowledgedPayload,
+    ) -> Dict[Text, Any]:
+        """Create the request json without the parts the action server received.
+
+        The domain is only included if the action server didn't acknowledge its
+        fingerprint yet. The tracker state only includes the events after the
+        acknowledged number of events (`events_offset`).
+        """
+        events_offset = acknowledged.events_offset(tracker)
+
+        tracker_state = tracker.current_state()
+        tracker_state["events"] = [
+            event.as_dict()
+            for event in itertools.islice(
+                tracker.events, events_offset, len(tracker.events)
+            )
+        ]
+        tracker_state["events_offset"] = events_offset
+
+        payload = {
+            "next_action": self._name,
+            "sender_id": tracker.sender_id,
+            "tracker": tracker_state,
+            "domain_fingerprint": domain.fingerprint,
+            "version": rasa.__version__,
+        }
+        if acknowledged.domain_fingerprint != domain.fingerprint:
+            payload["domain"] = domain.as_dict()
+
+        return payload
+
+    def _uses_compact_payload(self) -> bool:
+        return bool(self.action_endpoint.kwargs.get(COMPACT_PAYLOAD_KEY, False))
+
+    async def _request(self, json_body: Dict[Text, Any]) -> Dict[Text, Any]:
+        if logger.isEnabledFor(logging.DEBUG):
+            body_size = len(json.dumps(json_body).encode(DEFAULT_ENCODING))
+            logger.debug(
+                f"Calling action endpoint to run action '{self.name()}' "
+                f"(request body size: {body_size} bytes)."
+            )
+
+        return await self.action_endpoint.request(
+            json=json_body, method="post", timeout=DEFAULT_REQUEST_TIMEOUT
+        )
+
+    async def _request_with_compact_payload(
+        self, tracker: "DialogueStateTracker", domain: "Domain"
+    ) -> Dict[Text, Any]:
+        acknowledged = _acknowledged_payloads.setdefault(
+            self.action_endpoint.url, AcknowledgedPayload()
+        )
+
+        try:
+            response = await self._request(
+                self._compact_action_call_format(tracker, domain, acknowledged)
+            )
+        except ClientResponseError as e:
+            if e.status != 409:
+                raise
+
+            # the action server doesn't have the referenced domain or events anymore
+            logger.debug(
+                f"Action server didn't accept the compact payload for action "
+                f"'{self.name()}'. Sending the full payload instead."
+            )
+            acknowledged.reset(tracker.sender_id)
+            response = await self._request(
+                self._compact_action_call_format(tracker, domain, acknowledged)
+            )
+
+        self._validate_action_result(response)
+        acknowledged.update(tracker, response.get("acknowledged", {}))
+
+        return response
+
     @staticmethod
     def action_response_format_spec() -> Dict[Text, Any]:
         """Expected response schema for an Action endpoint.
@@ -533,6 +700,13 @@ class RemoteAction(Action):
                     },
                 },
                 "responses": {"type": "array", "items": {"type": "object"}},
+                "acknowledged": {
+                    "type": "object",
+                    "properties": {
+                        "domain_fingerprint": {"type": "string"},
+                        "number_of_events": {"type": "integer"},
+                    },
+                },
             },
         }
 
@@ -593,7 +767,6 @@ class RemoteAction(Action):
         tracker: "DialogueStateTracker",
         domain: "Domain",
     ) -> List[Event]:
-        json_body = self._action_call_format(tracker, domain)
         if not self.action_endpoint:
             logger.error(
                 f"The model predicted the custom action '{self.name()}', "
@@ -606,14 +779,13 @@ class RemoteAction(Action):
             raise Exception("Failed to execute custom action.")
 
         try:
-            logger.debug(
-                "Calling action endpoint to run action '{}'.".format(self.name())
-            )
-            response = await self.action_endpoint.request(
-                json=json_body, method="post", timeout=DEFAULT_REQUEST_TIMEOUT
-            )
-
-            self._validate_action_result(response)
+            if self._uses_compact_payload():
+                response = await self._request_with_compact_payload(tracker, domain)
+            else:
+                response = await self._request(
+                    self._action_call_format(tracker, domain)
+                )
+                self._validate_action_result(response)
 
             events_json = response.get("events", [])
             responses = response.get("responses", [])
@@ -1,8 +1,10 @@
+import asyncio
 from asyncio import CancelledError
 import logging
 import os
 import shutil
 import tempfile
+import time
 from typing import Any, Callable, Dict, List, Optional, Text, Tuple, Union
 import uuid
 
@@ -33,6 +35,8 @@ from rasa.core.tracker_store import (
     InMemoryTrackerStore,
     TrackerStore,
 )
+from rasa.shared.core.constants import ACTION_LISTEN_NAME
+from rasa.shared.core.events import ActionExecuted, UserUttered
 from rasa.shared.core.trackers import DialogueStateTracker
 import rasa.core.utils
 from rasa.exceptions import ModelNotFound
@@ -51,6 +55,9 @@ import rasa.utils.io
 
 logger = logging.getLogger(__name__)
 
+# Message which is parsed and predicted on to warm up a newly loaded model
+WARM_UP_MESSAGE_TEXT = "hello"
+
 
 async def load_from_server(agent: "Agent", model_server: EndpointConfig) -> "Agent":
     """Load a persisted model from a server."""
@@ -113,11 +120,94 @@ def _load_domain_and_policy_ensemble(
     return domain, policy_ensemble
 
 
-def _load_and_set_updated_model(
+def _warm_up_model(
+    domain: Optional[Domain],
+    policy_ensemble: Optional[PolicyEnsemble],
+    interpreter: Optional[NaturalLanguageInterpreter],
+) -> None:
+    """Runs a dummy message through the NLU model and the policies.
+
+    This builds the TensorFlow prediction graphs, so that the first real message
+    after loading a model isn't slowed down by it.
+
+    Args:
+        domain: The domain of the model.
+        policy_ensemble: The policies of the model.
+        interpreter: The NLU interpreter of the model.
+    """
+    # noinspection PyBroadException
+    try:
+        parse_data = {}
+        if (
+            isinstance(interpreter, rasa.core.interpreter.RasaNLUInterpreter)
+            and interpreter.interpreter is not None
+        ):
+            parse_data = interpreter.interpreter.parse(WARM_UP_MESSAGE_TEXT)
+
+        if domain is None or policy_ensemble is None:
+            return
+
+        user_message = UserUttered(
+            WARM_UP_MESSAGE_TEXT,
+            parse_data.get("intent"),
+            parse_data.get("entities"),
+            parse_data,
+        )
+        tracker = DialogueStateTracker.from_events(
+            DEFAULT_SENDER_ID,
+            [ActionExecuted(ACTION_LISTEN_NAME), user_message],
+            domain.slots,
+        )
+        policy_ensemble.probabilities_using_best_policy(
+            tracker, domain, interpreter or RegexInterpreter()
+        )
+    except Exception as e:  # skipcq: PYL-W0703
+        # the model is usable nevertheless, the first message will just be slower
+        logger.warning(f"Failed to warm up the loaded model. Error: {e}")
+
+
+def _load_and_warm_up_model(
+    agent: "Agent", model_directory: Text
+) -> Tuple[
+    Optional[Domain], Optional[PolicyEnsemble], NaturalLanguageInterpreter, float
+]:
+    """Loads the persisted model and warms it up.
+
+    Args:
+        agent: Instance of `Agent` whose interpreter is used if the model doesn't
+            contain an NLU model.
+        model_directory: Rasa model directory.
+
+    Returns:
+        The domain, the policy ensemble and the interpreter of the model and the
+        time it took to load the model in seconds.
+    """
+    start = time.perf_counter()
+
+    core_path, nlu_path = get_model_subdirectories(model_directory)
+    interpreter = _load_interpreter(agent, nlu_path)
+    domain, policy_ensemble = _load_domain_and_policy_ensemble(core_path)
+
+    load_time = time.perf_counter() - start
+    _warm_up_model(domain, policy_ensemble, interpreter)
+    warm_up_time = time.perf_counter() - start - load_time
+
+    logger.debug(
+        f"Loaded model in {load_time:.2f}s and warmed it up in {warm_up_time:.2f}s."
+    )
+
+    return domain, policy_ensemble, interpreter, load_time + warm_up_time
+
+
+async def _load_and_set_updated_model(
     agent: "Agent", model_directory: Text, fingerprint: Text
 ) -> None:
     """Load the persisted model into memory and set the model on the agent.
 
+    The model is loaded and warmed up in a separate thread, so that the agent
+    keeps handling messages with the previous model in the meantime. Afterwards
+    the new model is set on the agent in one go.
+
     Args:
         agent: Instance of `Agent` to update with the new model.
         model_directory: Rasa model directory.
@@ -125,15 +215,20 @@ def _load_and_set_updated_model(
     """
     logger.debug(f"Found new model with fingerprint {fingerprint}. Loading...")
 
-    core_path, nlu_path = get_model_subdirectories(model_directory)
-
     try:
-        interpreter = _load_interpreter(agent, nlu_path)
-        domain, policy_ensemble = _load_domain_and_policy_ensemble(core_path)
+        (
+            domain,
+            policy_ensemble,
+            interpreter,
+            load_time,
+        ) = await asyncio.get_event_loop().run_in_executor(
+            None, _load_and_warm_up_model, agent, model_directory
+        )
 
         agent.update_model(
             domain, policy_ensemble, fingerprint, interpreter, model_directory
         )
+        agent.model_load_time = load_time
 
         logger.debug("Finished updating agent to new model.")
     except Exception as e:  # skipcq: PYL-W0703
@@ -157,7 +252,7 @@ async def _update_model_from_server(
     )
     if model_directory_and_fingerprint:
         model_directory, new_model_fingerprint = model_directory_and_fingerprint
-        _load_and_set_updated_model(agent, model_directory, new_model_fingerprint)
+        await _load_and_set_updated_model(agent, model_directory, new_model_fingerprint)
     else:
         logger.debug(f"No new model found at URL {model_server.url}")
 
@@ -257,6 +352,42 @@ async def schedule_model_pulling(
     )
 
 
+async def _load_agent_in_background(
+    load_function: Callable[..., Optional["Agent"]], *args: Any, **kwargs: Any
+) -> Optional["Agent"]:
+    """Loads and warms up an agent in a separate thread.
+
+    Loading a model takes a while. Doing it in a separate thread keeps the event
+    loop free to handle requests with the currently loaded agent in the meantime.
+
+    Args:
+        load_function: Function which loads the agent.
+        *args: Positional arguments for `load_function`.
+        **kwargs: Keyword arguments for `load_function`.
+
+    Returns:
+        The loaded agent.
+    """
+
+    def load_and_warm_up() -> Optional["Agent"]:
+        start = time.perf_counter()
+        agent = load_function(*args, **kwargs)
+        if agent is None:
+            return None
+
+        load_time = time.perf_counter() - start
+        _warm_up_model(agent.domain, agent.policy_ensemble, agent.interpreter)
+        agent.model_load_time = time.perf_counter() - start
+
+        logger.debug(
+            f"Loaded model in {load_time:.2f}s and warmed it up in "
+            f"{agent.model_load_time - load_time:.2f}s."
+        )
+        return agent
+
+    return await asyncio.get_event_loop().run_in_executor(None, load_and_warm_up)
+
+
 async def load_agent(
     model_path: Optional[Text] = None,
     model_server: Optional[EndpointConfig] = None,
@@ -283,7 +414,8 @@ async def load_agent(
             )
 
         elif remote_storage is not None:
-            return Agent.load_from_remote_storage(
+            return await _load_agent_in_background(
+                Agent.load_from_remote_storage,
                 remote_storage,
                 model_path,
                 interpreter=interpreter,
@@ -295,7 +427,8 @@ async def load_agent(
             )
 
         elif model_path is not None and os.path.exists(model_path):
-            return Agent.load_local_model(
+            return await _load_agent_in_background(
+                Agent.load_local_model,
                 model_path,
                 interpreter=interpreter,
                 generator=generator,
@@ -364,6 +497,8 @@ class Agent:
         self.model_server = model_server
         self.remote_storage = remote_storage
         self.path_to_model_archive = path_to_model_archive
+        # time in seconds it took to load and warm up the current model
+        self.model_load_time: Optional[float] = None
 
     def update_model(
         self,
@@ -491,6 +626,23 @@ class Agent:
         message = UserMessage(message_data)
         return await processor.parse_message(message, tracker)
 
+    async def parse_messages_using_nlu_interpreter(
+        self, texts: List[Text]
+    ) -> List[Dict[Text, Any]]:
+        """Parses several message texts at once.
+
+        In contrast to calling `parse_message_using_nlu_interpreter` for every
+        text, the texts are passed through the NLU pipeline together.
+
+        Args:
+            texts: The message texts in text or intent payload format.
+
+        Returns:
+            The parsed messages in the same order as `texts`.
+        """
+        processor = self.create_processor()
+        return await processor.parse_messages([UserMessage(text) for text in texts])
+
     async def handle_message(
         self,
         message: UserMessage,
@@ -545,12 +697,13 @@ class Agent:
         output_channel: OutputChannel,
         policy: Text,
         confidence: float,
+        tracker: Optional[DialogueStateTracker] = None,
     ) -> Optional[DialogueStateTracker]:
         """Handle a single message."""
 
         processor = self.create_processor()
         return await processor.execute_action(
-            sender_id, action, output_channel, self.nlg, policy, confidence
+            sender_id, action, output_channel, self.nlg, policy, confidence, tracker
         )
 
     async def trigger_intent(
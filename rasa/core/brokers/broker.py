@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, Text, Optional, Union
+from typing import Any, Dict, List, Text, Optional, Union
 
 import rasa.shared.utils.common
 from rasa.utils.endpoints import EndpointConfig
@@ -30,6 +30,18 @@ class EventBroker:
         """Publishes a json-formatted Rasa Core event into an event queue."""
         raise NotImplementedError("Event broker must implement the `publish` method.")
 
+    def publish_many(self, events: List[Dict[Text, Any]]) -> None:
+        """Publishes several json-formatted Rasa Core events into an event queue.
+
+        Publishes the events one after another by default. Event brokers which can
+        send a batch of events at once should override this method.
+
+        Args:
+            events: Serialised events to be published in the given order.
+        """
+        for event in events:
+            self.publish(event)
+
     def is_ready(self) -> bool:
         """Determine whether or not the event broker is ready.
 
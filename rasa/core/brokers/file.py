@@ -1,7 +1,7 @@
 import json
 import logging
 import typing
-from typing import Optional, Text, Dict
+from typing import Optional, Text, Dict, List
 
 from rasa.core.brokers.broker import EventBroker
 
@@ -53,3 +53,10 @@ class FileEventBroker(EventBroker):
 
         self.event_logger.info(json.dumps(event))
         self.event_logger.handlers[0].flush()
+
+    def publish_many(self, events: List[Dict]) -> None:
+        """Write events to file and flush the file once afterwards."""
+
+        for event in events:
+            self.event_logger.info(json.dumps(event))
+        self.event_logger.handlers[0].flush()
@@ -7,6 +7,12 @@ from rasa.shared.utils.io import DEFAULT_ENCODING
 
 logger = logging.getLogger(__name__)
 
+# Defaults of the producer settings which control how events are batched
+DEFAULT_LINGER_MS = 5
+DEFAULT_BATCH_SIZE = 16384
+DEFAULT_BUFFER_MEMORY = 32 * 1024 * 1024
+DEFAULT_MAX_BLOCK_MS = 60000
+
 
 class KafkaEventBroker(EventBroker):
     def __init__(
@@ -21,7 +27,35 @@ class KafkaEventBroker(EventBroker):
         topic="rasa_core_events",
         security_protocol="SASL_PLAINTEXT",
         loglevel=logging.ERROR,
+        linger_ms: int = DEFAULT_LINGER_MS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        buffer_memory: int = DEFAULT_BUFFER_MEMORY,
+        max_block_ms: int = DEFAULT_MAX_BLOCK_MS,
     ) -> None:
+        """Kafka event broker.
+
+        The broker keeps one producer for its whole lifetime. Events are buffered
+        by the producer and sent to Kafka asynchronously in batches.
+
+        Args:
+            host: 'url' argument of the endpoint configuration.
+            sasl_username: Username for SASL authentication.
+            sasl_password: Password for SASL authentication.
+            ssl_cafile: Path to the CA certificate file.
+            ssl_certfile: Path to the client certificate file.
+            ssl_keyfile: Path to the client key file.
+            ssl_check_hostname: Whether the server hostname should be verified.
+            topic: Name of the topic the events are published to.
+            security_protocol: Either `SASL_PLAINTEXT` or `SSL`.
+            loglevel: Logging level of the `kafka` logger.
+            linger_ms: Time in milliseconds the producer waits for further events
+                before it sends a batch.
+            batch_size: Maximum size of a batch in bytes.
+            buffer_memory: Maximum size in bytes of the buffer which holds the
+                events which weren't sent yet.
+            max_block_ms: Maximum time in milliseconds `publish` blocks if the
+                buffer is full.
+        """
 
         self.producer = None
         self.host = host
@@ -33,6 +67,10 @@ class KafkaEventBroker(EventBroker):
         self.ssl_certfile = ssl_certfile
         self.ssl_keyfile = ssl_keyfile
         self.ssl_check_hostname = ssl_check_hostname
+        self.linger_ms = linger_ms
+        self.batch_size = batch_size
+        self.buffer_memory = buffer_memory
+        self.max_block_ms = max_block_ms
 
         logging.getLogger("kafka").setLevel(loglevel)
 
@@ -44,35 +82,66 @@ class KafkaEventBroker(EventBroker):
         return cls(broker_config.url, **broker_config.kwargs)
 
     def publish(self, event) -> None:
-        self._create_producer()
+        if self.producer is None:
+            self._create_producer()
         self._publish(event)
+
+    def publish_many(self, events) -> None:
+        """Appends all events to the buffer of the producer before sending any."""
+        if self.producer is None:
+            self._create_producer()
+        for event in events:
+            self._publish(event)
+
+    def close(self) -> None:
+        """Sends all buffered events and closes the producer."""
         self._close()
 
     def _create_producer(self) -> None:
         import kafka
 
+        producer_config = {
+            "bootstrap_servers": [self.host],
+            "value_serializer": lambda v: json.dumps(v).encode(DEFAULT_ENCODING),
+            "linger_ms": self.linger_ms,
+            "batch_size": self.batch_size,
+            "buffer_memory": self.buffer_memory,
+            "max_block_ms": self.max_block_ms,
+        }
+
         if self.security_protocol == "SASL_PLAINTEXT":
             self.producer = kafka.KafkaProducer(
-                bootstrap_servers=[self.host],
-                value_serializer=lambda v: json.dumps(v).encode(DEFAULT_ENCODING),
                 sasl_plain_username=self.sasl_username,
                 sasl_plain_password=self.sasl_password,
                 sasl_mechanism="PLAIN",
                 security_protocol=self.security_protocol,
+                **producer_config,
             )
         elif self.security_protocol == "SSL":
             self.producer = kafka.KafkaProducer(
-                bootstrap_servers=[self.host],
-                value_serializer=lambda v: json.dumps(v).encode(DEFAULT_ENCODING),
                 ssl_cafile=self.ssl_cafile,
                 ssl_certfile=self.ssl_certfile,
                 ssl_keyfile=self.ssl_keyfile,
                 ssl_check_hostname=False,
                 security_protocol=self.security_protocol,
+                **producer_config,
             )
 
     def _publish(self, event) -> None:
-        self.producer.send(self.topic, event)
+        # `send` only appends the event to the buffer of the producer, the
+        # batches are sent to Kafka in a background thread
+        self.producer.send(self.topic, event).add_errback(
+            self._log_failed_publish, event
+        )
+
+    @staticmethod
+    def _log_failed_publish(event, error: Exception) -> None:
+        logger.error(f"Failed to publish event '{event}' to Kafka. Error: {error}")
 
     def _close(self) -> None:
+        if self.producer is None:
+            return
+
+        self.producer.flush()
         self.producer.close()
+        self.producer = None
@@ -456,11 +456,36 @@ class PikaEventBroker(EventBroker):
                 dictionary). The headers can be retrieved in the consumer from the
                 `headers` attribute of the message's `BasicProperties`.
         """
-        body = json.dumps(event)
+        self.publish_many([event], retries, retry_delay_in_seconds, headers)
+
+    def publish_many(
+        self,
+        events: List[Dict[Text, Any]],
+        retries: int = 60,
+        retry_delay_in_seconds: int = 5,
+        headers: Optional[Dict[Text, Text]] = None,
+    ) -> None:
+        """Publish several events into Pika queue within one retry scope.
+
+        If publishing fails part way through the batch, the next attempt resumes
+        with the first event which wasn't published yet.
+
+        Args:
+            events: Serialised events to be published in the given order.
+            retries: Number of retries if publishing fails
+            retry_delay_in_seconds: Delay in seconds between retries.
+            headers: Message headers to append to the published messages (key-value
+                dictionary). The headers can be retrieved in the consumer from the
+                `headers` attribute of the message's `BasicProperties`.
+        """
+        bodies = [json.dumps(event) for event in events]
+        number_of_published_bodies = 0
 
         while retries:
             try:
-                self._publish(body, headers)
+                for body in bodies[number_of_published_bodies:]:
+                    self._publish(body, headers)
+                    number_of_published_bodies += 1
                 return
             except Exception as e:
                 logger.error(
@@ -474,7 +499,8 @@ class PikaEventBroker(EventBroker):
             retries -= 1
             time.sleep(retry_delay_in_seconds)
 
-        logger.error(f"Failed to publish Pika event on host '{self.host}':\n{body}")
+        for body in bodies[number_of_published_bodies:]:
+            logger.error(f"Failed to publish Pika event on host '{self.host}':\n{body}")
 
     def _get_message_properties(
         self, headers: Optional[Dict[Text, Text]] = None
@@ -1,7 +1,7 @@
 import contextlib
 import json
 import logging
-from typing import Any, Dict, Optional, Text
+from typing import Any, Dict, List, Optional, Text
 
 from rasa.core.brokers.broker import EventBroker
 from rasa.utils.endpoints import EndpointConfig
@@ -72,3 +72,18 @@ class SQLEventBroker(EventBroker):
                 )
             )
             session.commit()
+
+    def publish_many(self, events: List[Dict[Text, Any]]) -> None:
+        """Publishes several json-formatted Rasa Core events in one transaction."""
+        if not events:
+            return
+
+        with self.session_scope() as session:
+            session.execute(
+                self.SQLBrokerEvent.__table__.insert(),
+                [
+                    {"sender_id": event.get("sender_id"), "data": json.dumps(event)}
+                    for event in events
+                ],
+            )
+            session.commit()
@@ -48,3 +48,13 @@ POSTGRESQL_SCHEMA = "POSTGRESQL_SCHEMA"
 # Names of the environment variables defining PostgreSQL pool size and max overflow
 POSTGRESQL_POOL_SIZE = "SQL_POOL_SIZE"
 POSTGRESQL_MAX_OVERFLOW = "SQL_MAX_OVERFLOW"
+
+# Name of the environment variable defining the number of threads which are used to
+# run the policies of the ensemble concurrently during prediction
+POLICY_PREDICTION_THREADS = "POLICY_PREDICTION_THREADS"
+
+# Names of the environment variables defining how many messages are parsed together
+# by the NLU model and how long (in milliseconds) to wait for further messages
+# before a batch is parsed
+NLU_PARSE_BATCH_SIZE = "NLU_PARSE_BATCH_SIZE"
+NLU_PARSE_BATCH_WAIT_TIME = "NLU_PARSE_BATCH_WAIT_TIME_IN_MILLISECONDS"
@@ -1,9 +1,10 @@
 import aiohttp
+import asyncio
 
 import logging
 
 import os
-from typing import Text, Dict, Any, Union, Optional
+from typing import Text, Dict, Any, List, Union, Optional, Tuple, TYPE_CHECKING
 
 from rasa.core import constants
 from rasa.shared.core.trackers import DialogueStateTracker
@@ -14,6 +15,9 @@ import rasa.shared.nlu.interpreter
 from rasa.shared.nlu.training_data.message import Message
 from rasa.utils.endpoints import EndpointConfig
 
+if TYPE_CHECKING:
+    from rasa.nlu.model import Interpreter
+
 logger = logging.getLogger(__name__)
 
 
@@ -112,17 +116,125 @@ class RasaNLUHttpInterpreter(rasa.shared.nlu.interpreter.NaturalLanguageInterpre
             return None
 
 
+class MessageBatcher:
+    """Collects texts which arrive within a short time window and parses them at once.
+
+    Parsing several messages in one batch lets the components of the NLU pipeline
+    (e.g. `DIETClassifier`) run a single inference for all of them instead of one
+    inference per message.
+    """
+
+    def __init__(
+        self, interpreter: "Interpreter", max_batch_size: int, max_wait_time: float
+    ) -> None:
+        """Creates a `MessageBatcher`.
+
+        Args:
+            interpreter: The interpreter which parses the batches.
+            max_batch_size: Maximum number of texts which are parsed together.
+            max_wait_time: Maximum time in seconds a text waits for other texts
+                before its batch is parsed.
+        """
+        self.interpreter = interpreter
+        self.max_batch_size = max_batch_size
+        self.max_wait_time = max_wait_time
+        self._pending: List[Tuple[Text, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    async def parse(self, text: Text) -> Dict[Text, Any]:
+        """Parses a text together with the other texts of its batch.
+
+        Args:
+            text: The text to parse.
+
+        Returns:
+            The parse result for `text`.
+        """
+        loop = asyncio.get_event_loop()
+        result = loop.create_future()
+        self._pending.append((text, result))
+
+        if len(self._pending) >= self.max_batch_size:
+            self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait_time, self.flush)
+
+        return await result
+
+    def flush(self) -> None:
+        """Parses all pending texts and hands the results to the waiting callers."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        try:
+            results = self.interpreter.parse_batch([text for text, _ in pending])
+        except Exception as e:
+            logger.debug(
+                f"Failed to parse a batch of {len(pending)} messages ({e}). "
+                f"Parsing the messages one by one instead."
+            )
+            self._parse_one_by_one(pending)
+            return
+
+        for (_, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
+
+    def _parse_one_by_one(self, pending: List[Tuple[Text, asyncio.Future]]) -> None:
+        # only the callers whose message can't be parsed receive an exception
+        for text, future in pending:
+            if future.done():
+                continue
+
+            try:
+                future.set_result(self.interpreter.parse(text))
+            except Exception as e:
+                future.set_exception(e)
+
+
 class RasaNLUInterpreter(rasa.shared.nlu.interpreter.NaturalLanguageInterpreter):
     def __init__(
         self,
         model_directory: Text,
         config_file: Optional[Text] = None,
         lazy_init: bool = False,
+        batch_size: Optional[int] = None,
+        batch_wait_time: Optional[float] = None,
     ):
+        """Creates a `RasaNLUInterpreter`.
+
+        Args:
+            model_directory: Directory of the trained NLU model.
+            config_file: Path to the model configuration.
+            lazy_init: If `True`, the model is loaded when the first message is parsed.
+            batch_size: Maximum number of concurrently received messages which are
+                parsed together. If `None`, the value is read from the environment
+                variable `NLU_PARSE_BATCH_SIZE`. Messages are parsed one by one if
+                the value is `1`.
+            batch_wait_time: Maximum time in milliseconds a message waits for other
+                messages before its batch is parsed. If `None`, the value is read
+                from the environment variable
+                `NLU_PARSE_BATCH_WAIT_TIME_IN_MILLISECONDS`.
+        """
         self.model_directory = model_directory
         self.lazy_init = lazy_init
         self.config_file = config_file
 
+        if batch_size is None:
+            batch_size = int(os.environ.get(constants.NLU_PARSE_BATCH_SIZE, 1))
+        if batch_wait_time is None:
+            batch_wait_time = float(
+                os.environ.get(constants.NLU_PARSE_BATCH_WAIT_TIME, 5)
+            )
+        self.batch_size = batch_size
+        self.batch_wait_time = batch_wait_time
+        self._batcher: Optional[MessageBatcher] = None
+
         if not lazy_init:
             self._load_interpreter()
         else:
@@ -142,10 +254,27 @@ class RasaNLUInterpreter(rasa.shared.nlu.interpreter.NaturalLanguageInterpreter)
         if self.lazy_init and self.interpreter is None:
             self._load_interpreter()
 
+        if self._batcher is not None:
+            return await self._batcher.parse(text)
+
         result = self.interpreter.parse(text)
 
         return result
 
+    async def parse_batch(self, texts: List[Text]) -> List[Dict[Text, Any]]:
+        """Parses several texts with a single pass through the NLU pipeline.
+
+        Args:
+            texts: The texts to parse.
+
+        Returns:
+            The parse results in the same order as `texts`.
+        """
+        if self.lazy_init and self.interpreter is None:
+            self._load_interpreter()
+
+        return self.interpreter.parse_batch(texts)
+
     def featurize_message(self, message: Message) -> Optional[Message]:
         """Featurize message using a trained NLU pipeline.
         Args:
@@ -163,6 +292,11 @@ class RasaNLUInterpreter(rasa.shared.nlu.interpreter.NaturalLanguageInterpreter)
 
         self.interpreter = Interpreter.load(self.model_directory)
 
+        if self.batch_size > 1:
+            self._batcher = MessageBatcher(
+                self.interpreter, self.batch_size, self.batch_wait_time / 1000
+            )
+
 
 def _create_from_endpoint_config(
     endpoint_config: Optional[EndpointConfig],
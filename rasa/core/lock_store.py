@@ -1,16 +1,22 @@
 import asyncio
-import json
 import logging
 import os
+import time
+import typing
+from collections import deque
 
 from async_generator import asynccontextmanager
-from typing import Text, Union, Optional, AsyncGenerator
+from typing import Any, Dict, Text, Union, Optional, AsyncGenerator
 
 import rasa.shared.utils.common
 from rasa.core.constants import DEFAULT_LOCK_LIFETIME
-from rasa.core.lock import TicketLock
+from rasa.core.lock import Ticket, TicketLock
+from rasa.shared.utils.io import DEFAULT_ENCODING
 from rasa.utils.endpoints import EndpointConfig
 
+if typing.TYPE_CHECKING:
+    from redis.client import Pipeline, PubSubWorkerThread
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,9 +24,20 @@ def _get_lock_lifetime() -> int:
     return int(os.environ.get("TICKET_LOCK_LIFETIME", 0)) or DEFAULT_LOCK_LIFETIME
 
 
+def _milliseconds(seconds: float) -> int:
+    return max(int(seconds * 1000), 1)
+
+
 LOCK_LIFETIME = _get_lock_lifetime()
 DEFAULT_SOCKET_TIMEOUT_IN_SECONDS = 10
 
+# prefixes of the Redis keys of the tickets and the ticket counter of a conversation
+LOCK_TICKETS_KEY_PREFIX = "lock_tickets:"
+LOCK_ISSUED_TICKETS_KEY_PREFIX = "lock_issued_tickets:"
+
+# prefix of the Redis channels which announce that a ticket of a conversation was served
+LOCK_RELEASE_CHANNEL_PREFIX = "lock_release:"
+
 
 # noinspection PyUnresolvedReferences
 class LockError(Exception):
@@ -34,6 +51,9 @@ class LockError(Exception):
 
 
 class LockStore:
+    # events which are set once a ticket of the conversation was served
+    _lock_release_events: Optional[Dict[Text, asyncio.Event]] = None
+
     @staticmethod
     def create(obj: Union["LockStore", EndpointConfig, None]) -> "LockStore":
         """Factory to create a lock store."""
@@ -91,8 +111,9 @@ class LockStore:
     ) -> AsyncGenerator[TicketLock, None]:
         """Acquire lock with lifetime `lock_lifetime`for `conversation_id`.
 
-        Try acquiring lock with a wait time of `wait_time_in_seconds` seconds
-        between attempts. Raise a `LockError` if lock has expired.
+        Try acquiring lock whenever a ticket for `conversation_id` was served, but
+        at least every `wait_time_in_seconds` seconds. Raise a `LockError` if lock
+        has expired.
         """
         ticket = self.issue_ticket(conversation_id, lock_lifetime)
         try:
@@ -125,14 +146,41 @@ class LockStore:
                 f"Retrying..."
             )
 
-            # sleep and update lock
-            await asyncio.sleep(wait_time_in_seconds)
+            # wait for the lock to be released and update lock
+            await self._wait_for_lock_release(conversation_id, wait_time_in_seconds)
             self.update_lock(conversation_id)
 
         raise LockError(
             f"Could not acquire lock for conversation_id '{conversation_id}'."
         )
 
+    async def _wait_for_lock_release(
+        self, conversation_id: Text, timeout_in_seconds: float
+    ) -> None:
+        """Wait until a ticket for `conversation_id` was served or the timeout
+        passed."""
+
+        if self._lock_release_events is None:
+            self._lock_release_events = {}
+
+        lock_released = self._lock_release_events.setdefault(
+            conversation_id, asyncio.Event()
+        )
+        try:
+            await asyncio.wait_for(lock_released.wait(), timeout_in_seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    def _notify_lock_release(self, conversation_id: Text) -> None:
+        """Wake up everyone in this process who waits for `conversation_id`."""
+
+        if self._lock_release_events is None:
+            return
+
+        lock_released = self._lock_release_events.pop(conversation_id, None)
+        if lock_released:
+            lock_released.set()
+
     def update_lock(self, conversation_id: Text) -> None:
         """Fetch lock for `conversation_id`, remove expired tickets and save lock."""
 
@@ -173,6 +221,8 @@ class LockStore:
             lock.remove_ticket_for(ticket_number)
             self.save_lock(lock)
 
+        self._notify_lock_release(conversation_id)
+
     def cleanup(self, conversation_id: Text, ticket_number: int) -> None:
         """Remove lock for `conversation_id` if no one is waiting."""
 
@@ -189,7 +239,15 @@ class LockStore:
 
 
 class RedisLockStore(LockStore):
-    """Redis store for ticket locks."""
+    """Redis store for ticket locks.
+
+    The tickets of a conversation are stored in a sorted set with their expiry
+    time as score. A counter next to it numbers the issued tickets. Every lock
+    operation is a single atomic Redis transaction.
+    """
+
+    # thread which listens to lock releases, `False` if subscribing failed
+    _lock_release_listener: Union["PubSubWorkerThread", bool, None] = None
 
     def __init__(
         self,
@@ -225,17 +283,199 @@ class RedisLockStore(LockStore):
         )
         super().__init__()
 
+    def _listen_to_lock_releases(self) -> None:
+        """Subscribe to the lock releases of all Rasa instances using this store.
+
+        The subscription is handled in a background thread which wakes up the
+        waiting coroutines in the event loop of the caller.
+        """
+
+        if self._lock_release_listener is not None:
+            return
+
+        loop = asyncio.get_event_loop()
+
+        def _on_lock_release(message: Dict[Text, Any]) -> None:
+            conversation_id = message["channel"].decode(DEFAULT_ENCODING)[
+                len(LOCK_RELEASE_CHANNEL_PREFIX) :
+            ]
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self._notify_lock_release, conversation_id)
+
+        try:
+            pubsub = self.red.pubsub(ignore_subscribe_messages=True)
+            pubsub.psubscribe(**{f"{LOCK_RELEASE_CHANNEL_PREFIX}*": _on_lock_release})
+            self._lock_release_listener = pubsub.run_in_thread(
+                sleep_time=1, daemon=True
+            )
+        except Exception as e:
+            logger.debug(
+                f"Could not subscribe to lock releases. Waiting lock requests will "
+                f"be retried periodically instead. Error: {e}"
+            )
+            self._lock_release_listener = False
+
+    async def _wait_for_lock_release(
+        self, conversation_id: Text, timeout_in_seconds: float
+    ) -> None:
+        self._listen_to_lock_releases()
+        await super()._wait_for_lock_release(conversation_id, timeout_in_seconds)
+
+    @staticmethod
+    def _tickets_key(conversation_id: Text) -> Text:
+        return f"{LOCK_TICKETS_KEY_PREFIX}{conversation_id}"
+
+    @staticmethod
+    def _issued_tickets_key(conversation_id: Text) -> Text:
+        return f"{LOCK_ISSUED_TICKETS_KEY_PREFIX}{conversation_id}"
+
+    def issue_ticket(
+        self, conversation_id: Text, lock_lifetime: float = LOCK_LIFETIME
+    ) -> int:
+        """Issue new ticket with `lock_lifetime` for lock associated with
+        `conversation_id`.
+
+        Drawing the ticket number from the counter and adding the ticket happen in
+        one Redis transaction, which is retried if another Rasa instance issues a
+        ticket or removes the lock in between. Tickets are hence unique across all
+        Rasa instances using this store and are added in the order of their numbers.
+        """
+        logger.debug(f"Issuing ticket for conversation '{conversation_id}'.")
+        tickets_key = self._tickets_key(conversation_id)
+        issued_tickets_key = self._issued_tickets_key(conversation_id)
+
+        def _issue_ticket(pipeline: "Pipeline") -> int:
+            ticket_number = int(pipeline.get(issued_tickets_key) or 0)
+
+            pipeline.multi()
+            # the counter has to outlive the tickets, which Rasa issues with
+            # `LOCK_LIFETIME` unless specified otherwise
+            pipeline.set(
+                issued_tickets_key,
+                ticket_number + 1,
+                px=_milliseconds(max(lock_lifetime, LOCK_LIFETIME)),
+            )
+            pipeline.zadd(tickets_key, {ticket_number: time.time() + lock_lifetime})
+
+            return ticket_number
+
+        try:
+            return self.red.transaction(
+                _issue_ticket, issued_tickets_key, value_from_callable=True
+            )
+        except Exception as e:
+            raise LockError(f"Error while acquiring lock. Error:\n{e}")
+
+    def update_lock(self, conversation_id: Text) -> None:
+        """Remove expired tickets of the lock for `conversation_id`."""
+
+        self.red.zremrangebyscore(
+            self._tickets_key(conversation_id), "-inf", f"({time.time()}"
+        )
+
+    def is_someone_waiting(self, conversation_id: Text) -> bool:
+        """Return whether someone is waiting for lock associated with
+        `conversation_id`."""
+
+        tickets_key = self._tickets_key(conversation_id)
+        with self.red.pipeline() as pipeline:
+            pipeline.zremrangebyscore(tickets_key, "-inf", f"({time.time()}")
+            pipeline.zcard(tickets_key)
+            _, number_of_tickets = pipeline.execute()
+
+        return number_of_tickets > 0
+
+    def finish_serving(self, conversation_id: Text, ticket_number: int) -> None:
+        """Finish serving ticket with `ticket_number` for `conversation_id`.
+
+        Removes the ticket and announces the release of the lock to all Rasa
+        instances using this store.
+        """
+
+        with self.red.pipeline() as pipeline:
+            pipeline.zrem(self._tickets_key(conversation_id), ticket_number)
+            self._publish_lock_release(pipeline, conversation_id, ticket_number)
+            pipeline.execute()
+
+        self._notify_lock_release(conversation_id)
+
+    def cleanup(self, conversation_id: Text, ticket_number: int) -> None:
+        """Remove lock for `conversation_id` if no one is waiting.
+
+        Finishing to serve the ticket and deleting the lock happen in one Redis
+        transaction, which is retried if another Rasa instance issues a ticket in
+        between.
+        """
+        tickets_key = self._tickets_key(conversation_id)
+        issued_tickets_key = self._issued_tickets_key(conversation_id)
+
+        def _remove_ticket(pipeline: "Pipeline") -> None:
+            valid_tickets = pipeline.zrangebyscore(tickets_key, time.time(), "+inf")
+            is_someone_waiting = any(
+                int(number) != ticket_number for number in valid_tickets
+            )
+
+            pipeline.multi()
+            if is_someone_waiting:
+                pipeline.zrem(tickets_key, ticket_number)
+            else:
+                pipeline.delete(tickets_key, issued_tickets_key)
+            self._publish_lock_release(pipeline, conversation_id, ticket_number)
+
+        self.red.transaction(_remove_ticket, tickets_key, issued_tickets_key)
+
+        self._notify_lock_release(conversation_id)
+
+    @staticmethod
+    def _publish_lock_release(
+        pipeline: "Pipeline", conversation_id: Text, ticket_number: int
+    ) -> None:
+        pipeline.publish(
+            f"{LOCK_RELEASE_CHANNEL_PREFIX}{conversation_id}", ticket_number
+        )
+
     def get_lock(self, conversation_id: Text) -> Optional[TicketLock]:
-        serialised_lock = self.red.get(conversation_id)
-        if serialised_lock:
-            return TicketLock.from_dict(json.loads(serialised_lock))
+        tickets_key = self._tickets_key(conversation_id)
+        with self.red.pipeline() as pipeline:
+            pipeline.zremrangebyscore(tickets_key, "-inf", f"({time.time()}")
+            pipeline.zrange(tickets_key, 0, -1, withscores=True)
+            pipeline.exists(self._issued_tickets_key(conversation_id))
+            _, tickets, lock_exists = pipeline.execute()
+
+        if not lock_exists and not tickets:
+            return None
+
+        tickets = [Ticket(int(number), expires) for number, expires in tickets]
+        tickets.sort(key=lambda ticket: ticket.number)
+
+        return TicketLock(conversation_id, deque(tickets))
 
     def delete_lock(self, conversation_id: Text) -> None:
-        deletion_successful = self.red.delete(conversation_id)
+        deletion_successful = self.red.delete(
+            self._tickets_key(conversation_id),
+            self._issued_tickets_key(conversation_id),
+        )
         self._log_deletion(conversation_id, deletion_successful)
 
     def save_lock(self, lock: TicketLock) -> None:
-        self.red.set(lock.conversation_id, lock.dumps())
+        tickets_key = self._tickets_key(lock.conversation_id)
+        lifetime = max(
+            [ticket.expires - time.time() for ticket in lock.tickets] + [LOCK_LIFETIME]
+        )
+
+        with self.red.pipeline() as pipeline:
+            pipeline.delete(tickets_key)
+            if lock.tickets:
+                pipeline.zadd(
+                    tickets_key,
+                    {ticket.number: ticket.expires for ticket in lock.tickets},
+                )
+            pipeline.set(
+                self._issued_tickets_key(lock.conversation_id),
+                lock.last_issued + 1,
+                px=_milliseconds(lifetime),
+            )
+            pipeline.execute()
 
 
 class InMemoryLockStore(LockStore):
@@ -1,9 +1,15 @@
+import copy
 import re
 import logging
-from typing import Text, Dict, Union, Any, List
+import string
+from typing import Text, Dict, Union, Any, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# matches the field names which `interpolate_text` creates for the placeholders
+FIELD_NAME_PATTERN = re.compile(r"0\[([^\]]*)\]")
+CONVERSIONS = {"r": repr, "s": str, "a": ascii}
+
 
 def interpolate_text(template: Text, values: Dict[Text, Text]) -> Text:
     """Interpolate values into templates with placeholders.
@@ -74,3 +80,122 @@ def interpolate(
     elif isinstance(template, list):
         return [interpolate(i, values) for i in template]
     return template
+
+
+class CompiledText:
+    """Text with placeholders which is parsed once and filled repeatedly.
+
+    Filling a compiled text gives the same result as `interpolate_text`, but
+    doesn't need a regex or a format string parser. Texts with placeholders which
+    can't be parsed upfront are filled with `interpolate_text`.
+    """
+
+    def __init__(self, template: Text) -> None:
+        self.template = template
+        self._parts = self._parse(template)
+
+    @staticmethod
+    def _parse(
+        template: Text,
+    ) -> Optional[List[Tuple[Text, Optional[Text], Optional[Text], Text]]]:
+        """Splits the text into literal texts and the placeholders following them.
+
+        Returns:
+            Tuples of the literal text, the name of the value which follows it,
+            its conversion and its format spec. `None` if the placeholders can't
+            be resolved to names of values.
+        """
+        text = re.sub(r"{([^\n{}]+?)}", r"{0[\1]}", template)
+        try:
+            parsed = list(string.Formatter().parse(text))
+        except ValueError:
+            return None
+
+        parts = []
+        for literal, field_name, format_spec, conversion in parsed:
+            if field_name is None:
+                parts.append((literal, None, None, ""))
+                continue
+
+            match = FIELD_NAME_PATTERN.fullmatch(field_name)
+            # numeric names would be used as integer keys by `str.format`
+            if not match or match.group(1).isdecimal():
+                return None
+            if conversion is not None and conversion not in CONVERSIONS:
+                return None
+
+            parts.append((literal, match.group(1), conversion, format_spec))
+
+        return parts
+
+    def fill(self, values: Dict[Text, Any]) -> Text:
+        """Fills the placeholders of the text with the given values."""
+        if self._parts is None:
+            return interpolate_text(self.template, values)
+
+        pieces = []
+        for literal, name, conversion, format_spec in self._parts:
+            pieces.append(literal)
+            if name is None:
+                continue
+            if name not in values:
+                # let `interpolate_text` log the missing value
+                return interpolate_text(self.template, values)
+
+            value = values[name]
+            if conversion:
+                value = CONVERSIONS[conversion](value)
+            pieces.append(format(value, format_spec))
+
+        text = "".join(pieces)
+        if "0[" in text:
+            # `interpolate_text` treats these texts as escaped placeholders
+            return interpolate_text(self.template, values)
+
+        return text
+
+
+def compile_template(
+    template: Union[List[Any], Dict[Text, Any], Text, Any]
+) -> Union[List[Any], Dict[Text, Any], CompiledText, Any]:
+    """Recursively compiles the texts of a template to fill them repeatedly.
+
+    Args:
+        template: The template that should be compiled.
+
+    Returns:
+        The template with all texts replaced by `CompiledText`s.
+    """
+    if isinstance(template, str):
+        return CompiledText(template)
+    elif isinstance(template, dict):
+        return {k: compile_template(v) for k, v in template.items()}
+    elif isinstance(template, list):
+        return [compile_template(i) for i in template]
+    return template
+
+
+def fill_compiled_template(
+    compiled_template: Union[List[Any], Dict[Text, Any], CompiledText, Any],
+    values: Dict[Text, Any],
+) -> Union[List[Any], Dict[Text, Any], Text, Any]:
+    """Recursively fills a compiled template.
+
+    Args:
+        compiled_template: The template returned by `compile_template`.
+        values: A dictionary of keys and the values that those
+            keys should be replaced with.
+
+    Returns:
+        A new template with any replacements made, which is equal to the result of
+        `interpolate` for the original template.
+    """
+    if isinstance(compiled_template, CompiledText):
+        return compiled_template.fill(values)
+    elif isinstance(compiled_template, dict):
+        return {
+            k: fill_compiled_template(v, values) for k, v in compiled_template.items()
+        }
+    elif isinstance(compiled_template, list):
+        return [fill_compiled_template(i, values) for i in compiled_template]
+    return copy.deepcopy(compiled_template)
@@ -1,8 +1,9 @@
 import copy
 import logging
+from collections import defaultdict
 
 from rasa.shared.core.trackers import DialogueStateTracker
-from typing import Text, Any, Dict, Optional, List
+from typing import Text, Any, Dict, Optional, List, Tuple
 
 from rasa.core.nlg import interpolator  # pytype: disable=pyi-error
 from rasa.core.nlg.generator import NaturalLanguageGenerator
@@ -10,6 +11,44 @@ from rasa.core.nlg.generator import NaturalLanguageGenerator
 logger = logging.getLogger(__name__)
 
 
+# keys of a template whose values are filled with slot values and key word arguments
+KEYS_TO_INTERPOLATE = [
+    "text",
+    "image",
+    "custom",
+    "buttons",
+    "attachment",
+    "quick_replies",
+]
+
+
+class CompiledTemplate:
+    """Template whose texts were parsed once to fill them for every utterance."""
+
+    def __init__(self, template: Dict[Text, Any]) -> None:
+        self.template = template
+        self._compiled_values = {
+            key: interpolator.compile_template(template[key])
+            for key in KEYS_TO_INTERPOLATE
+            if key in template
+        }
+
+    def fill(self, template_vars: Dict[Text, Any]) -> Dict[Text, Any]:
+        """Returns a copy of the template filled with the template variables."""
+
+        if not template_vars:
+            return copy.deepcopy(self.template)
+
+        return {
+            key: interpolator.fill_compiled_template(
+                self._compiled_values[key], template_vars
+            )
+            if key in self._compiled_values
+            else copy.deepcopy(value)
+            for key, value in self.template.items()
+        }
+
+
 class TemplatedNaturalLanguageGenerator(NaturalLanguageGenerator):
     """Natural language generator that generates messages based on templates.
 
@@ -18,26 +57,97 @@ class TemplatedNaturalLanguageGenerator(NaturalLanguageGenerator):
 
     def __init__(self, templates: Dict[Text, List[Dict[Text, Any]]]) -> None:
         self.templates = templates
+        # compiled templates grouped by their output channel per utter action,
+        # together with the list of templates (and its length) they were compiled from
+        self._compiled_templates: Dict[
+            Text,
+            Tuple[
+                List[Dict[Text, Any]],
+                int,
+                Dict[Optional[Text], List[CompiledTemplate]],
+                List[CompiledTemplate],
+            ],
+        ] = {}
+
+    @staticmethod
+    def _group_by_channel(
+        compiled_templates: List[CompiledTemplate],
+    ) -> Tuple[Dict[Optional[Text], List[CompiledTemplate]], List[CompiledTemplate]]:
+        """Groups the templates by channel and collects the default templates."""
+
+        channel_templates = defaultdict(list)
+        default_templates = []
+
+        for compiled_template in compiled_templates:
+            channel = compiled_template.template.get("channel")
+            channel_templates[channel].append(compiled_template)
+            if not channel:
+                default_templates.append(compiled_template)
+
+        return dict(channel_templates), default_templates
+
+    def _compiled_templates_for_utter_action(
+        self, utter_action: Text, output_channel: Text
+    ) -> List[CompiledTemplate]:
+        """Returns the compiled templates which fit the channel and action.
+
+        The templates of an utter action are compiled with the first lookup and
+        compiled again if the templates of the utter action were replaced or
+        templates were added to or removed from them.
+        """
+        utter_action_templates = self.templates.get(utter_action)
+        if not utter_action_templates:
+            return []
+
+        compiled = self._compiled_templates.get(utter_action)
+        if (
+            compiled is None
+            or compiled[0] is not utter_action_templates
+            or compiled[1] != len(utter_action_templates)
+        ):
+            compiled = (
+                utter_action_templates,
+                len(utter_action_templates),
+            ) + self._group_by_channel(
+                [CompiledTemplate(template) for template in utter_action_templates]
+            )
+            self._compiled_templates[utter_action] = compiled
+
+        _, _, channel_templates, default_templates = compiled
+
+        # always prefer channel specific templates over default ones
+        return channel_templates.get(output_channel) or default_templates
 
     def _templates_for_utter_action(
         self, utter_action: Text, output_channel: Text
     ) -> List[Dict[Text, Any]]:
         """Return array of templates that fit the channel and action."""
 
-        channel_templates = []
-        default_templates = []
+        return [
+            compiled_template.template
+            for compiled_template in self._compiled_templates_for_utter_action(
+                utter_action, output_channel
+            )
+        ]
 
-        for template in self.templates[utter_action]:
-            if template.get("channel") == output_channel:
-                channel_templates.append(template)
-            elif not template.get("channel"):
-                default_templates.append(template)
+    def _random_compiled_template_for(
+        self, utter_action: Text, output_channel: Text
+    ) -> Optional[CompiledTemplate]:
+        """Select random template for the utter action from available ones.
 
-        # always prefer channel specific templates over default ones
-        if channel_templates:
-            return channel_templates
+        If channel-specific templates for the current output channel are given,
+        only choose from channel-specific ones.
+        """
+        import numpy as np
+
+        suitable_templates = self._compiled_templates_for_utter_action(
+            utter_action, output_channel
+        )
+
+        if suitable_templates:
+            return np.random.choice(suitable_templates)
         else:
-            return default_templates
+            return None
 
     # noinspection PyUnusedLocal
     def _random_template_for(
@@ -48,19 +158,11 @@ class TemplatedNaturalLanguageGenerator(NaturalLanguageGenerator):
         If channel-specific templates for the current output channel are given,
         only choose from channel-specific ones.
         """
-        import numpy as np
-
-        if utter_action in self.templates:
-            suitable_templates = self._templates_for_utter_action(
-                utter_action, output_channel
-            )
 
-            if suitable_templates:
-                return np.random.choice(suitable_templates)
-            else:
-                return None
-        else:
-            return None
+        compiled_template = self._random_compiled_template_for(
+            utter_action, output_channel
+        )
+        return compiled_template.template if compiled_template else None
 
     async def generate(
         self,
@@ -86,10 +188,14 @@ class TemplatedNaturalLanguageGenerator(NaturalLanguageGenerator):
         """Generate a response for the requested template."""
 
         # Fetching a random template for the passed template name
-        r = copy.deepcopy(self._random_template_for(template_name, output_channel))
+        compiled_template = self._random_compiled_template_for(
+            template_name, output_channel
+        )
         # Filling the slots in the template and returning the template
-        if r is not None:
-            return self._fill_template(r, filled_slots, **kwargs)
+        if compiled_template is not None:
+            return compiled_template.fill(
+                self._template_variables(filled_slots, kwargs)
+            )
         else:
             return None
 
@@ -104,21 +210,7 @@ class TemplatedNaturalLanguageGenerator(NaturalLanguageGenerator):
         # Getting the slot values in the template variables
         template_vars = self._template_variables(filled_slots, kwargs)
 
-        keys_to_interpolate = [
-            "text",
-            "image",
-            "custom",
-            "buttons",
-            "attachment",
-            "quick_replies",
-        ]
-        if template_vars:
-            for key in keys_to_interpolate:
-                if key in template:
-                    template[key] = interpolator.interpolate(
-                        template[key], template_vars
-                    )
-        return template
+        return CompiledTemplate(template).fill(template_vars)
 
     @staticmethod
     def _template_variables(
@@ -1,9 +1,13 @@
+import copy
 import importlib
 import json
 import logging
 import os
 import sys
+import time
+import weakref
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Text, Optional, Any, List, Dict, Tuple, Set, NamedTuple, Union
@@ -14,6 +18,7 @@ import rasa.shared.utils.common
 import rasa.shared.utils.io
 import rasa.utils.io
 from rasa.constants import MINIMUM_COMPATIBLE_VERSION
+from rasa.core.constants import POLICY_PREDICTION_THREADS
 from rasa.shared.constants import (
     DOCS_URL_RULES,
     DOCS_URL_POLICIES,
@@ -494,6 +499,45 @@ class Prediction(NamedTuple):
 
 
 class SimplePolicyEnsemble(PolicyEnsemble):
+    def __init__(
+        self,
+        policies: List[Policy],
+        action_fingerprints: Optional[Dict] = None,
+        prediction_threads: Optional[int] = None,
+    ) -> None:
+        """Creates a `SimplePolicyEnsemble`.
+
+        Args:
+            policies: The policies of the ensemble.
+            action_fingerprints: The fingerprints of the actions.
+            prediction_threads: Number of threads which are used to run the policies
+                concurrently during prediction. If `None`, the value is read from the
+                environment variable `POLICY_PREDICTION_THREADS`. Policies are run
+                one after another if the value is `1`.
+        """
+        super().__init__(policies, action_fingerprints)
+
+        if prediction_threads is None:
+            prediction_threads = self._prediction_threads_from_environment()
+        self.prediction_threads = prediction_threads
+        self._prediction_executor: Optional[ThreadPoolExecutor] = None
+
+    @staticmethod
+    def _prediction_threads_from_environment() -> int:
+        value = os.environ.get(POLICY_PREDICTION_THREADS, "1")
+        try:
+            prediction_threads = int(value)
+        except ValueError:
+            prediction_threads = 0
+
+        if prediction_threads < 1:
+            raise InvalidPolicyConfig(
+                f"The environment variable '{POLICY_PREDICTION_THREADS}' has to be a "
+                f"positive integer, but it is '{value}'."
+            )
+
+        return prediction_threads
+
     @staticmethod
     def is_not_memo_policy(
         policy_name: Text, max_confidence: Optional[float] = None
@@ -592,12 +636,15 @@ class SimplePolicyEnsemble(PolicyEnsemble):
         ):
             rejected_action_name = tracker.events[-1].action_name
 
-        predictions = {
-            f"policy_{i}_{type(p).__name__}": self._get_prediction(
-                p, tracker, domain, interpreter
-            )
-            for i, p in enumerate(self.policies)
-        }
+        if self.prediction_threads > 1 and len(self.policies) > 1:
+            predictions = self._concurrent_predictions(tracker, domain, interpreter)
+        else:
+            predictions = {
+                f"policy_{i}_{type(p).__name__}": self._get_timed_prediction(
+                    p, f"policy_{i}_{type(p).__name__}", tracker, domain, interpreter
+                )
+                for i, p in enumerate(self.policies)
+            }
 
         if rejected_action_name:
             logger.debug(
@@ -611,6 +658,115 @@ class SimplePolicyEnsemble(PolicyEnsemble):
 
         return self._pick_best_policy(predictions)
 
+    def _concurrent_predictions(
+        self,
+        tracker: DialogueStateTracker,
+        domain: Domain,
+        interpreter: NaturalLanguageInterpreter,
+    ) -> Dict[Text, Prediction]:
+        """Runs all policies concurrently on a thread pool.
+
+        Policies which add events to the tracker while predicting (see
+        `Policy.ADDS_EVENTS_DURING_PREDICTION`) predict on their own copy of the
+        tracker. The events they add are applied to `tracker` in the order of the
+        policies once all predictions are done. All other policies share `tracker`.
+
+        Args:
+            tracker: the :class:`rasa.core.trackers.DialogueStateTracker`
+            domain: the :class:`rasa.shared.core.domain.Domain`
+            interpreter: Interpreter which may be used by the policies to create
+                additional features.
+
+        Returns:
+            The predictions of all policies by policy name.
+        """
+        if self._prediction_executor is None:
+            self._prediction_executor = ThreadPoolExecutor(
+                max_workers=self.prediction_threads,
+                thread_name_prefix="policy_prediction",
+            )
+            # stop the threads once the ensemble is no longer used
+            weakref.finalize(self, self._prediction_executor.shutdown, wait=False)
+
+        # fill the caches of the tracker before the policies read it concurrently
+        tracker.past_states(domain)
+
+        policy_trackers = [
+            copy.deepcopy(tracker) if policy.ADDS_EVENTS_DURING_PREDICTION else tracker
+            for policy in self.policies
+        ]
+        last_events = [
+            policy_tracker.events[-1] if policy_tracker.events else None
+            for policy_tracker in policy_trackers
+        ]
+
+        futures = {
+            f"policy_{i}_{type(p).__name__}": self._prediction_executor.submit(
+                self._get_timed_prediction,
+                p,
+                f"policy_{i}_{type(p).__name__}",
+                policy_tracker,
+                domain,
+                interpreter,
+            )
+            for (i, p), policy_tracker in zip(enumerate(self.policies), policy_trackers)
+        }
+        predictions = {
+            policy_name: future.result() for policy_name, future in futures.items()
+        }
+
+        for policy_tracker, last_event in zip(policy_trackers, last_events):
+            if policy_tracker is tracker:
+                continue
+
+            for event in self._events_added_after(policy_tracker, last_event):
+                tracker.update(event)
+
+        return predictions
+
+    @staticmethod
+    def _events_added_after(
+        tracker: DialogueStateTracker, last_event: Optional[Event]
+    ) -> List[Event]:
+        """Returns the events which were added to `tracker` after `last_event`.
+
+        Args:
+            tracker: the :class:`rasa.core.trackers.DialogueStateTracker`
+            last_event: The last event of `tracker` before events were added.
+
+        Returns:
+            The added events.
+        """
+        events = list(tracker.events)
+        if last_event is None:
+            return events
+
+        # the index of `last_event` changes if the tracker's event history is
+        # limited and older events were dropped
+        for index in reversed(range(len(events))):
+            if events[index] is last_event:
+                return events[index + 1 :]
+
+        return events
+
+    @classmethod
+    def _get_timed_prediction(
+        cls,
+        policy: Policy,
+        policy_name: Text,
+        tracker: DialogueStateTracker,
+        domain: Domain,
+        interpreter: NaturalLanguageInterpreter,
+    ) -> Prediction:
+        start = time.perf_counter()
+        prediction = cls._get_prediction(policy, tracker, domain, interpreter)
+        logger.debug(
+            f"Prediction of {policy_name} took "
+            f"{time.perf_counter() - start:.4f} seconds."
+        )
+
+        return prediction
+
     @staticmethod
     def _get_prediction(
         policy: Policy,
@@ -31,6 +31,9 @@ class FormPolicy(MemoizationPolicy):
 
     ENABLE_FEATURE_STRING_COMPRESSION = True
 
+    # interrupts the active form by adding `LoopInterrupted` to the tracker
+    ADDS_EVENTS_DURING_PREDICTION = True
+
     def __init__(
         self,
         featurizer: Optional[TrackerFeaturizer] = None,
@@ -165,4 +168,4 @@ class FormPolicy(MemoizationPolicy):
         return result
 
     def _metadata(self) -> Dict[Text, Any]:
-        return {"priority": self.priority, "lookup": self.lookup}
+        return {"priority": self.priority, "lookup": self._lookup_for_persistence()}
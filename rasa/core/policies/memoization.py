@@ -5,7 +5,7 @@ import json
 import logging
 
 from tqdm import tqdm
-from typing import Optional, Any, Dict, List, Text
+from typing import Optional, Any, Dict, List, Text, Tuple, FrozenSet, Hashable
 
 import rasa.utils.io
 import rasa.shared.utils.io
@@ -29,6 +29,31 @@ logger = logging.getLogger(__name__)
 MAX_HISTORY_NOT_SET = -1
 OLD_DEFAULT_MAX_HISTORY = 5
 
+# keys of the persisted lookup
+LOOKUP_STATES = "states"
+LOOKUP_FEATURE_KEYS = "feature_keys"
+
+# hashable representation of a list of states which is used as key of the lookup
+FeatureKey = Tuple[FrozenSet[Tuple[Text, Hashable]], ...]
+
+
+def _freeze(value: Any) -> Hashable:
+    """Converts (nested) dictionaries and lists to hashable frozensets and tuples."""
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(sub_value)) for key, sub_value in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(sub_value) for sub_value in value)
+    return value
+
+
+def _unfreeze(value: Hashable) -> Any:
+    """Reverts `_freeze` so that the value can be dumped as json."""
+    if isinstance(value, frozenset):
+        return {key: _unfreeze(sub_value) for key, sub_value in value}
+    if isinstance(value, tuple):
+        return [_unfreeze(sub_value) for sub_value in value]
+    return value
+
 
 class MemoizationPolicy(Policy):
     """The policy that remembers exact examples of
@@ -100,7 +125,61 @@ class MemoizationPolicy(Policy):
         super().__init__(featurizer, priority)
 
         self.max_history = self.featurizer.max_history
-        self.lookup = lookup if lookup is not None else {}
+        self.lookup = self._lookup_from_persisted(lookup) if lookup is not None else {}
+
+        # policies which were trained with previous versions use json strings as keys
+        self._uses_legacy_feature_keys = bool(self.lookup) and all(
+            isinstance(key, str) and isinstance(action, str)
+            for key, action in self.lookup.items()
+        )
+
+    @staticmethod
+    def _lookup_from_persisted(lookup: Dict) -> Dict:
+        """Converts a lookup which was created by `_lookup_for_persistence`.
+
+        Lookups in any other format are returned as they are.
+
+        Args:
+            lookup: the persisted lookup
+
+        Returns:
+            a lookup which uses feature keys
+        """
+        if set(lookup.keys()) != {LOOKUP_STATES, LOOKUP_FEATURE_KEYS}:
+            return lookup
+
+        frozen_states = [_freeze(state) for state in lookup[LOOKUP_STATES]]
+        return {
+            tuple(frozen_states[index] for index in state_indices): action
+            for state_indices, action in lookup[LOOKUP_FEATURE_KEYS]
+        }
+
+    def _lookup_for_persistence(self) -> Dict[Text, Any]:
+        """Converts the lookup to a compact format which can be dumped as json.
+
+        Every distinct state is only stored once. The feature keys then refer to the
+        indices of their states.
+
+        Returns:
+            the lookup in its persisted format
+        """
+        if self._uses_legacy_feature_keys:
+            return self.lookup
+
+        states = []
+        state_indices = {}
+        feature_keys = []
+        for feature_key, action in self.lookup.items():
+            for frozen_state in feature_key:
+                if frozen_state not in state_indices:
+                    state_indices[frozen_state] = len(states)
+                    states.append(_unfreeze(frozen_state))
+
+            feature_keys.append(
+                [[state_indices[frozen_state] for frozen_state in feature_key], action]
+            )
+
+        return {LOOKUP_STATES: states, LOOKUP_FEATURE_KEYS: feature_keys}
 
     def _create_lookup_from_states(
         self,
@@ -138,7 +217,7 @@ class MemoizationPolicy(Policy):
             action = actions[0]
 
             feature_key = self._create_feature_key(states)
-            if not feature_key:
+            if feature_key is None:
                 continue
 
             if feature_key not in ambiguous_feature_keys:
@@ -154,7 +233,12 @@ class MemoizationPolicy(Policy):
 
         return lookup
 
-    def _create_feature_key(self, states: List[State]) -> Text:
+    def _create_feature_key(self, states: List[State]) -> Optional[FeatureKey]:
+        # the key is hashable and doesn't depend on the order of the state dicts
+        return tuple(_freeze(state) for state in states)
+
+    def _create_legacy_feature_key(self, states: List[State]) -> Text:
+        # feature keys of policies which were trained with previous versions:
         # we sort keys to make sure that the same states
         # represented as dictionaries have the same json strings
         # quotes are removed for aesthetic reasons
@@ -189,9 +273,13 @@ class MemoizationPolicy(Policy):
         self.lookup = self._create_lookup_from_states(
             trackers_as_states, trackers_as_actions
         )
+        self._uses_legacy_feature_keys = False
         logger.debug(f"Memorized {len(self.lookup)} unique examples.")
 
     def _recall_states(self, states: List[State]) -> Optional[Text]:
+        if self._uses_legacy_feature_keys:
+            return self.lookup.get(self._create_legacy_feature_key(states))
+
         return self.lookup.get(self._create_feature_key(states))
 
     def recall(
@@ -240,7 +328,7 @@ class MemoizationPolicy(Policy):
         return {
             "priority": self.priority,
             "max_history": self.max_history,
-            "lookup": self.lookup,
+            "lookup": self._lookup_for_persistence(),
         }
 
     @classmethod
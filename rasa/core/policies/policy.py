@@ -77,6 +77,11 @@ class SupportedData(Enum):
 
 
 class Policy:
+    # whether the policy adds events to the tracker while predicting the next action,
+    # if so it predicts on its own copy of the tracker when the policies of an
+    # ensemble are run concurrently
+    ADDS_EVENTS_DURING_PREDICTION = False
+
     @staticmethod
     def supported_data() -> SupportedData:
         """The type of data supported by this policy.
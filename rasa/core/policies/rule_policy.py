@@ -1,5 +1,16 @@
 import logging
-from typing import List, Dict, Text, Optional, Any, Set, TYPE_CHECKING, Union
+from collections import defaultdict
+from typing import (
+    List,
+    Dict,
+    Text,
+    Optional,
+    Any,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 
 from tqdm import tqdm
 import numpy as np
@@ -71,12 +82,161 @@ class InvalidRule(RasaException):
         )
 
 
+def _is_rule_turn_applicable(
+    reversed_rule_states: List[State], turn_index: int, conversation_state: State
+) -> bool:
+    """Check if the rule turn at `turn_index` is satisfied by the conversation state.
+
+    Args:
+        reversed_rule_states: The states of the rule in reversed order.
+        turn_index: The index of the turn going back in time.
+        conversation_state: The conversation state at this turn.
+
+    Returns:
+        `True` if the rule is applicable at this turn.
+    """
+    return bool(
+        # rule is shorter than current turn index
+        turn_index >= len(reversed_rule_states)
+        # current rule and state turns are empty
+        or (not reversed_rule_states[turn_index] and not conversation_state)
+        # check that current rule turn features are present in current state turn
+        or (
+            reversed_rule_states[turn_index]
+            and conversation_state
+            and RulePolicy._does_rule_match_state(
+                reversed_rule_states[turn_index], conversation_state
+            )
+        )
+    )
+
+
+class RuleIndex:
+    """Rules of a lookup which are parsed once so that they can be matched quickly.
+
+    Every rule is indexed by the least common feature which its last turn requires.
+    Only the rules indexed by a feature of the last conversation turn (and the rules
+    whose last turn doesn't require any feature) are then checked against the
+    conversation going backwards in time.
+    """
+
+    def __init__(self, lookup: Dict[Text, Text]) -> None:
+        """Parses the rules and builds the index.
+
+        Args:
+            lookup: Lookup which maps rule keys to the predictions of the rules.
+        """
+        self.lookup = lookup
+        self.number_of_rules = len(lookup)
+
+        self.reversed_rule_states: Dict[Text, List[State]] = {
+            rule_key: [
+                self._state_with_tuples(state)
+                for state in reversed(RulePolicy._rule_key_to_state(rule_key))
+            ]
+            for rule_key in lookup.keys()
+        }
+
+        features_of_last_turns = {
+            rule_key: self._required_features(rule_states[0] if rule_states else {})
+            for rule_key, rule_states in self.reversed_rule_states.items()
+        }
+        feature_counts = defaultdict(int)
+        for features in features_of_last_turns.values():
+            for feature in features:
+                feature_counts[feature] += 1
+
+        self._rules_by_feature: Dict[Tuple[Text, Text, Any], List[Text]] = defaultdict(
+            list
+        )
+        self._rules_without_features: List[Text] = []
+        for rule_key, features in features_of_last_turns.items():
+            if features:
+                least_common_feature = min(features, key=feature_counts.get)
+                self._rules_by_feature[least_common_feature].append(rule_key)
+            else:
+                self._rules_without_features.append(rule_key)
+
+    def is_outdated(self, lookup: Dict[Text, Text]) -> bool:
+        """Checks whether the index was built for a different version of `lookup`."""
+        return lookup is not self.lookup or len(lookup) != self.number_of_rules
+
+    @staticmethod
+    def _state_with_tuples(state: State) -> State:
+        # json dumps and loads tuples as lists, so we need to convert them back
+        return {
+            state_type: {
+                key: tuple(value) if isinstance(value, list) else value
+                for key, value in sub_state.items()
+            }
+            for state_type, sub_state in state.items()
+        }
+
+    @staticmethod
+    def _is_hashable(value: Any) -> bool:
+        try:
+            hash(value)
+        except TypeError:
+            return False
+        return True
+
+    @classmethod
+    def _required_features(cls, rule_state: State) -> List[Tuple[Text, Text, Any]]:
+        """Returns the features which have to be present in a conversation state."""
+        return [
+            (state_type, key, value)
+            for state_type, sub_state in rule_state.items()
+            for key, value in sub_state.items()
+            if value and value != SHOULD_NOT_BE_SET and cls._is_hashable(value)
+        ]
+
+    def _candidates(self, conversation_state: State) -> List[Text]:
+        candidates = list(self._rules_without_features)
+        for state_type, sub_state in conversation_state.items():
+            for key, value in sub_state.items():
+                if self._is_hashable(value):
+                    candidates.extend(
+                        self._rules_by_feature.get((state_type, key, value), [])
+                    )
+        return candidates
+
+    def matching_rules(self, states: List[State]) -> Set[Text]:
+        """Finds the rules which are applicable to the conversation.
+
+        Args:
+            states: The conversation states.
+
+        Returns:
+            The keys of all applicable rules.
+        """
+        if not states:
+            return set(self.lookup.keys())
+
+        reversed_states = list(reversed(states))
+        matching_rules = set()
+        for rule_key in self._candidates(reversed_states[0]):
+            reversed_rule_states = self.reversed_rule_states[rule_key]
+            if all(
+                _is_rule_turn_applicable(reversed_rule_states, turn_index, state)
+                # turns which go back further than the rule are always applicable
+                for turn_index, state in enumerate(
+                    reversed_states[: len(reversed_rule_states)]
+                )
+            ):
+                matching_rules.add(rule_key)
+
+        return matching_rules
+
+
 class RulePolicy(MemoizationPolicy):
     """Policy which handles all the rules"""
 
     # rules use explicit json strings
     ENABLE_FEATURE_STRING_COMPRESSION = False
 
+    # interrupts the active loop by adding `LoopInterrupted` to the tracker
+    ADDS_EVENTS_DURING_PREDICTION = True
+
     # number of user inputs that is allowed in case rules are restricted
     ALLOWED_NUMBER_OF_USER_INPUTS = 1
 
@@ -128,6 +288,9 @@ class RulePolicy(MemoizationPolicy):
             featurizer=featurizer, priority=priority, max_history=None, lookup=lookup
         )
 
+        self._rule_indices: Dict[Text, RuleIndex] = {}
+        self._build_rule_indices()
+
     @classmethod
     def validate_against_domain(
         cls, ensemble: Optional["PolicyEnsemble"], domain: Optional[Domain]
@@ -427,6 +590,8 @@ class RulePolicy(MemoizationPolicy):
             # it allows us to directly test `predict_action_probabilities` method
             self._find_contradicting_rules(training_trackers, domain, interpreter)
 
+        self._build_rule_indices()
+
         logger.debug(f"Memorized '{len(self.lookup[RULES])}' unique rules.")
 
     @staticmethod
@@ -470,33 +635,35 @@ class RulePolicy(MemoizationPolicy):
         # turn_index goes back in time
         reversed_rule_states = list(reversed(self._rule_key_to_state(rule_key)))
 
-        return bool(
-            # rule is shorter than current turn index
-            turn_index >= len(reversed_rule_states)
-            # current rule and state turns are empty
-            or (not reversed_rule_states[turn_index] and not conversation_state)
-            # check that current rule turn features are present in current state turn
-            or (
-                reversed_rule_states[turn_index]
-                and conversation_state
-                and self._does_rule_match_state(
-                    reversed_rule_states[turn_index], conversation_state
-                )
-            )
+        return _is_rule_turn_applicable(
+            reversed_rule_states, turn_index, conversation_state
         )
 
+    def _build_rule_indices(self) -> None:
+        """Parses the rules of all lookups once so that they can be matched quickly."""
+        for lookup_name in [RULES, RULES_FOR_LOOP_UNHAPPY_PATH]:
+            if lookup_name in self.lookup:
+                self._rule_index(self.lookup[lookup_name])
+
+    def _rule_index(self, lookup: Dict[Text, Text]) -> RuleIndex:
+        for lookup_name, rule_lookup in self.lookup.items():
+            if rule_lookup is lookup:
+                break
+        else:
+            # the lookup is not part of the policy's lookups
+            return RuleIndex(lookup)
+
+        rule_index = self._rule_indices.get(lookup_name)
+        if rule_index is None or rule_index.is_outdated(lookup):
+            rule_index = RuleIndex(lookup)
+            self._rule_indices[lookup_name] = rule_index
+
+        return rule_index
+
     def _get_possible_keys(
         self, lookup: Dict[Text, Text], states: List[State]
     ) -> Set[Text]:
-        possible_keys = set(lookup.keys())
-        for i, state in enumerate(reversed(states)):
-            # find rule keys that correspond to current state
-            possible_keys = set(
-                filter(
-                    lambda _key: self._is_rule_applicable(_key, i, state), possible_keys
-                )
-            )
-        return possible_keys
+        return self._rule_index(lookup).matching_rules(states)
 
     @staticmethod
     def _find_action_from_default_actions(
@@ -253,11 +253,31 @@ class MessageProcessor:
         nlg: NaturalLanguageGenerator,
         policy: Text,
         confidence: float,
+        tracker: Optional[DialogueStateTracker] = None,
     ) -> Optional[DialogueStateTracker]:
+        """Run an action on the tracker of `sender_id` and save the tracker.
+
+        Args:
+            sender_id: Conversation ID for which to run the action.
+            action_name: Name of the action which should be run.
+            output_channel: Output channel for potential utterances of the action.
+            nlg: Natural language generator for the action's responses.
+            policy: Name of the policy which predicted the action.
+            confidence: Confidence of the prediction.
+            tracker: Tracker of the conversation if it was already retrieved while
+                handling the current request. It's fetched from the tracker store
+                otherwise.
+
+        Returns:
+            The tracker of the conversation after running the action.
+        """
 
         # we have a Tracker instance for each user
         # which maintains conversation state
-        tracker = await self.get_tracker_with_session_start(sender_id, output_channel)
+        if tracker is None:
+            tracker = await self.get_tracker_with_session_start(
+                sender_id, output_channel
+            )
         if tracker:
             action = self._get_action(action_name)
             await self._run_action(
@@ -489,6 +509,44 @@ class MessageProcessor:
 
         return parse_data
 
+    async def parse_messages(
+        self, messages: List[UserMessage]
+    ) -> List[Dict[Text, Any]]:
+        """Interprete several messages at once using the NLU interpreter.
+
+        Messages which are not short-cut with an intent payload are passed to the
+        interpreter in a single batch.
+
+        Arguments:
+            messages: Messages to parse
+
+        Returns:
+            Parsed data extracted from the messages in the same order as `messages`.
+        """
+        texts = [
+            self.message_preprocessor(message.text)
+            if self.message_preprocessor is not None
+            else message.text
+            for message in messages
+        ]
+
+        parse_results: List[Optional[Dict[Text, Any]]] = [None] * len(texts)
+        texts_to_interpret = []
+        for index, text in enumerate(texts):
+            if text.startswith(INTENT_MESSAGE_PREFIX):
+                parse_results[index] = await RegexInterpreter().parse(text)
+            else:
+                texts_to_interpret.append(text)
+
+        interpreted = iter(await self.interpreter.parse_batch(texts_to_interpret))
+        for index, parse_data in enumerate(parse_results):
+            if parse_data is None:
+                parse_data = next(interpreted)
+                parse_results[index] = parse_data
+            self._check_for_unseen_features(parse_data)
+
+        return parse_results
+
     async def _handle_message_with_tracker(
         self, message: UserMessage, tracker: DialogueStateTracker
     ) -> None:
@@ -17,11 +17,13 @@ from rasa.core import agent, channels, constants
 from rasa.core.agent import Agent
 from rasa.core.brokers.broker import EventBroker
 from rasa.core.channels import console
+from rasa.core.channels.callback import CallbackInput
 from rasa.core.channels.channel import InputChannel
 import rasa.core.interpreter
 from rasa.core.lock_store import LockStore
 from rasa.core.tracker_store import TrackerStore
 from rasa.core.utils import AvailableEndpoints
+from rasa.utils.endpoints import EndpointConfig
 import rasa.shared.utils.io
 from sanic import Sanic
 from asyncio import AbstractEventLoop
@@ -216,6 +218,11 @@ def serve_application(
     )
 
     app.register_listener(clear_model_files, "after_server_stop")
+    app.register_listener(close_event_broker, "after_server_stop")
+    app.register_listener(
+        partial(close_http_sessions, pool_http_sessions(endpoints, input_channels)),
+        "after_server_stop",
+    )
 
     rasa.utils.common.update_sanic_log_level(log_file)
     app.run(
@@ -227,6 +234,57 @@ def serve_application(
     )
 
 
+# noinspection PyUnusedLocal
+async def close_event_broker(app: Sanic, loop: AbstractEventLoop) -> None:
+    """Close the event broker of the agent, e.g. to send buffered events.
+
+    Used to be scheduled on server stop
+    (hence the `app` and `loop` arguments)."""
+
+    event_broker = app.agent.tracker_store.event_broker if app.agent else None
+    if event_broker:
+        event_broker.close()
+
+
+def pool_http_sessions(
+    endpoints: Optional[AvailableEndpoints], input_channels: List["InputChannel"]
+) -> List[EndpointConfig]:
+    """Let the HTTP endpoints owned by the server reuse their connections.
+
+    These are the action server, the NLG server and the callback channel.
+
+    Returns:
+        The endpoints whose sessions have to be closed when the server stops.
+    """
+
+    pooled_endpoints = [
+        channel.callback_endpoint
+        for channel in input_channels
+        if isinstance(channel, CallbackInput)
+    ]
+    if endpoints:
+        pooled_endpoints += [endpoints.action, endpoints.nlg]
+
+    pooled_endpoints = [endpoint for endpoint in pooled_endpoints if endpoint]
+    for endpoint in pooled_endpoints:
+        endpoint.enable_session_pooling()
+
+    return pooled_endpoints
+
+
+# noinspection PyUnusedLocal
+async def close_http_sessions(
+    endpoints: List[EndpointConfig], app: Sanic, loop: AbstractEventLoop
+) -> None:
+    """Close the pooled HTTP sessions of the endpoints owned by the server.
+
+    Used to be scheduled on server stop
+    (hence the `app` and `loop` arguments)."""
+
+    for endpoint in endpoints:
+        await endpoint.close()
+
+
 # noinspection PyUnusedLocal
 async def load_agent_on_start(
     model_path: Text,
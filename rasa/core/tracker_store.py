@@ -4,6 +4,7 @@ import json
 import logging
 import os
 import pickle
+from collections import OrderedDict
 from datetime import datetime, timezone
 
 from time import sleep
@@ -14,8 +15,10 @@ from typing import (
     Iterable,
     Iterator,
     List,
+    NamedTuple,
     Optional,
     Text,
+    Tuple,
     Union,
     TYPE_CHECKING,
 )
@@ -34,7 +37,7 @@ from rasa.core.constants import (
 )
 from rasa.shared.core.conversation import Dialogue
 from rasa.shared.core.domain import Domain
-from rasa.shared.core.events import SessionStarted
+from rasa.shared.core.events import Event, SessionStarted
 from rasa.shared.core.trackers import (
     ActionExecuted,
     DialogueStateTracker,
@@ -60,6 +63,14 @@ logger = logging.getLogger(__name__)
 POSTGRESQL_DEFAULT_MAX_OVERFLOW = 100
 POSTGRESQL_DEFAULT_POOL_SIZE = 50
 
+# key prefixes used by the `RedisTrackerStore` when it stores event logs
+REDIS_EVENT_LOG_KEY_PREFIX = "tracker_events:"
+REDIS_SESSION_START_KEY_PREFIX = "tracker_session_start:"
+
+# maximum number of conversations for which a tracker store remembers the number
+# of stored events
+MAX_CACHED_EVENT_COUNTS = 10000
+
 
 class TrackerStore:
     """Class to hold all of the TrackerStore classes"""
@@ -87,6 +98,10 @@ class TrackerStore:
         self.load_events_from_previous_conversation_sessions = (
             retrieve_events_from_previous_conversation_sessions
         )
+        # number of stored events per conversation as seen by the last `retrieve`
+        # or `save`, used to find the new events of a tracker without reading the
+        # stored tracker again
+        self._stored_event_counts: "OrderedDict[Text, int]" = OrderedDict()
 
     @staticmethod
     def create(
@@ -168,16 +183,41 @@ class TrackerStore:
         """Streams events to a message broker"""
         offset = self.number_of_existing_events(tracker.sender_id)
         events = tracker.events
+        bodies = []
         for event in list(itertools.islice(events, offset, len(events))):
             body = {"sender_id": tracker.sender_id}
             body.update(event.as_dict())
-            self.event_broker.publish(body)
+            bodies.append(body)
+
+        if bodies:
+            self.event_broker.publish_many(bodies)
 
     def number_of_existing_events(self, sender_id: Text) -> int:
-        """Return number of stored events for a given sender id."""
+        """Return number of stored events for a given sender id.
+
+        The stored tracker is only retrieved if the number of events isn't known
+        from a previous `retrieve` or `save` of the conversation.
+        """
+        number_of_events = self._stored_event_counts.get(sender_id)
+        if number_of_events is not None:
+            return number_of_events
+
         old_tracker = self.retrieve(sender_id)
         return len(old_tracker.events) if old_tracker else 0
 
+    def _cache_stored_event_count(self, sender_id: Text, count: int) -> None:
+        """Remember the number of stored events of a conversation.
+
+        Args:
+            sender_id: Conversation ID.
+            count: Number of events of the conversation's tracker which are stored.
+        """
+        self._stored_event_counts[sender_id] = count
+        self._stored_event_counts.move_to_end(sender_id)
+
+        if len(self._stored_event_counts) > MAX_CACHED_EVENT_COUNTS:
+            self._stored_event_counts.popitem(last=False)
+
     def keys(self) -> Iterable[Text]:
         """Returns the set of values for the tracker store's primary key"""
         raise NotImplementedError()
@@ -238,6 +278,7 @@ class InMemoryTrackerStore(TrackerStore):
             self.stream_events(tracker)
         serialised = InMemoryTrackerStore.serialise_tracker(tracker)
         self.store[tracker.sender_id] = serialised
+        self._cache_stored_event_count(tracker.sender_id, len(tracker.events))
 
     def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """
@@ -249,16 +290,34 @@ class InMemoryTrackerStore(TrackerStore):
         """
         if sender_id in self.store:
             logger.debug(f"Recreating tracker for id '{sender_id}'")
-            return self.deserialise_tracker(sender_id, self.store[sender_id])
+            tracker = self.deserialise_tracker(sender_id, self.store[sender_id])
         else:
             logger.debug(f"Creating a new tracker for id '{sender_id}'.")
-            return None
+            tracker = None
+
+        self._cache_stored_event_count(sender_id, len(tracker.events) if tracker else 0)
+        return tracker
 
     def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the Tracker Store in memory"""
         return self.store.keys()
 
 
+class EventLogState(NamedTuple):
+    """State of a conversation's event log as seen by the last `retrieve` or `save`.
+
+    Attributes:
+        length: Number of events in the event log.
+        number_of_tracker_events: Number of events of the last retrieved or saved
+            tracker which are part of the event log.
+        last_event: Type name and timestamp of the last event of the event log.
+    """
+
+    length: int
+    number_of_tracker_events: int
+    last_event: Optional[Tuple[Text, float]]
+
+
 class RedisTrackerStore(TrackerStore):
     """Stores conversation history in Redis"""
 
@@ -272,15 +331,44 @@ class RedisTrackerStore(TrackerStore):
         event_broker: Optional[EventBroker] = None,
         record_exp: Optional[float] = None,
         use_ssl: bool = False,
+        use_event_log: bool = False,
     ):
+        """Create a `RedisTrackerStore`.
+
+        Args:
+            domain: Domain associated with this tracker store.
+            host: Host of the Redis instance.
+            port: Port of the Redis instance.
+            db: Number of the Redis database.
+            password: Password used for authentication.
+            event_broker: An event broker used to publish events.
+            record_exp: Record expiry in seconds.
+            use_ssl: Whether or not to use SSL for transit encryption.
+            use_event_log: If `True`, each conversation is stored as an append-only
+                list of events and `save` only pushes the events which were added
+                since the last `save`. Otherwise the whole serialised tracker is
+                written on every `save`.
+        """
         import redis
 
         self.red = redis.StrictRedis(
             host=host, port=port, db=db, password=password, ssl=use_ssl
         )
         self.record_exp = record_exp
+        self.use_event_log = use_event_log
+        # event log state per conversation, used to find the new events of a
+        # tracker without reading the event log again
+        self._event_log_states: "OrderedDict[Text, EventLogState]" = OrderedDict()
         super().__init__(domain, event_broker)
 
+    @staticmethod
+    def _event_log_key(sender_id: Text) -> Text:
+        return f"{REDIS_EVENT_LOG_KEY_PREFIX}{sender_id}"
+
+    @staticmethod
+    def _session_start_key(sender_id: Text) -> Text:
+        return f"{REDIS_SESSION_START_KEY_PREFIX}{sender_id}"
+
     def save(self, tracker, timeout=None):
         """Saves the current conversation state"""
         if self.event_broker:
@@ -289,8 +377,178 @@ class RedisTrackerStore(TrackerStore):
         if not timeout and self.record_exp:
             timeout = self.record_exp
 
-        serialised_tracker = self.serialise_tracker(tracker)
-        self.red.set(tracker.sender_id, serialised_tracker, ex=timeout)
+        if self.use_event_log:
+            self._append_to_event_log(tracker, timeout)
+        else:
+            serialised_tracker = self.serialise_tracker(tracker)
+            self.red.set(tracker.sender_id, serialised_tracker, ex=timeout)
+
+        self._cache_stored_event_count(tracker.sender_id, len(tracker.events))
+
+    def _cache_event_log_state(self, sender_id: Text, state: EventLogState) -> None:
+        self._event_log_states[sender_id] = state
+        self._event_log_states.move_to_end(sender_id)
+
+        if len(self._event_log_states) > MAX_CACHED_EVENT_COUNTS:
+            self._event_log_states.popitem(last=False)
+
+    def _event_log_state(self, sender_id: Text) -> EventLogState:
+        """Return the state of the event log, reading it from Redis if not cached.
+
+        Args:
+            sender_id: Conversation ID of the event log.
+
+        Returns:
+            The state of the event log.
+        """
+        if sender_id in self._event_log_states:
+            return self._event_log_states[sender_id]
+
+        pipeline = self.red.pipeline()
+        pipeline.llen(self._event_log_key(sender_id))
+        pipeline.get(self._session_start_key(sender_id))
+        pipeline.lindex(self._event_log_key(sender_id), -1)
+        length, session_start, last_event = pipeline.execute()
+
+        # trackers retrieved from the event log only contain the events of the
+        # latest session unless all events are loaded
+        number_of_tracker_events = length
+        if not self.load_events_from_previous_conversation_sessions:
+            number_of_tracker_events -= int(session_start or 0)
+
+        return EventLogState(
+            length,
+            number_of_tracker_events,
+            self._stored_event_key(json.loads(last_event)) if last_event else None,
+        )
+
+    @staticmethod
+    def _stored_event_key(event: Dict[Text, Any]) -> Tuple[Text, float]:
+        return event["event"], event["timestamp"]
+
+    @staticmethod
+    def _event_key(event: Event) -> Tuple[Text, float]:
+        return event.type_name, event.timestamp
+
+    def _index_of_unstored_events(
+        self, tracker: DialogueStateTracker, state: EventLogState
+    ) -> Optional[int]:
+        """Find the first event of the tracker which isn't in the event log yet.
+
+        Args:
+            tracker: Tracker to save.
+            state: State of the tracker's event log.
+
+        Returns:
+            Index of the first event of the tracker which has to be appended to the
+            event log or `None` if the tracker doesn't continue the event log (e.g.
+            because its events were replaced).
+        """
+        if state.length == 0:
+            return 0
+
+        events = tracker.events
+        stored = state.number_of_tracker_events
+        if 0 < stored <= len(events) and (
+            self._event_key(events[stored - 1]) == state.last_event
+        ):
+            return stored
+
+        if events.maxlen is not None and len(events) == events.maxlen:
+            # the oldest events were dropped from the tracker to make room for the
+            # new ones
+            for index in reversed(range(len(events))):
+                if self._event_key(events[index]) == state.last_event:
+                    return index + 1
+
+        return None
+
+    def _append_to_event_log(
+        self, tracker: DialogueStateTracker, timeout: Optional[float] = None
+    ) -> None:
+        """Push the events which aren't stored yet to the conversation's event log.
+
+        If the tracker doesn't continue the event log, the event log is replaced by
+        the events of the tracker.
+
+        Args:
+            tracker: Tracker to save.
+            timeout: Expiry of the event log in seconds.
+        """
+        event_log_key = self._event_log_key(tracker.sender_id)
+        session_start_key = self._session_start_key(tracker.sender_id)
+        state = self._event_log_state(tracker.sender_id)
+
+        pipeline = self.red.pipeline()
+
+        offset = self._index_of_unstored_events(tracker, state)
+        length = state.length
+        if offset is None:
+            logger.debug(
+                f"Replacing the stored events of conversation '{tracker.sender_id}' "
+                f"since its tracker doesn't continue them."
+            )
+            pipeline.delete(event_log_key, session_start_key)
+            offset = length = 0
+
+        new_events = list(itertools.islice(tracker.events, offset, None))
+        if new_events:
+            pipeline.rpush(
+                event_log_key, *[json.dumps(event.as_dict()) for event in new_events]
+            )
+
+            for index in reversed(range(len(new_events))):
+                if isinstance(new_events[index], SessionStarted):
+                    pipeline.set(session_start_key, length + index)
+                    break
+
+        if timeout:
+            pipeline.expire(event_log_key, int(timeout))
+            pipeline.expire(session_start_key, int(timeout))
+
+        pipeline.execute()
+
+        self._cache_event_log_state(
+            tracker.sender_id,
+            EventLogState(
+                length + len(new_events),
+                len(tracker.events),
+                self._event_key(tracker.events[-1]) if tracker.events else None,
+            ),
+        )
+
+    def _retrieve_from_event_log(
+        self, sender_id: Text
+    ) -> Optional[DialogueStateTracker]:
+        """Recreate a tracker from the conversation's event log.
+
+        Args:
+            sender_id: Conversation ID of the event log.
+
+        Returns:
+            Tracker with the events since the latest `SessionStarted` event (or all
+            events if configured so) or `None` if no events are stored.
+        """
+        start = 0
+        if not self.load_events_from_previous_conversation_sessions:
+            start = int(self.red.get(self._session_start_key(sender_id)) or 0)
+
+        stored_events = self.red.lrange(self._event_log_key(sender_id), start, -1)
+        events = [json.loads(event) for event in stored_events]
+
+        self._cache_event_log_state(
+            sender_id,
+            EventLogState(
+                start + len(events),
+                len(events),
+                self._stored_event_key(events[-1]) if events else None,
+            ),
+        )
+
+        if not events:
+            return None
+
+        return DialogueStateTracker.from_dict(sender_id, events, self.domain.slots)
 
     def retrieve(self, sender_id):
         """
@@ -300,15 +558,28 @@ class RedisTrackerStore(TrackerStore):
         Returns:
             DialogueStateTracker
         """
-        stored = self.red.get(sender_id)
-        if stored is not None:
-            return self.deserialise_tracker(sender_id, stored)
+        if self.use_event_log:
+            tracker = self._retrieve_from_event_log(sender_id)
         else:
-            return None
+            stored = self.red.get(sender_id)
+            tracker = (
+                self.deserialise_tracker(sender_id, stored)
+                if stored is not None
+                else None
+            )
+
+        self._cache_stored_event_count(sender_id, len(tracker.events) if tracker else 0)
+        return tracker
 
     def keys(self) -> Iterable[Text]:
         """Returns keys of the Redis Tracker Store"""
-        return self.red.keys()
+        if self.use_event_log:
+            return [
+                key.decode()[len(REDIS_EVENT_LOG_KEY_PREFIX) :]
+                for key in self.red.keys(f"{REDIS_EVENT_LOG_KEY_PREFIX}*")
+            ]
+
+        return [key.decode() for key in self.red.keys()]
 
 
 class DynamoTrackerStore(TrackerStore):
@@ -371,6 +642,7 @@ class DynamoTrackerStore(TrackerStore):
         if self.event_broker:
             self.stream_events(tracker)
         self.db.put_item(Item=self.serialise_tracker(tracker))
+        self._cache_stored_event_count(tracker.sender_id, len(tracker.events))
 
     def serialise_tracker(self, tracker: "DialogueStateTracker") -> Dict:
         """Serializes the tracker, returns object with decimal types"""
@@ -395,6 +667,7 @@ class DynamoTrackerStore(TrackerStore):
         )["Items"]
 
         if not dialogues:
+            self._cache_stored_event_count(sender_id, 0)
             return None
 
         events = dialogues[0].get("events", [])
@@ -402,6 +675,7 @@ class DynamoTrackerStore(TrackerStore):
         # `float`s are stored as `Decimal` objects - we need to convert them back
         events_with_floats = core_utils.replace_decimals_with_floats(events)
 
+        self._cache_stored_event_count(sender_id, len(events_with_floats))
         return DialogueStateTracker.from_dict(
             sender_id, events_with_floats, self.domain.slots
         )
@@ -486,10 +760,14 @@ class MongoTrackerStore(TrackerStore):
             },
             upsert=True,
         )
+        self._cache_stored_event_count(tracker.sender_id, len(tracker.events))
 
     def _additional_events(self, tracker: DialogueStateTracker) -> Iterator:
         """Return events from the tracker which aren't currently stored.
 
+        The stored conversation is only read if the number of stored events isn't
+        known from a previous `retrieve` or `save` of the conversation.
+
         Args:
             tracker: Tracker to inspect.
 
@@ -498,11 +776,15 @@ class MongoTrackerStore(TrackerStore):
 
         """
 
-        stored = self.conversations.find_one({"sender_id": tracker.sender_id}) or {}
-        all_events = self._events_from_serialized_tracker(stored)
-        number_events_since_last_session = len(
-            self._events_since_last_session_start(all_events)
+        number_events_since_last_session = self._stored_event_counts.get(
+            tracker.sender_id
         )
+        if number_events_since_last_session is None:
+            stored = self.conversations.find_one({"sender_id": tracker.sender_id}) or {}
+            all_events = self._events_from_serialized_tracker(stored)
+            number_events_since_last_session = len(
+                self._events_since_last_session_start(all_events)
+            )
 
         return itertools.islice(
             tracker.events, number_events_since_last_session, len(tracker.events)
@@ -555,12 +837,14 @@ class MongoTrackerStore(TrackerStore):
             )
 
         if not stored:
+            self._cache_stored_event_count(sender_id, 0)
             return
 
         events = self._events_from_serialized_tracker(stored)
         if not self.load_events_from_previous_conversation_sessions:
             events = self._events_since_last_session_start(events)
 
+        self._cache_stored_event_count(sender_id, len(events))
         return DialogueStateTracker.from_dict(sender_id, events, self.domain.slots)
 
     def keys(self) -> Iterable[Text]:
@@ -856,6 +1140,7 @@ class SQLTrackerStore(TrackerStore):
             serialised_events = self._event_query(session, sender_id).all()
 
             events = [json.loads(event.data) for event in serialised_events]
+            self._cache_stored_event_count(sender_id, len(events))
 
             if self.domain and len(events) > 0:
                 logger.debug(f"Recreating tracker from sender id '{sender_id}'")
@@ -915,37 +1200,61 @@ class SQLTrackerStore(TrackerStore):
             # only store recent events
             events = self._additional_events(session, tracker)
 
-            for event in events:
-                data = event.as_dict()
-                intent = (
-                    data.get("parse_data", {}).get("intent", {}).get(INTENT_NAME_KEY)
-                )
-                action = data.get("name")
-                timestamp = data.get("timestamp")
-
-                # noinspection PyArgumentList
-                session.add(
-                    self.SQLEvent(
-                        sender_id=tracker.sender_id,
-                        type_name=event.type_name,
-                        timestamp=timestamp,
-                        intent_name=intent,
-                        action_name=action,
-                        data=json.dumps(data),
-                    )
-                )
+            rows = [self._event_to_row(tracker.sender_id, event) for event in events]
+            if rows:
+                self._insert_rows(session, rows)
             session.commit()
 
+        self._cache_stored_event_count(tracker.sender_id, len(tracker.events))
+
         logger.debug(f"Tracker with sender_id '{tracker.sender_id}' stored to database")
 
+    @staticmethod
+    def _event_to_row(sender_id: Text, event: Event) -> Dict[Text, Any]:
+        """Convert an event to the column values of its row in the events table."""
+        data = event.as_dict()
+        return {
+            "sender_id": sender_id,
+            "type_name": event.type_name,
+            "timestamp": data.get("timestamp"),
+            "intent_name": (
+                data.get("parse_data", {}).get("intent", {}).get(INTENT_NAME_KEY)
+            ),
+            "action_name": data.get("name"),
+            "data": json.dumps(data),
+        }
+
+    def _insert_rows(self, session: "Session", rows: List[Dict[Text, Any]]) -> None:
+        """Insert all rows with a single statement.
+
+        Uses a multi-row `INSERT ... VALUES` if the dialect supports it and falls
+        back to a single `executemany` call otherwise (e.g. for Oracle).
+        """
+        table = self.SQLEvent.__table__
+
+        if session.get_bind().dialect.supports_multivalues_insert:
+            session.execute(table.insert().values(rows))
+        else:
+            session.execute(table.insert(), rows)
+
     def _additional_events(
         self, session: "Session", tracker: DialogueStateTracker
     ) -> Iterator:
-        """Return events from the tracker which aren't currently stored."""
+        """Return events from the tracker which aren't currently stored.
+
+        The number of stored events is taken from the last `retrieve` or `save` of
+        this conversation if possible. The events are only counted in the database if
+        the conversation is unknown to this tracker store instance.
+        """
+
+        number_of_events_since_last_session = self._stored_event_counts.get(
+            tracker.sender_id
+        )
+        if number_of_events_since_last_session is None:
+            number_of_events_since_last_session = self._event_query(
+                session, tracker.sender_id
+            ).count()
 
-        number_of_events_since_last_session = self._event_query(
-            session, tracker.sender_id
-        ).count()
         return itertools.islice(
             tracker.events, number_of_events_since_last_session, len(tracker.events)
         )
@@ -784,6 +784,55 @@ class DIETClassifier(IntentClassifier, EntityExtractor):
 
         return self.model.predict(model_data)
 
+    def _predict_batch(
+        self, messages: List[Message]
+    ) -> List[Optional[Dict[Text, tf.Tensor]]]:
+        """Predicts all messages with a single forward pass of the model.
+
+        Returns:
+            The model output for every message in the same format as `_predict`
+            returns it for a single message.
+        """
+        if self.model is None:
+            logger.debug(
+                f"There is no trained model for '{self.__class__.__name__}': The "
+                f"component is either not trained or didn't receive enough training "
+                f"data."
+            )
+            return [None] * len(messages)
+
+        # create one (padded) batch from all messages
+        model_data = self._create_model_data(messages, training=False)
+        batch_out = self.model.predict(model_data, batch_size=len(messages))
+
+        sequence_lengths = model_data.get(TEXT, SEQUENCE_LENGTH)
+        if sequence_lengths:
+            # the sentence features are appended to the sequence features
+            output_lengths = sequence_lengths[0] + 1
+        else:
+            output_lengths = np.ones(len(messages), dtype=int)
+
+        return [
+            {
+                key: self._output_of_example(key, value, index, output_lengths[index])
+                for key, value in batch_out.items()
+            }
+            for index in range(len(messages))
+        ]
+
+    @staticmethod
+    def _output_of_example(
+        key: Text, batch_value: tf.Tensor, index: int, output_length: int
+    ) -> tf.Tensor:
+        # keep the batch dimension so that the output looks like a batch of 1
+        value = batch_value[index : index + 1]
+
+        if key.startswith("e_"):
+            # remove the padding of the entity predictions
+            value = value[:, :output_length]
+
+        return value
+
     def _predict_label(
         self, predict_out: Optional[Dict[Text, tf.Tensor]]
     ) -> Tuple[Dict[Text, Any], List[Dict[Text, Any]]]:
@@ -887,7 +936,20 @@ class DIETClassifier(IntentClassifier, EntityExtractor):
         """Return the most likely label and its similarity to the input."""
 
         out = self._predict(message)
+        self._add_predictions_to_message(message, out)
+
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Predicts the labels of all messages with a single model inference."""
 
+        if not messages:
+            return
+
+        for message, out in zip(messages, self._predict_batch(messages)):
+            self._add_predictions_to_message(message, out)
+
+    def _add_predictions_to_message(
+        self, message: Message, out: Optional[Dict[Text, tf.Tensor]]
+    ) -> None:
         if self.component_config[INTENT_CLASSIFICATION]:
             label, label_ranking = self._predict_label(out)
 
@@ -1740,9 +1802,10 @@ class DIET(TransformerRasaModel):
             batch_in, self.predict_data_signature
         )
 
+        batch_dim = self._get_batch_dim(tf_batch_data)
         mask_sequence_text = self._get_mask_for(tf_batch_data, TEXT, SEQUENCE_LENGTH)
         sequence_lengths = self._get_sequence_lengths(
-            tf_batch_data, TEXT, SEQUENCE_LENGTH, batch_dim=1
+            tf_batch_data, TEXT, SEQUENCE_LENGTH, batch_dim
         )
 
         mask = self._compute_mask(sequence_lengths)
@@ -547,6 +547,22 @@ class Component(metaclass=ComponentMetaclass):
 
         pass
 
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Process a batch of incoming messages.
+
+        Components which can process several messages more efficiently at once
+        (e.g. by running a single model inference for the whole batch) should
+        override this method. By default every message is passed to
+        :meth:`rasa.nlu.components.Component.process` one after another.
+
+        Args:
+            messages: The :class:`rasa.shared.nlu.training_data.message.Message`
+                objects to process.
+        """
+
+        for message in messages:
+            self.process(message, **kwargs)
+
     def persist(self, file_name: Text, model_dir: Text) -> Optional[Dict[Text, Any]]:
         """Persist this component to disk for future loading.
 
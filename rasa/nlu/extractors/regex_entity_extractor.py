@@ -1,6 +1,5 @@
 import logging
 import os
-import re
 from typing import Any, Dict, List, Optional, Text
 
 import rasa.shared.utils.io
@@ -46,6 +45,18 @@ class RegexEntityExtractor(EntityExtractor):
         self.case_sensitive = self.component_config["case_sensitive"]
         self.patterns = patterns or []
 
+    @property
+    def patterns(self) -> List[Dict[Text, Text]]:
+        return self._patterns
+
+    @patterns.setter
+    def patterns(self, patterns: List[Dict[Text, Text]]) -> None:
+        """Sets the patterns and compiles them once for all messages."""
+        self._patterns = patterns
+        self._compiled_patterns = pattern_utils.compile_patterns(
+            patterns, self.case_sensitive
+        )
+
     def train(
         self,
         training_data: TrainingData,
@@ -82,25 +93,15 @@ class RegexEntityExtractor(EntityExtractor):
         """Extract entities of the given type from the given user message."""
         entities = []
 
-        flags = 0  # default flag
-        if not self.case_sensitive:
-            flags = re.IGNORECASE
-
-        for pattern in self.patterns:
-            matches = re.finditer(pattern["pattern"], message.get(TEXT), flags=flags)
-            matches = list(matches)
-
-            for match in matches:
-                start_index = match.start()
-                end_index = match.end()
+        text = message.get(TEXT)
+        for pattern in self._compiled_patterns:
+            for start_index, end_index in pattern.spans(text):
                 entities.append(
                     {
-                        ENTITY_ATTRIBUTE_TYPE: pattern["name"],
+                        ENTITY_ATTRIBUTE_TYPE: pattern.name,
                         ENTITY_ATTRIBUTE_START: start_index,
                         ENTITY_ATTRIBUTE_END: end_index,
-                        ENTITY_ATTRIBUTE_VALUE: message.get(TEXT)[
-                            start_index:end_index
-                        ],
+                        ENTITY_ATTRIBUTE_VALUE: text[start_index:end_index],
                     }
                 )
 
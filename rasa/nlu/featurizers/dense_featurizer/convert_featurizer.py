@@ -16,8 +16,13 @@ from rasa.shared.nlu.training_data.message import Message
 from rasa.nlu.constants import (
     DENSE_FEATURIZABLE_ATTRIBUTES,
     FEATURIZER_CLASS_ALIAS,
+    NUMBER_OF_SUB_TOKENS,
     TOKENS_NAMES,
 )
+from rasa.nlu.utils.featurization_cache import (
+    FEATURIZATION_CACHE_DIR,
+    FeaturizationCache,
+)
 from rasa.shared.nlu.constants import TEXT, FEATURE_TYPE_SENTENCE, FEATURE_TYPE_SEQUENCE
 import numpy as np
 import tensorflow as tf
@@ -35,6 +40,12 @@ class ConveRTFeaturizer(DenseFeaturizer):
     for dense featurizable attributes of each message object.
     """
 
+    defaults = {
+        # an optional path to a directory in which the computed features are cached,
+        # so that retraining only computes them for new or changed texts
+        FEATURIZATION_CACHE_DIR: None,
+    }
+
     @classmethod
     def required_components(cls) -> List[Type[Component]]:
         return [ConveRTTokenizer]
@@ -168,6 +179,7 @@ class ConveRTFeaturizer(DenseFeaturizer):
         config: Optional[RasaNLUModelConfig] = None,
         *,
         tf_hub_module: Any = None,
+        tf_hub_module_url: Optional[Text] = None,
         **kwargs: Any,
     ) -> None:
         if config is not None and config.language != "en":
@@ -181,12 +193,22 @@ class ConveRTFeaturizer(DenseFeaturizer):
 
         batch_size = 64
 
+        cache = FeaturizationCache.create(
+            self.component_config,
+            {"component": self.name, "tf_hub_module_url": tf_hub_module_url},
+        )
+
         for attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
 
             non_empty_examples = list(
                 filter(lambda x: x.get(attribute), training_data.training_examples)
             )
 
+            if cache:
+                non_empty_examples = self._set_cached_features(
+                    non_empty_examples, attribute, cache
+                )
+
             progress_bar = tqdm(
                 range(0, len(non_empty_examples), batch_size),
                 desc=attribute.capitalize() + " batches",
@@ -211,6 +233,64 @@ class ConveRTFeaturizer(DenseFeaturizer):
                     attribute,
                 )
 
+                if cache:
+                    for index, example in enumerate(batch_examples):
+                        cache.set(
+                            self._cache_key(example, attribute),
+                            (
+                                batch_sequence_features[index],
+                                batch_sentence_features[index],
+                            ),
+                        )
+
+    @staticmethod
+    def _cache_key(message: Message, attribute: Text) -> Dict[Text, Any]:
+        # the features depend on the text as well as on its tokens
+        tokens = [
+            (token.text, token.start, token.end, token.get(NUMBER_OF_SUB_TOKENS))
+            for token in message.get(TOKENS_NAMES[attribute])
+        ]
+        return {
+            "attribute": attribute,
+            "text": message.get(attribute),
+            "tokens": tokens,
+        }
+
+    def _set_cached_features(
+        self, examples: List[Message], attribute: Text, cache: FeaturizationCache
+    ) -> List[Message]:
+        """Sets the features which were computed in previous trainings.
+
+        Args:
+            examples: Messages which need features for `attribute`.
+            attribute: Property of message to be processed.
+            cache: The cache of previously computed features.
+
+        Returns:
+            The messages for which no features were cached.
+        """
+        uncached_examples = []
+        for example in examples:
+            features = cache.get(self._cache_key(example, attribute))
+            if features is None:
+                uncached_examples.append(example)
+            else:
+                sequence_features, sentence_features = features
+                self._set_features(
+                    [example],
+                    sequence_features[np.newaxis],
+                    sentence_features[np.newaxis],
+                    attribute,
+                )
+
+        logger.debug(
+            f"Using cached features for "
+            f"{len(examples) - len(uncached_examples)} of {len(examples)} examples "
+            f"for attribute '{attribute}'."
+        )
+
+        return uncached_examples
+
     def process(
         self, message: Message, *, tf_hub_module: Any = None, **kwargs: Any
     ) -> None:
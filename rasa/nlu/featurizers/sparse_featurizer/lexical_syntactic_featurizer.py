@@ -3,6 +3,7 @@ from collections import defaultdict, OrderedDict
 from pathlib import Path
 
 import numpy as np
+import scipy.sparse
 from typing import Any, Dict, Optional, Text, List, Type, Union
 
 from rasa.nlu.tokenizers.spacy_tokenizer import POS_TAG_KEY
@@ -94,17 +95,27 @@ class LexicalSyntacticFeaturizer(SparseFeaturizer):
         config: Optional[RasaNLUModelConfig] = None,
         **kwargs: Any,
     ) -> None:
-        self.feature_to_idx_dict = self._create_feature_to_idx_dict(training_data)
+        # the features of every example are only computed once, both to build the
+        # vocabulary and to create the sparse features
+        examples = []
+        all_features = []
+        for example in training_data.training_examples:
+            tokens = example.get(TOKENS_NAMES[TEXT])
+            if tokens:
+                examples.append(example)
+                all_features.append(self._tokens_to_features(tokens))
+
+        self.feature_to_idx_dict = self._create_feature_to_idx_dict(all_features)
         self.number_of_features = self._calculate_number_of_features()
 
-        for example in training_data.training_examples:
-            self._create_sparse_features(example)
+        for example, sentence_features in zip(examples, all_features):
+            self._add_sparse_features(example, sentence_features)
 
     def process(self, message: Message, **kwargs: Any) -> None:
         self._create_sparse_features(message)
 
     def _create_feature_to_idx_dict(
-        self, training_data: TrainingData
+        self, all_features: List[List[Dict[Text, Text]]]
     ) -> Dict[Text, Dict[Text, int]]:
         """Create dictionary of all feature values.
 
@@ -113,13 +124,6 @@ class LexicalSyntacticFeaturizer(SparseFeaturizer):
         feature vector.
         """
 
-        # get all possible feature values
-        all_features = []
-        for example in training_data.training_examples:
-            tokens = example.get(TOKENS_NAMES[TEXT])
-            if tokens:
-                all_features.append(self._tokens_to_features(tokens))
-
         # build vocabulary of features
         feature_vocabulary = self._build_feature_vocabulary(all_features)
 
@@ -146,7 +150,7 @@ class LexicalSyntacticFeaturizer(SparseFeaturizer):
 
     @staticmethod
     def _build_feature_vocabulary(
-        features: List[List[Dict[Text, Any]]]
+        features: List[List[Dict[Text, Text]]]
     ) -> Dict[Text, List[Text]]:
         feature_vocabulary = defaultdict(set)
 
@@ -163,43 +167,70 @@ class LexicalSyntacticFeaturizer(SparseFeaturizer):
     def _create_sparse_features(self, message: Message) -> None:
         """Convert incoming messages into sparse features using the configured
         features."""
-        import scipy.sparse
-
         tokens = message.get(TOKENS_NAMES[TEXT])
         # this check is required because there might be training data examples without TEXT,
         # e.g., `Message("", {action_name: "action_listen"})`
         if tokens:
+            self._add_sparse_features(message, self._tokens_to_features(tokens))
 
-            sentence_features = self._tokens_to_features(tokens)
-            one_hot_seq_feature_vector = self._features_to_one_hot(sentence_features)
+    def _add_sparse_features(
+        self, message: Message, sentence_features: List[Dict[Text, Text]]
+    ) -> None:
+        sequence_features = self._features_to_sparse(sentence_features)
 
-            sequence_features = scipy.sparse.coo_matrix(one_hot_seq_feature_vector)
+        final_sequence_features = Features(
+            sequence_features,
+            FEATURE_TYPE_SEQUENCE,
+            TEXT,
+            self.component_config[FEATURIZER_CLASS_ALIAS],
+        )
+        message.add_features(final_sequence_features)
 
-            final_sequence_features = Features(
-                sequence_features,
-                FEATURE_TYPE_SEQUENCE,
-                TEXT,
-                self.component_config[FEATURIZER_CLASS_ALIAS],
-            )
-            message.add_features(final_sequence_features)
+    def _tokens_to_features(self, tokens: List[Token]) -> List[Dict[Text, Text]]:
+        """Convert words into discrete features.
 
-    def _tokens_to_features(self, tokens: List[Token]) -> List[Dict[Text, Any]]:
-        """Convert words into discrete features."""
+        The feature values are converted to strings as they are used as keys of the
+        feature-to-idx dictionary.
+        """
 
         configured_features = self.component_config["features"]
-        sentence_features = []
 
-        for token_idx in range(len(tokens)):
-            # get the window size (e.g. before, word, after) of the configured features
-            # in case of an even number we will look at one more word before,
-            # e.g. window size 4 will result in a window range of
-            # [-2, -1, 0, 1] (0 = current word in sentence)
-            window_size = len(configured_features)
-            half_window_size = window_size // 2
-            window_range = range(-half_window_size, half_window_size + window_size % 2)
+        # get the window size (e.g. before, word, after) of the configured features
+        # in case of an even number we will look at one more word before,
+        # e.g. window size 4 will result in a window range of
+        # [-2, -1, 0, 1] (0 = current word in sentence)
+        window_size = len(configured_features)
+        half_window_size = window_size // 2
+        window_range = range(-half_window_size, half_window_size + window_size % 2)
+
+        # names of the features for every position in the window
+        window_feature_names = [
+            [
+                (f"{pointer_position}:{feature}", feature)
+                for feature in configured_features[pointer_position + half_window_size]
+            ]
+            for pointer_position in window_range
+        ]
 
-            prefixes = [str(i) for i in window_range]
+        # the value of a feature of a token doesn't depend on the token's position in
+        # the window, hence it's computed once per token
+        token_feature_keys = {
+            feature
+            for features in configured_features
+            for feature in features
+            if feature not in [BEGIN_OF_SENTENCE, END_OF_SENTENCE]
+        }
+        token_feature_values = [
+            {
+                feature: str(self._get_feature_value(feature, token))
+                for feature in token_feature_keys
+            }
+            for token in tokens
+        ]
+
+        sentence_features = []
 
+        for token_idx in range(len(tokens)):
             token_features = {}
 
             for pointer_position in window_range:
@@ -209,58 +240,48 @@ class LexicalSyntacticFeaturizer(SparseFeaturizer):
                 if current_idx < 0 or current_idx >= len(tokens):
                     continue
 
-                token = tokens[token_idx + pointer_position]
-
                 current_feature_idx = pointer_position + half_window_size
-                prefix = prefixes[current_feature_idx]
 
-                for feature in configured_features[current_feature_idx]:
-                    token_features[f"{prefix}:{feature}"] = self._get_feature_value(
-                        feature, token, token_idx, pointer_position, len(tokens)
-                    )
+                for feature_name, feature in window_feature_names[current_feature_idx]:
+                    if feature == BEGIN_OF_SENTENCE:
+                        feature_value = str(current_idx == 0)
+                    elif feature == END_OF_SENTENCE:
+                        feature_value = str(current_idx == len(tokens) - 1)
+                    else:
+                        feature_value = token_feature_values[current_idx][feature]
+                    token_features[feature_name] = feature_value
 
             sentence_features.append(token_features)
 
         return sentence_features
 
-    def _features_to_one_hot(
-        self, sentence_features: List[Dict[Text, Any]]
-    ) -> np.ndarray:
-        """Convert the word features into a one-hot presentation using the indices
-        in the feature-to-idx dictionary."""
-
-        one_hot_seq_feature_vector = np.zeros(
-            [len(sentence_features), self.number_of_features]
-        )
+    def _features_to_sparse(
+        self, sentence_features: List[Dict[Text, Text]]
+    ) -> scipy.sparse.coo_matrix:
+        """Convert the word features into a sparse one-hot presentation using the
+        indices in the feature-to-idx dictionary."""
+        rows = []
+        columns = []
 
         for token_idx, token_features in enumerate(sentence_features):
+            feature_indices = []
             for feature_name, feature_value in token_features.items():
-                feature_value_str = str(feature_value)
-                if (
-                    feature_name in self.feature_to_idx_dict
-                    and feature_value_str in self.feature_to_idx_dict[feature_name]
-                ):
-                    feature_idx = self.feature_to_idx_dict[feature_name][
-                        feature_value_str
-                    ]
-                    one_hot_seq_feature_vector[token_idx][feature_idx] = 1
-
-        return one_hot_seq_feature_vector
-
-    def _get_feature_value(
-        self,
-        feature: Text,
-        token: Token,
-        token_idx: int,
-        pointer_position: int,
-        token_length: int,
-    ) -> Union[bool, int, Text]:
-        if feature == END_OF_SENTENCE:
-            return token_idx + pointer_position == token_length - 1
-
-        if feature == BEGIN_OF_SENTENCE:
-            return token_idx + pointer_position == 0
+                feature_idx = self.feature_to_idx_dict.get(feature_name, {}).get(
+                    feature_value
+                )
+                if feature_idx is not None:
+                    feature_indices.append(feature_idx)
+
+            feature_indices.sort()
+            rows.extend([token_idx] * len(feature_indices))
+            columns.extend(feature_indices)
+
+        return scipy.sparse.coo_matrix(
+            (np.ones(len(rows)), (rows, columns)),
+            shape=(len(sentence_features), self.number_of_features),
+        )
 
+    def _get_feature_value(self, feature: Text, token: Token) -> Union[bool, Text]:
         if feature not in self.function_dict:
             raise ValueError(
                 f"Configured feature '{feature}' not valid. Please check "
@@ -1,7 +1,7 @@
+import bisect
 import logging
 import os
-import re
-from typing import Any, Dict, List, Optional, Text, Type, Tuple
+from typing import Any, Dict, List, Optional, Set, Text, Type, Tuple
 
 import numpy as np
 import scipy.sparse
@@ -52,8 +52,20 @@ class RegexFeaturizer(SparseFeaturizer):
 
         super().__init__(component_config)
 
-        self.known_patterns = known_patterns if known_patterns else []
         self.case_sensitive = self.component_config["case_sensitive"]
+        self.known_patterns = known_patterns if known_patterns else []
+
+    @property
+    def known_patterns(self) -> List[Dict[Text, Text]]:
+        return self._known_patterns
+
+    @known_patterns.setter
+    def known_patterns(self, known_patterns: List[Dict[Text, Text]]) -> None:
+        """Sets the patterns and compiles them once for all messages."""
+        self._known_patterns = known_patterns
+        self._compiled_patterns = pattern_utils.compile_patterns(
+            known_patterns, self.case_sensitive
+        )
 
     def train(
         self,
@@ -118,38 +130,91 @@ class RegexFeaturizer(SparseFeaturizer):
             # nothing to featurize
             return None, None
 
-        flags = 0  # default flag
-        if not self.case_sensitive:
-            flags = re.IGNORECASE
-
-        sequence_length = len(tokens)
-
-        sequence_features = np.zeros([sequence_length, len(self.known_patterns)])
-        sentence_features = np.zeros([1, len(self.known_patterns)])
-
-        for pattern_index, pattern in enumerate(self.known_patterns):
-            matches = re.finditer(pattern["pattern"], message.get(TEXT), flags=flags)
-            matches = list(matches)
-
-            for token_index, t in enumerate(tokens):
-                patterns = t.get("pattern", default={})
-                patterns[pattern["name"]] = False
-
-                for match in matches:
-                    if t.start < match.end() and t.end > match.start():
-                        patterns[pattern["name"]] = True
-                        sequence_features[token_index][pattern_index] = 1.0
-                        if attribute in [RESPONSE, TEXT]:
-                            # sentence vector should contain all patterns
-                            sentence_features[0][pattern_index] = 1.0
-
-                t.set("pattern", patterns)
-
-        return (
-            scipy.sparse.coo_matrix(sequence_features),
-            scipy.sparse.coo_matrix(sentence_features),
+        text = message.get(TEXT)
+        matched_spans = [pattern.spans(text) for pattern in self._compiled_patterns]
+
+        # a pattern name is only flagged if the last pattern with that name matches
+        last_index_for_name = {
+            pattern.name: pattern_index
+            for pattern_index, pattern in enumerate(self._compiled_patterns)
+        }
+        token_patterns = [dict.fromkeys(last_index_for_name, False) for _ in tokens]
+
+        starts = [token.start for token in tokens]
+        ends = [token.end for token in tokens]
+        # overlapping tokens can be found with a binary search if tokens are ordered
+        tokens_are_ordered = starts == sorted(starts) and ends == sorted(ends)
+
+        matched_features = set()
+        for pattern_index, spans in enumerate(matched_spans):
+            for token_index in self._overlapping_token_indices(
+                starts, ends, spans, tokens_are_ordered
+            ):
+                matched_features.add((token_index, pattern_index))
+
+                name = self._compiled_patterns[pattern_index].name
+                if last_index_for_name[name] == pattern_index:
+                    token_patterns[token_index][name] = True
+
+        for token, patterns in zip(tokens, token_patterns):
+            token_pattern = token.get("pattern", default={})
+            token_pattern.update(patterns)
+            token.set("pattern", token_pattern)
+
+        shape = (len(tokens), len(self._compiled_patterns))
+        sequence_features = self._sparse_features(sorted(matched_features), shape)
+
+        sentence_matches = []
+        if attribute in [RESPONSE, TEXT]:
+            # sentence vector should contain all patterns
+            sentence_matches = sorted(
+                {(0, pattern_index) for _, pattern_index in matched_features}
+            )
+        sentence_features = self._sparse_features(
+            sentence_matches, (1, len(self._compiled_patterns))
         )
 
+        return sequence_features, sentence_features
+
+    @staticmethod
+    def _overlapping_token_indices(
+        starts: List[int],
+        ends: List[int],
+        spans: List[Tuple[int, int]],
+        tokens_are_ordered: bool,
+    ) -> Set[int]:
+        """Finds the indices of the tokens which overlap with any of the spans."""
+        if not tokens_are_ordered:
+            return {
+                token_index
+                for token_index, (token_start, token_end) in enumerate(
+                    zip(starts, ends)
+                )
+                for start, end in spans
+                if token_start < end and token_end > start
+            }
+
+        # the tokens which end after the start of a span and start before its end
+        # form a contiguous range
+        token_indices = set()
+        for start, end in spans:
+            first = bisect.bisect_right(ends, start)
+            last = bisect.bisect_left(starts, end)
+            token_indices.update(range(first, last))
+
+        return token_indices
+
+    @staticmethod
+    def _sparse_features(
+        indices: List[Tuple[int, int]], shape: Tuple[int, int]
+    ) -> scipy.sparse.coo_matrix:
+        """Creates a sparse matrix which is `1.0` at the given row-major indices."""
+        rows = [row for row, _ in indices]
+        columns = [column for _, column in indices]
+        data = np.ones(len(indices))
+
+        return scipy.sparse.coo_matrix((data, (rows, columns)), shape=shape)
+
     @classmethod
     def load(
         cls,
@@ -1,4 +1,3 @@
-import copy
 import datetime
 import logging
 import os
@@ -197,8 +196,9 @@ class Trainer:
                 self.pipeline, self.training_data
             )
 
-        # data gets modified internally during the training - hence the copy
-        working_data: TrainingData = copy.deepcopy(data)
+        # data gets modified internally during the training - hence the copy. The
+        # copy shares values and features with `data` instead of duplicating them
+        working_data: TrainingData = data.copy_on_write()
 
         for i, component in enumerate(self.pipeline):
             if isinstance(component, (EntityExtractor, IntentClassifier)):
@@ -404,6 +404,59 @@ class Interpreter:
         output.update(message.as_dict(only_output_properties=only_output_properties))
         return output
 
+    def parse_batch(
+        self,
+        texts: List[Text],
+        time: Optional[datetime.datetime] = None,
+        only_output_properties: bool = True,
+    ) -> List[Dict[Text, Any]]:
+        """Parse several input texts at once and return the pipeline results.
+
+        Every component processes all (non-empty) messages with a single call to
+        :meth:`rasa.nlu.components.Component.process_batch`.
+
+        Args:
+            texts: The texts to parse.
+            time: The time of the messages.
+            only_output_properties: If `True`, only output properties are returned.
+
+        Returns:
+            The pipeline results in the same order as `texts`.
+        """
+
+        outputs: List[Optional[Dict[Text, Any]]] = []
+        messages = []
+        for text in texts:
+            if not text:
+                # see `parse` why empty texts are not passed to the pipeline
+                output = self.default_output_attributes()
+                output["text"] = ""
+                outputs.append(output)
+                continue
+
+            data = self.default_output_attributes()
+            data[TEXT] = text
+            messages.append(Message(data=data, time=time))
+            outputs.append(None)
+
+        if messages:
+            for component in self.pipeline:
+                component.process_batch(messages, **self.context)
+
+        processed_messages = iter(messages)
+        for index, output in enumerate(outputs):
+            if output is not None:
+                continue
+
+            message = next(processed_messages)
+            output = self.default_output_attributes()
+            output.update(
+                message.as_dict(only_output_properties=only_output_properties)
+            )
+            outputs[index] = output
+
+        return outputs
+
     def featurize_message(self, message: Message) -> Message:
         """
         Tokenize and featurize the input message
@@ -370,10 +370,11 @@ class ResponseSelector(DIETClassifier):
                     return search_key
         return None
 
-    def process(self, message: Message, **kwargs: Any) -> None:
-        """Return the most likely response, the associated intent_response_key and its similarity to the input."""
+    def _add_predictions_to_message(
+        self, message: Message, out: Optional[Dict[Text, tf.Tensor]]
+    ) -> None:
+        """Adds the most likely response and its intent_response_key to the message."""
 
-        out = self._predict(message)
         top_label, label_ranking = self._predict_label(out)
 
         # Get the exact intent_response_key and the associated
@@ -706,9 +707,10 @@ class DIET2DIET(DIET):
             batch_in, self.predict_data_signature
         )
 
+        batch_dim = self._get_batch_dim(tf_batch_data)
         sequence_mask_text = super()._get_mask_for(tf_batch_data, TEXT, SEQUENCE_LENGTH)
         sequence_lengths_text = self._get_sequence_lengths(
-            tf_batch_data, TEXT, SEQUENCE_LENGTH, batch_dim=1
+            tf_batch_data, TEXT, SEQUENCE_LENGTH, batch_dim
         )
         mask_text = self._compute_mask(sequence_lengths_text)
 
@@ -51,6 +51,7 @@ from rasa.model import get_model
 from rasa.nlu.components import ComponentBuilder
 from rasa.nlu.config import RasaNLUModelConfig
 from rasa.nlu.model import Interpreter, Trainer, TrainingData
+from rasa.shared.nlu.training_data.message import Message
 from rasa.nlu.components import Component
 from rasa.nlu.tokenizers.tokenizer import Token
 from rasa.utils.tensorflow.constants import ENTITY_RECOGNITION
@@ -67,6 +68,10 @@ CVEvaluationResult = namedtuple("Results", "train test")
 
 NO_ENTITY = "no_entity"
 
+# number of test examples which are parsed together so that components can
+# process them in batches
+PARSE_BATCH_SIZE = 64
+
 IntentEvaluationResult = namedtuple(
     "IntentEvaluationResult", "intent_target intent_prediction message confidence"
 )
@@ -1306,8 +1311,9 @@ def get_eval_data(
 
     should_eval_entities = is_entity_extractor_present(interpreter)
 
-    for example in tqdm(test_data.training_examples):
-        result = interpreter.parse(example.get(TEXT), only_output_properties=False)
+    results = _parse_examples(interpreter, test_data.training_examples)
+
+    for example, result in zip(test_data.training_examples, results):
 
         if should_eval_intents:
             intent_prediction = result.get(INTENT, {}) or {}
@@ -1360,6 +1366,29 @@ def get_eval_data(
     return intent_results, response_selection_results, entity_results
 
 
+def _parse_examples(
+    interpreter: Interpreter,
+    examples: List[Message],
+    batch_size: int = PARSE_BATCH_SIZE,
+) -> Iterator[Dict[Text, Any]]:
+    """Parses the texts of the examples in batches.
+
+    Args:
+        interpreter: the interpreter
+        examples: the examples to parse
+        batch_size: number of examples which are parsed together
+
+    Returns: the parse results in the order of the examples
+    """
+    with tqdm(total=len(examples)) as progress_bar:
+        for start in range(0, len(examples), batch_size):
+            batch = examples[start : start + batch_size]
+            yield from interpreter.parse_batch(
+                [example.get(TEXT) for example in batch], only_output_properties=False
+            )
+            progress_bar.update(len(batch))
+
+
 def get_entity_extractors(interpreter: Interpreter) -> Set[Text]:
     """Finds the names of entity extractors used by the interpreter.
 
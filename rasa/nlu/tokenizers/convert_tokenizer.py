@@ -53,7 +53,7 @@ class ConveRTTokenizer(WhitespaceTokenizer):
         return f"{cls.name}-{get_dict_hash(_config)}"
 
     def provide_context(self) -> Dict[Text, Any]:
-        return {"tf_hub_module": self.module}
+        return {"tf_hub_module": self.module, "tf_hub_module_url": self.model_url}
 
     def _tokenize(self, sentence: Text) -> Any:
 
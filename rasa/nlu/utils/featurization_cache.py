@@ -0,0 +1,131 @@
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Text
+
+import rasa
+import rasa.utils.io
+from rasa.core.utils import get_dict_hash
+
+logger = logging.getLogger(__name__)
+
+# name of the component configuration parameter which enables the cache
+FEATURIZATION_CACHE_DIR = "featurization_cache_dir"
+
+
+class FeaturizationCache:
+    """Content addressed on-disk cache for the outputs of expensive featurizers.
+
+    Entries are addressed by the fingerprint of the component which computed them
+    (e.g. its configuration and the model weights it uses) and by the content they
+    were computed for (e.g. the text of a message). Retraining with the same
+    component hence only needs to compute the outputs for new or changed texts.
+    """
+
+    def __init__(self, cache_dir: Text, fingerprint: Dict[Text, Any]) -> None:
+        """Creates a cache.
+
+        Args:
+            cache_dir: Directory in which the cache entries are stored.
+            fingerprint: Everything apart from the input content which the cached
+                outputs depend on.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.fingerprint = get_dict_hash(
+            {
+                **fingerprint,
+                "rasa_version": rasa.__version__,  # pytype: disable=module-attr
+            }
+        )
+
+    @staticmethod
+    def create(
+        component_config: Dict[Text, Any], fingerprint: Dict[Text, Any]
+    ) -> Optional["FeaturizationCache"]:
+        """Creates a cache if it's enabled in the component configuration.
+
+        Args:
+            component_config: Configuration of the component which uses the cache.
+            fingerprint: Everything apart from the input content which the cached
+                outputs depend on.
+
+        Returns:
+            The cache or `None` if no cache directory is configured.
+        """
+        cache_dir = component_config.get(FEATURIZATION_CACHE_DIR)
+        if not cache_dir:
+            return None
+
+        return FeaturizationCache(cache_dir, fingerprint)
+
+    def _path(self, key: Dict[Text, Any]) -> Path:
+        digest = get_dict_hash({"fingerprint": self.fingerprint, "key": key})
+        return self.cache_dir / digest[:2] / digest
+
+    def get(self, key: Dict[Text, Any]) -> Optional[Any]:
+        """Returns the cached value for `key`.
+
+        Args:
+            key: The input content the value was computed for.
+
+        Returns:
+            The cached value or `None` if there is no (readable) entry for `key`.
+        """
+        path = self._path(key)
+        if not path.is_file():
+            return None
+
+        try:
+            return rasa.utils.io.pickle_load(path)
+        except Exception as e:
+            logger.debug(f"Failed to read featurization cache entry '{path}': {e}")
+            return None
+
+    def set(self, key: Dict[Text, Any], value: Any) -> None:
+        """Stores `value` for `key`.
+
+        Failing to write an entry is logged but doesn't fail the featurization.
+
+        Args:
+            key: The input content the value was computed for.
+            value: The value to store.
+        """
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # write to a temporary file first so that concurrent trainings never
+            # read partially written entries
+            with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as f:
+                pickle.dump(value, f)
+            os.replace(f.name, path)
+        except OSError as e:
+            logger.debug(f"Failed to write featurization cache entry '{path}': {e}")
+
+
+def model_weights_fingerprint(model_weights: Text) -> Dict[Text, Any]:
+    """Fingerprints model weights which are referenced by name or by local path.
+
+    Args:
+        model_weights: Name of pre-trained model weights or a local path to them.
+
+    Returns:
+        The name of the weights and, if the weights are stored locally, the size and
+        modification time of their files.
+    """
+    fingerprint = {"model_weights": model_weights}
+
+    path = Path(model_weights)
+    if path.is_file():
+        files = [path]
+    elif path.is_dir():
+        files = sorted(file for file in path.rglob("*") if file.is_file())
+    else:
+        return fingerprint
+
+    fingerprint["files"] = [
+        [str(file), file.stat().st_size, file.stat().st_mtime] for file in files
+    ]
+
+    return fingerprint
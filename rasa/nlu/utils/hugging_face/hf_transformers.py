@@ -9,6 +9,11 @@ from rasa.nlu.config import RasaNLUModelConfig
 from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.shared.nlu.training_data.message import Message
 from rasa.nlu.tokenizers.tokenizer import Token
+from rasa.nlu.utils.featurization_cache import (
+    FEATURIZATION_CACHE_DIR,
+    FeaturizationCache,
+    model_weights_fingerprint,
+)
 import rasa.utils.train_utils as train_utils
 import numpy as np
 
@@ -33,6 +38,9 @@ MAX_SEQUENCE_LENGTHS = {
     "roberta": 512,
 }
 
+# number of examples which are passed through the language model at once
+BATCH_SIZE = 64
+
 logger = logging.getLogger(__name__)
 
 
@@ -53,6 +61,9 @@ class HFTransformersNLP(Component):
         # an optional path to a specific directory to download
         # and cache the pre-trained model weights.
         "cache_dir": None,
+        # an optional path to a directory in which the computed tokens and features
+        # are cached, so that retraining only computes them for new or changed texts
+        FEATURIZATION_CACHE_DIR: None,
     }
 
     def __init__(
@@ -645,6 +656,32 @@ class HFTransformersNLP(Component):
             batch_examples, attribute
         )
 
+        return self._get_docs_for_tokens(
+            batch_tokens, batch_token_ids, batch_examples, attribute, inference_mode
+        )
+
+    def _get_docs_for_tokens(
+        self,
+        batch_tokens: List[List[Token]],
+        batch_token_ids: List[List[int]],
+        batch_examples: List[Message],
+        attribute: Text,
+        inference_mode: bool = False,
+    ) -> List[Dict[Text, Any]]:
+        """Compute language model docs for a batch of already tokenized examples.
+
+        Args:
+            batch_tokens: List of token objects for each example in the batch.
+            batch_token_ids: List of token ids of each example in the batch.
+            batch_examples: Batch of message objects for which language model docs
+            need to be computed.
+            attribute: Property of message to be processed, one of ``TEXT`` or
+            ``RESPONSE``.
+            inference_mode: Whether the call is during inference or during training.
+
+        Returns:
+            List of language model docs for each message in batch.
+        """
         (
             batch_sentence_features,
             batch_sequence_features,
@@ -667,6 +704,56 @@ class HFTransformersNLP(Component):
 
         return batch_docs
 
+    def _get_docs_for_examples(
+        self,
+        examples: List[Message],
+        attribute: Text,
+        inference_mode: bool = False,
+        batch_size: int = BATCH_SIZE,
+    ) -> List[Dict[Text, Any]]:
+        """Compute language model docs for all examples in batches of similar length.
+
+        The examples are sorted by their number of token ids before they are split
+        into batches. Every batch is padded to its longest sequence, so that batching
+        sequences of similar length avoids feeding mostly padding to the model.
+
+        Args:
+            examples: Message objects for which language model docs need to be
+            computed.
+            attribute: Property of message to be processed, one of ``TEXT`` or
+            ``RESPONSE``.
+            inference_mode: Whether the call is during inference or during training.
+            batch_size: Maximum number of examples which are fed to the model at once.
+
+        Returns:
+            List of language model docs in the same order as `examples`.
+        """
+        tokens, token_ids = self._get_token_ids_for_batch(examples, attribute)
+
+        sorted_indices = sorted(
+            range(len(examples)), key=lambda index: len(token_ids[index])
+        )
+
+        docs: List[Optional[Dict[Text, Any]]] = [None] * len(examples)
+        for batch_start_index in range(0, len(sorted_indices), batch_size):
+            batch_indices = sorted_indices[
+                batch_start_index : batch_start_index + batch_size
+            ]
+
+            batch_docs = self._get_docs_for_tokens(
+                [tokens[index] for index in batch_indices],
+                [token_ids[index] for index in batch_indices],
+                [examples[index] for index in batch_indices],
+                attribute,
+                inference_mode,
+            )
+
+            # scatter the docs back to the original order of the examples
+            for index, doc in zip(batch_indices, batch_docs):
+                docs[index] = doc
+
+        return docs
+
     def train(
         self,
         training_data: TrainingData,
@@ -681,7 +768,14 @@ class HFTransformersNLP(Component):
 
         """
 
-        batch_size = 64
+        cache = FeaturizationCache.create(
+            self.component_config,
+            {
+                "component": self.name,
+                "model_name": self.model_name,
+                **model_weights_fingerprint(self.model_weights),
+            },
+        )
 
         for attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
 
@@ -689,25 +783,55 @@ class HFTransformersNLP(Component):
                 filter(lambda x: x.get(attribute), training_data.training_examples)
             )
 
-            batch_start_index = 0
+            if cache:
+                non_empty_examples = self._set_cached_docs(
+                    non_empty_examples, attribute, cache
+                )
+
+            # Construct a doc with relevant features
+            # extracted(tokens, dense_features)
+            docs = self._get_docs_for_examples(non_empty_examples, attribute)
 
-            while batch_start_index < len(non_empty_examples):
+            for ex, doc in zip(non_empty_examples, docs):
 
-                batch_end_index = min(
-                    batch_start_index + batch_size, len(non_empty_examples)
-                )
-                # Collect batch examples
-                batch_messages = non_empty_examples[batch_start_index:batch_end_index]
+                ex.set(LANGUAGE_MODEL_DOCS[attribute], doc)
 
-                # Construct a doc with relevant features
-                # extracted(tokens, dense_features)
-                batch_docs = self._get_docs_for_batch(batch_messages, attribute)
+                if cache:
+                    cache.set(self._cache_key(ex, attribute), doc)
 
-                for index, ex in enumerate(batch_messages):
+    @staticmethod
+    def _cache_key(message: Message, attribute: Text) -> Dict[Text, Any]:
+        # the doc of a message only depends on the text of the attribute
+        return {"attribute": attribute, "text": message.get(attribute)}
+
+    def _set_cached_docs(
+        self, examples: List[Message], attribute: Text, cache: FeaturizationCache
+    ) -> List[Message]:
+        """Sets the docs which were computed in previous trainings.
+
+        Args:
+            examples: Messages which need a doc for `attribute`.
+            attribute: Property of message to be processed.
+            cache: The cache of previously computed docs.
 
-                    ex.set(LANGUAGE_MODEL_DOCS[attribute], batch_docs[index])
+        Returns:
+            The messages for which no doc was cached.
+        """
+        uncached_examples = []
+        for example in examples:
+            doc = cache.get(self._cache_key(example, attribute))
+            if doc is None:
+                uncached_examples.append(example)
+            else:
+                example.set(LANGUAGE_MODEL_DOCS[attribute], doc)
+
+        logger.debug(
+            f"Using cached language model docs for "
+            f"{len(examples) - len(uncached_examples)} of {len(examples)} examples "
+            f"for attribute '{attribute}'."
+        )
 
-                batch_start_index += batch_size
+        return uncached_examples
 
     def process(self, message: Message, **kwargs: Any) -> None:
         """Process an incoming message by computing its tokens and dense features.
@@ -716,14 +840,27 @@ class HFTransformersNLP(Component):
             message: Incoming message object
         """
 
+        self.process_batch([message], **kwargs)
+
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Computes the tokens and dense features of several messages together.
+
+        Messages of similar length share a forward pass through the language model.
+
+        Args:
+            messages: Incoming message objects
+        """
+
         # process of all featurizers operates only on TEXT and ACTION_TEXT attributes,
         # because all other attributes are labels which are featurized during training
         # and their features are stored by the model itself.
         for attribute in {TEXT, ACTION_TEXT}:
-            if message.get(attribute):
-                message.set(
-                    LANGUAGE_MODEL_DOCS[attribute],
-                    self._get_docs_for_batch(
-                        [message], attribute=attribute, inference_mode=True
-                    )[0],
-                )
+            examples = [message for message in messages if message.get(attribute)]
+            if not examples:
+                continue
+
+            docs = self._get_docs_for_examples(
+                examples, attribute=attribute, inference_mode=True
+            )
+            for message, doc in zip(examples, docs):
+                message.set(LANGUAGE_MODEL_DOCS[attribute], doc)
@@ -1,5 +1,5 @@
 import re
-from typing import Dict, List, Text, Union
+from typing import Any, Callable, Dict, List, Optional, Pattern, Text, Tuple, Union
 
 import rasa.shared.utils.io
 from rasa.shared.nlu.training_data.training_data import TrainingData
@@ -27,6 +27,10 @@ def _convert_lookup_tables_to_regex(
     return patterns
 
 
+LOOKUP_REGEX_PREFIX = "(\\b"
+LOOKUP_REGEX_SUFFIX = "\\b)"
+
+
 def _generate_lookup_regex(lookup_table: Dict[Text, Union[Text, List[Text]]]) -> Text:
     """Creates a regex pattern from the given lookup table.
 
@@ -47,11 +51,54 @@ def _generate_lookup_regex(lookup_table: Dict[Text, Union[Text, List[Text]]]) ->
     else:
         elements_to_regex = read_lookup_table_file(lookup_elements)
 
+    return _lookup_regex_for_elements(elements_to_regex)
+
+
+def _lookup_regex_for_elements(elements: List[Text]) -> Text:
+    """Creates a regex pattern which matches any of the given lookup elements.
+
+    Args:
+        elements: The elements of a lookup table.
+
+    Returns:
+        The regex pattern.
+    """
     # sanitize the regex, escape special characters
-    elements_sanitized = [re.escape(e) for e in elements_to_regex]
+    elements_sanitized = [re.escape(e) for e in elements]
 
     # regex matching elements with word boundaries on either side
-    return "(\\b" + "\\b|\\b".join(elements_sanitized) + "\\b)"
+    return (
+        LOOKUP_REGEX_PREFIX + "\\b|\\b".join(elements_sanitized) + LOOKUP_REGEX_SUFFIX
+    )
+
+
+def _elements_from_lookup_regex(pattern: Text) -> Optional[List[Text]]:
+    """Recovers the lookup elements from a regex created for a lookup table.
+
+    Args:
+        pattern: A regex pattern.
+
+    Returns:
+        The elements matched by the pattern if the pattern is exactly the regex
+        which `_lookup_regex_for_elements` creates for them, `None` otherwise.
+    """
+    if not (
+        pattern.startswith(LOOKUP_REGEX_PREFIX)
+        and pattern.endswith(LOOKUP_REGEX_SUFFIX)
+    ):
+        return None
+
+    # escaped elements can't contain an unescaped `|`, hence the split is unique
+    body = pattern[len(LOOKUP_REGEX_PREFIX) : -len(LOOKUP_REGEX_SUFFIX)]
+    elements = [
+        re.sub(r"\\(.)", r"\1", element, flags=re.DOTALL)
+        for element in body.split("\\b|\\b")
+    ]
+
+    if not all(elements) or _lookup_regex_for_elements(elements) != pattern:
+        return None
+
+    return elements
 
 
 def read_lookup_table_file(lookup_table_file: Text) -> List[Text]:
@@ -137,3 +184,127 @@ def extract_patterns(
         )
 
     return patterns
+
+
+class CompiledPattern:
+    """A pattern which was compiled once so that it can be matched repeatedly."""
+
+    def __init__(self, name: Text) -> None:
+        self.name = name
+
+    def spans(self, text: Text) -> List[Tuple[int, int]]:
+        """Finds the non-overlapping matches of the pattern in `text`.
+
+        Args:
+            text: The text to search.
+
+        Returns:
+            The start and end index of every match from left to right.
+        """
+        raise NotImplementedError
+
+
+class CompiledRegex(CompiledPattern):
+    """A pattern which is matched using a compiled regular expression."""
+
+    def __init__(self, name: Text, regex: Pattern) -> None:
+        super().__init__(name)
+        self._regex = regex
+
+    def spans(self, text: Text) -> List[Tuple[int, int]]:
+        return [match.span() for match in self._regex.finditer(text)]
+
+
+class CompiledLookupTable(CompiledPattern):
+    """A lookup table pattern which is matched using a trie of its elements.
+
+    Matching the trie only depends on the length of the text and the length of
+    the elements instead of the number of elements in the lookup table. The matches
+    are identical to the ones of the lookup table's regex, i.e. at every position
+    the first element in the table which is surrounded by word boundaries wins.
+    """
+
+    def __init__(self, name: Text, elements: List[Text]) -> None:
+        super().__init__(name)
+
+        # every node maps characters to child nodes, the key `None` holds the index
+        # of the first element which ends at the node
+        self._trie: Dict[Optional[Text], Any] = {}
+        for index, element in enumerate(elements):
+            node = self._trie
+            for character in element:
+                node = node.setdefault(character, {})
+            node.setdefault(None, index)
+
+    def spans(self, text: Text) -> List[Tuple[int, int]]:
+        # same definition of word characters as `\w` for `str` patterns
+        is_word = [character.isalnum() or character == "_" for character in text]
+        is_word.append(False)
+
+        def is_boundary(index: int) -> bool:
+            return (index > 0 and is_word[index - 1]) != is_word[index]
+
+        spans = []
+        start = 0
+        while start < len(text):
+            end = self._match_at(text, start, is_boundary) if is_boundary(start) else 0
+            if end:
+                spans.append((start, end))
+                start = end
+            else:
+                start += 1
+
+        return spans
+
+    def _match_at(
+        self, text: Text, start: int, is_boundary: Callable[[int], bool]
+    ) -> int:
+        """Returns the end of the first element which matches at `start` or `0`."""
+        best_index = None
+        best_end = 0
+        node = self._trie
+        for end in range(start + 1, len(text) + 1):
+            node = node.get(text[end - 1])
+            if node is None:
+                break
+
+            index = node.get(None)
+            if (
+                index is not None
+                and (best_index is None or index < best_index)
+                and is_boundary(end)
+            ):
+                best_index = index
+                best_end = end
+
+        return best_end
+
+
+def compile_patterns(
+    patterns: List[Dict[Text, Text]], case_sensitive: bool = True
+) -> List[CompiledPattern]:
+    """Compiles patterns once so that they can be matched against many messages.
+
+    Lookup table patterns are matched with a trie if the matching is case sensitive.
+    All other patterns are compiled to regular expressions.
+
+    Args:
+        patterns: The patterns as returned by `extract_patterns`.
+        case_sensitive: Whether the patterns should be matched case sensitive.
+
+    Returns:
+        The compiled patterns in the same order as `patterns`.
+    """
+    flags = 0 if case_sensitive else re.IGNORECASE
+
+    compiled_patterns = []
+    for pattern in patterns:
+        elements = _elements_from_lookup_regex(pattern["pattern"])
+        if case_sensitive and elements:
+            compiled_patterns.append(CompiledLookupTable(pattern["name"], elements))
+        else:
+            compiled_patterns.append(
+                CompiledRegex(pattern["name"], re.compile(pattern["pattern"], flags))
+            )
+
+    return compiled_patterns
@@ -1,6 +1,6 @@
 import logging
 import typing
-from typing import Any, Dict, List, Optional, Text, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Text, Tuple
 
 from rasa.nlu.components import Component
 from rasa.nlu.config import RasaNLUModelConfig, override_defaults
@@ -30,6 +30,15 @@ class SpacyNLP(Component):
         # applications and models it makes sense to differentiate
         # between these two words, therefore setting this to `True`.
         "case_sensitive": False,
+        # number of texts which are passed to spaCy's `nlp.pipe` at once
+        "batch_size": 50,
+        # number of processes which `nlp.pipe` uses to create the docs
+        # (values other than 1 require spaCy 2.2.2 or later)
+        "n_process": 1,
+        # spaCy pipeline components which are disabled when creating the docs for
+        # the messages, since none of the Rasa components uses their output
+        # (`SpacyEntityExtractor` runs the full pipeline itself)
+        "disabled_pipes": ["ner"],
     }
 
     def __init__(
@@ -98,6 +107,25 @@ class SpacyNLP(Component):
 
         return self.nlp(self.preprocess_text(text))
 
+    def docs_for_texts(self, texts: List[Text]) -> Iterator["Doc"]:
+        """Creates the docs for several (preprocessed) texts with `nlp.pipe`.
+
+        Args:
+            texts: The texts to process.
+
+        Returns:
+            The docs in the same order as `texts`.
+        """
+        kwargs = {
+            "batch_size": self.component_config["batch_size"],
+            "disable": self.component_config["disabled_pipes"] or [],
+        }
+        if self.component_config["n_process"] != 1:
+            # older spaCy versions don't support the parameter
+            kwargs["n_process"] = self.component_config["n_process"]
+
+        return self.nlp.pipe(texts, **kwargs)
+
     def preprocess_text(self, text: Optional[Text]) -> Text:
 
         if text is None:
@@ -155,12 +183,7 @@ class SpacyNLP(Component):
             (to_pipe_sample[0], doc)
             for to_pipe_sample, doc in zip(
                 samples_to_pipe,
-                [
-                    doc
-                    for doc in self.nlp.pipe(
-                        [txt for _, txt in samples_to_pipe], batch_size=50
-                    )
-                ],
+                list(self.docs_for_texts([txt for _, txt in samples_to_pipe])),
             )
         ]
         return docs
@@ -233,11 +256,21 @@ class SpacyNLP(Component):
                     example.set(SPACY_DOCS[attribute], example_attribute_doc)
 
     def process(self, message: Message, **kwargs: Any) -> None:
+        self.process_batch([message], **kwargs)
+
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Creates the docs for all messages with a single call to `nlp.pipe`."""
+
         for attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
-            if message.get(attribute):
-                message.set(
-                    SPACY_DOCS[attribute], self.doc_for_text(message.get(attribute))
-                )
+            messages_with_attribute = [
+                message for message in messages if message.get(attribute)
+            ]
+            docs = self.docs_for_texts(
+                [self.get_text(m, attribute) for m in messages_with_attribute]
+            )
+
+            for message, doc in zip(messages_with_attribute, docs):
+                message.set(SPACY_DOCS[attribute], doc)
 
     @classmethod
     def load(
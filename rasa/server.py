@@ -1,5 +1,6 @@
 import asyncio
 import functools
+import json
 import logging
 import multiprocessing
 import os
@@ -63,6 +64,11 @@ logger = logging.getLogger(__name__)
 
 JSON_CONTENT_TYPE = "application/json"
 YAML_CONTENT_TYPE = "application/x-yaml"
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+# number of texts of a bulk parse request which are passed through the NLU pipeline
+# together
+PARSE_BATCH_SIZE = 64
 
 OUTPUT_CHANNEL_QUERY_KEY = "output_channel"
 USE_LATEST_INPUT_CHANNEL_AS_OUTPUT_CHANNEL = "latest"
@@ -326,6 +332,38 @@ def _create_emulator(mode: Optional[Text]) -> NoEmulator:
         )
 
 
+def _texts_from_bulk_parse_request(
+    request: Request, emulator: NoEmulator
+) -> List[Text]:
+    """Extracts the texts of a bulk parse request.
+
+    The request body is either a JSON list or newline-delimited JSON. Every item
+    is either a text or a parse request in the format of the `emulator`.
+    """
+
+    if request.headers.get("Content-type") == NDJSON_CONTENT_TYPE:
+        items = [
+            json.loads(line)
+            for line in request.body.decode("utf-8").splitlines()
+            if line.strip()
+        ]
+    else:
+        items = request.json
+
+    if not isinstance(items, list):
+        raise ValueError("Request body needs to be a list of messages.")
+
+    texts = []
+    for item in items:
+        if not isinstance(item, str):
+            item = emulator.normalise_request_json(item).get("text")
+        if not isinstance(item, str):
+            raise ValueError(f"Message '{item}' does not contain a text.")
+        texts.append(item)
+
+    return texts
+
+
 async def _load_agent(
     model_path: Optional[Text] = None,
     model_server: Optional[EndpointConfig] = None,
@@ -462,6 +500,7 @@ def create_app(
                 or app.agent.model_directory,
                 "fingerprint": model.fingerprint_from_path(app.agent.model_directory),
                 "num_active_training_jobs": app.active_training_processes.value,
+                "model_load_time": app.agent.model_load_time,
             }
         )
 
@@ -629,12 +668,15 @@ def create_app(
                     app.agent.create_processor(), conversation_id
                 )
                 output_channel = _get_output_channel(request, tracker)
-                await app.agent.execute_action(
+                # the tracker which was retrieved for this request is used to run
+                # the action instead of fetching it from the tracker store again
+                tracker = await app.agent.execute_action(
                     conversation_id,
                     action_to_execute,
                     output_channel,
                     policy,
                     confidence,
+                    tracker,
                 )
 
         except Exception as e:
@@ -643,7 +685,6 @@ def create_app(
                 500, "ConversationError", f"An unexpected error occurred. Error: {e}"
             )
 
-        tracker = await get_tracker(app.agent.create_processor(), conversation_id)
         state = tracker.current_state(verbosity)
 
         response_body = {"tracker": state}
@@ -981,6 +1022,41 @@ def create_app(
                 500, "ParsingError", f"An unexpected error occurred. Error: {e}"
             )
 
+    @app.post("/model/parse/bulk")
+    @requires_auth(app, auth_token)
+    @ensure_loaded_agent(app)
+    async def parse_bulk(request: Request) -> HTTPResponse:
+        validate_request_body(
+            request,
+            "No text messages defined in request_body. Add a list of text messages "
+            "to the request body in order to obtain their intents and extracted "
+            "entities.",
+        )
+        emulation_mode = request.args.get("emulation_mode")
+        emulator = _create_emulator(emulation_mode)
+
+        try:
+            texts = _texts_from_bulk_parse_request(request, emulator)
+        except Exception as e:
+            logger.debug(traceback.format_exc())
+            raise ErrorResponse(
+                400, "BadRequest", f"Invalid bulk parse request. Error: {e}"
+            )
+
+        async def stream_parse_results(resp: Any) -> None:
+            for start in range(0, len(texts), PARSE_BATCH_SIZE):
+                parsed_batch = await app.agent.parse_messages_using_nlu_interpreter(
+                    texts[start : start + PARSE_BATCH_SIZE]
+                )
+                await resp.write(
+                    "".join(
+                        json.dumps(emulator.normalise_response_json(parsed_data)) + "\n"
+                        for parsed_data in parsed_batch
+                    )
+                )
+
+        return response.stream(stream_parse_results, content_type=NDJSON_CONTENT_TYPE)
+
     @app.put("/model")
     @requires_auth(app, auth_token)
     async def load_model(request: Request) -> HTTPResponse:
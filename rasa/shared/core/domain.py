@@ -531,6 +531,14 @@ class Domain:
 
         return int(text_hash, 16)
 
+    @rasa.shared.utils.common.lazy_property
+    def fingerprint(self) -> Text:
+        """Returns a hash of the serialised domain."""
+
+        return rasa.shared.utils.io.get_text_hash(
+            json.dumps(self.as_dict(), sort_keys=True)
+        )
+
     @rasa.shared.utils.common.lazy_property
     def user_actions_and_forms(self):
         """Returns combination of user actions and forms."""
@@ -93,7 +93,7 @@ class TrackerWithCachedStates(DialogueStateTracker):
         # if don't have it cached, we use the domain to calculate the states
         # from the events
         if self._states_for_hashing is None:
-            states = super().past_states(domain)
+            states = domain.states_for_tracker_history(self)
             self._states_for_hashing = deque(
                 self.freeze_current_state(s) for s in states
             )
@@ -1,5 +1,6 @@
 import copy
 import logging
+import operator
 from collections import deque
 from enum import Enum
 from typing import (
@@ -182,6 +183,20 @@ class DialogueStateTracker:
         self._reset()
         self.active_loop: Dict[Text, Union[Text, bool, Dict, None]] = {}
 
+        # cache of the past states which is continued as long as previously applied
+        # events aren't undone, see `past_states`
+        self._past_states_domain: Optional[Domain] = None
+        self._past_states_events: List[Event] = []
+        self._past_states_before_actions: List[State] = []
+        self._past_states_tracker: Optional[DialogueStateTracker] = None
+
+        # cache of the applied events which is valid as long as the events of the
+        # tracker are unchanged, see `applied_events`
+        self._applied_events: List[Event] = []
+        self._applied_events_key: Optional[Tuple[int, Tuple[Any, ...]]] = None
+        # cache of the slot values which is reset whenever a slot is set
+        self._slot_values: Optional[Dict[Text, Any]] = None
+
     ###
     # Public tracker interface
     ###
@@ -238,13 +253,52 @@ class DialogueStateTracker:
     def past_states(self, domain: Domain) -> List[State]:
         """Generate the past states of this tracker based on the history.
 
+        The states are cached so that repeated calls only compute the states for
+        events which were applied since the previous call. The cache is rebuilt if
+        previously applied events were undone, e.g. by a `Restarted`,
+        `UserUtteranceReverted` or `ActionReverted` event or a loop unhappy path.
+
         Args:
             domain: a :class:`rasa.shared.core.domain.Domain`
 
         Returns:
             a list of states
         """
-        return domain.states_for_tracker_history(self)
+        applied_events = self.applied_events()
+        if not self._can_continue_past_states(domain, applied_events):
+            self._past_states_domain = domain
+            self._past_states_events = []
+            self._past_states_before_actions = []
+            self._past_states_tracker = self.init_copy()
+
+        # same as `generate_all_prior_trackers` but continues with the last tracker
+        for event in applied_events[len(self._past_states_events) :]:
+            if isinstance(event, ActionExecuted):
+                self._past_states_before_actions.append(
+                    domain.get_active_states(self._past_states_tracker)
+                )
+            self._past_states_tracker.update(event)
+        self._past_states_events = applied_events
+
+        states = self._past_states_before_actions + [
+            domain.get_active_states(self._past_states_tracker)
+        ]
+        # the states are copied since callers might modify them
+        return [
+            {state_type: dict(sub_state) for state_type, sub_state in state.items()}
+            for state in states
+        ]
+
+    def _can_continue_past_states(
+        self, domain: Domain, applied_events: List[Event]
+    ) -> bool:
+        """Checks if the cached past states are still valid for `applied_events`."""
+        return (
+            self._past_states_tracker is not None
+            and self._past_states_domain is domain
+            and len(applied_events) >= len(self._past_states_events)
+            and all(map(operator.is_, self._past_states_events, applied_events))
+        )
 
     def change_loop_to(self, loop_name: Text) -> None:
         """Set the currently active loop.
@@ -308,7 +362,11 @@ class DialogueStateTracker:
 
     def current_slot_values(self) -> Dict[Text, Any]:
         """Return the currently set values of the slots"""
-        return {key: slot.value for key, slot in self.slots.items()}
+        if self._slot_values is None or len(self._slot_values) != len(self.slots):
+            self._slot_values = {key: slot.value for key, slot in self.slots.items()}
+
+        # the values are copied since callers might modify them
+        return dict(self._slot_values)
 
     def get_slot(self, key: Text) -> Optional[Any]:
         """Retrieves the value of a slot."""
@@ -405,8 +463,42 @@ class DialogueStateTracker:
         yield tracker
 
     def applied_events(self) -> List[Event]:
-        """Returns all actions that should be applied - w/o reverted events."""
+        """Returns all actions that should be applied - w/o reverted events.
+
+        The applied events are cached until the events of the tracker change.
+        """
+        key = self._applied_events_cache_key()
+        if not self._is_applied_events_cache_valid(key):
+            self._applied_events = self._compute_applied_events()
+            self._applied_events_key = key
+
+        # the events are copied since callers might modify the list
+        return list(self._applied_events)
+
+    def _applied_events_cache_key(self) -> Tuple[int, Tuple[Any, ...]]:
+        """Returns a key which changes whenever the events of the tracker change.
+
+        Events are only ever appended to the tracker (the oldest event might be
+        dropped if `max_event_history` is set) or replaced as a whole, so the number
+        of events together with the first and the last event identify them.
+        """
+        if not self.events:
+            return 0, (self.events,)
+        return len(self.events), (self.events, self.events[0], self.events[-1])
+
+    def _is_applied_events_cache_valid(self, key: Tuple[int, Tuple[Any, ...]]) -> bool:
+        if self._applied_events_key is None:
+            return False
+
+        number_of_events, objects = key
+        cached_number_of_events, cached_objects = self._applied_events_key
+        return (
+            number_of_events == cached_number_of_events
+            and len(objects) == len(cached_objects)
+            and all(map(operator.is_, objects, cached_objects))
+        )
 
+    def _compute_applied_events(self) -> List[Event]:
         loop_names = [
             event.name
             for event in self.events
@@ -686,12 +778,14 @@ class DialogueStateTracker:
 
         for slot in self.slots.values():
             slot.reset()
+        self._slot_values = None
 
     def _set_slot(self, key: Text, value: Any) -> None:
         """Set the value of a slot if that slot exists."""
 
         if key in self.slots:
             self.slots[key].value = value
+            self._slot_values = None
         else:
             logger.error(
                 f"Tried to set non existent slot '{key}'. Make sure you "
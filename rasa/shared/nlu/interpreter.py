@@ -26,6 +26,20 @@ class NaturalLanguageInterpreter:
             "Interpreter needs to be able to parse messages into structured output."
         )
 
+    async def parse_batch(self, texts: List[Text]) -> List[Dict[Text, Any]]:
+        """Parses several texts at once.
+
+        Interpreters which can parse several texts more efficiently than one after
+        another should override this method.
+
+        Args:
+            texts: The texts to parse.
+
+        Returns:
+            The parse results in the same order as `texts`.
+        """
+        return [await self.parse(text) for text in texts]
+
     def featurize_message(self, message: Message) -> Optional[Message]:
         pass
 
@@ -46,6 +46,22 @@ class Message:
             self.output_properties = set()
         self.output_properties.add(TEXT)
 
+    def copy_on_write(self) -> "Message":
+        """Creates a copy which shares the values and features of this message.
+
+        Setting values or adding features only changes the copy, while the values
+        and features themselves aren't copied.
+
+        Returns:
+            The copied message.
+        """
+        return Message(
+            self.data,
+            output_properties=set(self.output_properties),
+            time=self.time,
+            features=list(self.features),
+        )
+
     def add_features(self, features: Optional["Features"]) -> None:
         if features is not None:
             self.features.append(features)
@@ -314,7 +330,9 @@ class Message:
 
         for f in features:
             if combined_features is None:
-                combined_features = copy.deepcopy(f)
+                # combining features creates new feature matrices, hence the matrix
+                # of the first features doesn't have to be copied
+                combined_features = copy.copy(f)
                 combined_features.origin = featurizers
             else:
                 combined_features.combine_with_features(f)
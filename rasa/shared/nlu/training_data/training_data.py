@@ -587,18 +587,42 @@ class TrainingData:
         Returns:
             Itself but without training examples which don't have a text or intent.
         """
-        training_examples = copy.deepcopy(self.training_examples)
+        # the examples are not copied since the returned training data contains the
+        # (possibly already featurized) examples of this training data
         entity_synonyms = self.entity_synonyms.copy()
         regex_features = copy.deepcopy(self.regex_features)
         lookup_tables = copy.deepcopy(self.lookup_tables)
         responses = copy.deepcopy(self.responses)
         copied = TrainingData(
-            training_examples, entity_synonyms, regex_features, lookup_tables, responses
+            None, entity_synonyms, regex_features, lookup_tables, responses
         )
         copied.training_examples = self._training_examples_without_empty_e2e_examples()
 
         return copied
 
+    def copy_on_write(self) -> "TrainingData":
+        """Creates a copy whose examples can be changed without changing this data.
+
+        In contrast to a deep copy, the values and features of the examples are
+        shared (see `Message.copy_on_write`). Setting values or adding features to
+        the examples of the copy doesn't change the examples of this training data.
+
+        Returns:
+            The copied training data.
+        """
+        copied = TrainingData(
+            None,
+            self.entity_synonyms.copy(),
+            copy.deepcopy(self.regex_features),
+            copy.deepcopy(self.lookup_tables),
+            copy.deepcopy(self.responses),
+        )
+        copied.training_examples = [
+            example.copy_on_write() for example in self.training_examples
+        ]
+
+        return copied
+
     def _training_examples_without_empty_e2e_examples(self) -> List[Message]:
         return [
             example
@@ -1,4 +1,5 @@
 import aiohttp
+import asyncio
 import logging
 import os
 from aiohttp.client_exceptions import ContentTypeError
@@ -7,7 +8,11 @@ from typing import Any, Optional, Text, Dict
 
 import rasa.shared.utils.io
 import rasa.utils.io
-from rasa.constants import DEFAULT_REQUEST_TIMEOUT
+from rasa.constants import (
+    DEFAULT_CONNECTION_LIMIT,
+    DEFAULT_CONNECTION_LIMIT_PER_HOST,
+    DEFAULT_REQUEST_TIMEOUT,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -69,7 +74,12 @@ def concat_url(base: Text, subpath: Optional[Text]) -> Text:
 
 
 class EndpointConfig:
-    """Configuration for an external HTTP endpoint."""
+    """Configuration for an external HTTP endpoint.
+
+    By default every request opens its own `aiohttp.ClientSession`. Once
+    `enable_session_pooling` was called, requests share one keep-alive session,
+    which is created with the first request and released with `close`.
+    """
 
     def __init__(
         self,
@@ -79,6 +89,8 @@ class EndpointConfig:
         basic_auth: Dict[Text, Text] = None,
         token: Optional[Text] = None,
         token_name: Text = "token",
+        connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+        connection_limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
         **kwargs,
     ):
         self.url = url
@@ -87,10 +99,20 @@ class EndpointConfig:
         self.basic_auth = basic_auth
         self.token = token
         self.token_name = token_name
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
         self.type = kwargs.pop("store_type", kwargs.pop("type", None))
         self.kwargs = kwargs
 
+        self._pool_sessions = False
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
     def session(self) -> aiohttp.ClientSession:
+        """Creates a new client session with the settings of this endpoint.
+
+        The caller is responsible for closing the session.
+        """
         # create authentication parameters
         if self.basic_auth:
             auth = aiohttp.BasicAuth(
@@ -100,11 +122,52 @@ class EndpointConfig:
             auth = None
 
         return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                limit_per_host=self.connection_limit_per_host,
+            ),
             headers=self.headers,
             auth=auth,
             timeout=aiohttp.ClientTimeout(total=DEFAULT_REQUEST_TIMEOUT),
         )
 
+    def enable_session_pooling(self) -> None:
+        """Makes all requests to the endpoint share one keep-alive client session.
+
+        The owner of the endpoint (e.g. the server) has to release the session
+        with `close` once the endpoint is no longer used.
+        """
+        self._pool_sessions = True
+
+    async def _pooled_session(self) -> aiohttp.ClientSession:
+        """Returns the shared client session, and creates it if necessary.
+
+        A session is bound to the event loop it was created in. If the endpoint is
+        used from a different event loop, the old session is closed and a new one
+        is created.
+        """
+        loop = asyncio.get_event_loop()
+        if self._session_loop is not loop:
+            await self.close()
+
+        if self._session is None or self._session.closed:
+            self._session = self.session()
+            self._session_loop = loop
+
+        return self._session
+
+    async def close(self) -> None:
+        """Closes the shared client session and all of its connections."""
+        if self._session is not None and not self._session.closed:
+            try:
+                await self._session.close()
+            except RuntimeError as e:
+                # the event loop of the session was closed already
+                logger.debug(f"Failed to close the session of '{self.url}': {e}")
+
+        self._session = None
+        self._session_loop = None
+
     def combine_parameters(
         self, kwargs: Optional[Dict[Text, Any]] = None
     ) -> Dict[Text, Any]:
@@ -142,22 +205,39 @@ class EndpointConfig:
             del kwargs["headers"]
 
         url = concat_url(self.url, subpath)
+        params = self.combine_parameters(kwargs)
+
+        if self._pool_sessions:
+            session = await self._pooled_session()
+            return await self._send_request(
+                session, method, url, headers, params, **kwargs
+            )
+
         async with self.session() as session:
-            async with session.request(
-                method,
-                url,
-                headers=headers,
-                params=self.combine_parameters(kwargs),
-                **kwargs,
-            ) as response:
-                if response.status >= 400:
-                    raise ClientResponseError(
-                        response.status, response.reason, await response.content.read()
-                    )
-                try:
-                    return await response.json()
-                except ContentTypeError:
-                    return None
+            return await self._send_request(
+                session, method, url, headers, params, **kwargs
+            )
+
+    @staticmethod
+    async def _send_request(
+        session: aiohttp.ClientSession,
+        method: Text,
+        url: Text,
+        headers: Dict[Text, Any],
+        params: Dict[Text, Any],
+        **kwargs: Any,
+    ) -> Optional[Any]:
+        async with session.request(
+            method, url, headers=headers, params=params, **kwargs
+        ) as response:
+            if response.status >= 400:
+                raise ClientResponseError(
+                    response.status, response.reason, await response.content.read()
+                )
+            try:
+                return await response.json()
+            except ContentTypeError:
+                return None
 
     @classmethod
     def from_dict(cls, data) -> "EndpointConfig":
@@ -171,6 +251,8 @@ class EndpointConfig:
             self.basic_auth,
             self.token,
             self.token_name,
+            self.connection_limit,
+            self.connection_limit_per_host,
             **self.kwargs,
         )
 
@@ -292,13 +292,24 @@ class RasaModel(tf.keras.models.Model):
             predict_data.as_tf_dataset, self.batch_predict, eager, "prediction"
         )
 
-    def predict(self, predict_data: RasaModelData) -> Dict[Text, tf.Tensor]:
+    def predict(
+        self, predict_data: RasaModelData, batch_size: int = 1
+    ) -> Dict[Text, tf.Tensor]:
+        """Predicts the outputs for the first `batch_size` examples of `predict_data`.
+
+        Args:
+            predict_data: The data to predict on.
+            batch_size: Number of examples which are predicted in a single batch.
+
+        Returns:
+            The model outputs for the batch.
+        """
         if self._predict_function is None:
             logger.debug("There is no tensorflow prediction graph.")
             self.build_for_predict(predict_data)
 
-        # Prepare a single batch of size 1
-        batch_in = predict_data.prepare_batch(start=0, end=1)
+        # Prepare a single (padded) batch
+        batch_in = predict_data.prepare_batch(start=0, end=batch_size)
 
         self._training = False  # needed for eager mode
         return self._predict_function(batch_in)
@@ -1,5 +1,6 @@
 import asyncio
 import os
+from collections import OrderedDict
 
 from sanic.request import Request
 import uuid
@@ -19,7 +20,11 @@ from rasa.core.policies.ensemble import PolicyEnsemble
 from rasa.core.policies.memoization import Policy
 from rasa.core.processor import MessageProcessor
 from rasa.shared.core.slots import Slot
-from rasa.core.tracker_store import InMemoryTrackerStore, MongoTrackerStore
+from rasa.core.tracker_store import (
+    InMemoryTrackerStore,
+    MongoTrackerStore,
+    RedisTrackerStore,
+)
 from rasa.shared.core.trackers import DialogueStateTracker
 
 DEFAULT_DOMAIN_PATH_WITH_SLOTS = "data/test_domains/default_with_slots.yml"
@@ -91,6 +96,26 @@ class MockedMongoTrackerStore(MongoTrackerStore):
         super(MongoTrackerStore, self).__init__(_domain, None)
 
 
+class MockedRedisEventLogTrackerStore(RedisTrackerStore):
+    """In-memory mocked version of `RedisTrackerStore` which uses event logs."""
+
+    def __init__(self, _domain: Domain):
+        import fakeredis
+
+        self.red = fakeredis.FakeStrictRedis()
+        self.record_exp = None
+        self.use_event_log = True
+        self._event_log_states = OrderedDict()
+
+        # added in redis==3.3.0, but not yet in fakeredis
+        self.red.connection_pool.connection_class.health_check_interval = 0
+
+        # skipcq: PYL-E1003
+        # Skip `RedisTrackerStore` constructor to avoid that actual Redis connection
+        # is created.
+        super(RedisTrackerStore, self).__init__(_domain, None)
+
+
 # https://github.com/pytest-dev/pytest-asyncio/issues/68
 # this event_loop is used by pytest-asyncio, and redefining it
 # is currently the only way of changing the scope of this fixture
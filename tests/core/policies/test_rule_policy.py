@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 from typing import List, Text
 
@@ -18,6 +19,11 @@ from rasa.shared.core.constants import (
     ACTION_BACK_NAME,
     RULE_SNIPPET_ACTION_NAME,
     REQUESTED_SLOT,
+    SHOULD_NOT_BE_SET,
+    PREVIOUS_ACTION,
+    ACTIVE_LOOP,
+    USER,
+    SLOTS,
 )
 from rasa.shared.core.domain import Domain
 from rasa.shared.core.events import (
@@ -30,7 +36,7 @@ from rasa.shared.core.events import (
 )
 from rasa.shared.nlu.interpreter import RegexInterpreter
 from rasa.core.nlg import TemplatedNaturalLanguageGenerator
-from rasa.core.policies.rule_policy import RulePolicy, InvalidRule
+from rasa.core.policies.rule_policy import RulePolicy, InvalidRule, RULES
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.core.generator import TrackerWithCachedStates
 
@@ -223,6 +229,52 @@ def test_all_policy_attributes_are_persisted(tmpdir: Path):
     assert persisted_policy._enable_fallback_prediction == enable_fallback_prediction
 
 
+def test_rule_index_matches_all_applicable_rules():
+    listen = {"action_name": ACTION_LISTEN_NAME}
+    greet_state = {USER: {"intent": "greet"}, PREVIOUS_ACTION: listen}
+    affirm_state = {USER: {"intent": "affirm"}, PREVIOUS_ACTION: listen}
+    after_ask_state = {PREVIOUS_ACTION: {"action_name": "utter_ask"}}
+    after_greet_state = {PREVIOUS_ACTION: {"action_name": "utter_greet"}}
+
+    rules = [
+        [greet_state],
+        [{}, greet_state],
+        [after_ask_state, affirm_state],
+        [
+            {USER: {"intent": "greet"}, ACTIVE_LOOP: {"name": SHOULD_NOT_BE_SET}},
+            after_greet_state,
+        ],
+        [{SLOTS: {"name": [1.0]}, PREVIOUS_ACTION: listen}],
+        [{ACTIVE_LOOP: {"name": SHOULD_NOT_BE_SET}}],
+    ]
+    lookup = {
+        json.dumps(rule, sort_keys=True): f"action_{i}" for i, rule in enumerate(rules)
+    }
+    policy = RulePolicy(lookup={RULES: lookup})
+
+    conversations = [
+        [],
+        [{}],
+        [greet_state],
+        [{}, greet_state],
+        [after_ask_state, affirm_state],
+        [{USER: {"intent": "greet"}, ACTIVE_LOOP: {"name": "form"}}, after_greet_state],
+        [{USER: {"intent": "greet"}}, after_greet_state],
+        [{SLOTS: {"name": (1.0,)}, PREVIOUS_ACTION: listen}],
+    ]
+
+    for states in conversations:
+        expected = set(lookup.keys())
+        for i, state in enumerate(reversed(states)):
+            # noinspection PyProtectedMember
+            expected = {
+                key for key in expected if policy._is_rule_applicable(key, i, state)
+            }
+
+        # noinspection PyProtectedMember
+        assert policy._get_possible_keys(lookup, states) == expected
+
+
 def test_faq_rule():
     domain = Domain.from_yaml(
         f"""
@@ -1,6 +1,8 @@
+import json
 from typing import List
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 from aioresponses import aioresponses
 
 import rasa.core
@@ -33,6 +35,7 @@ from rasa.shared.core.events import (
     UserUttered,
 )
 from rasa.core.nlg.template import TemplatedNaturalLanguageGenerator
+from rasa.core.tracker_store import SQLTrackerStore
 from rasa.shared.core.constants import (
     USER_INTENT_SESSION_START,
     ACTION_LISTEN_NAME,
@@ -234,6 +237,157 @@ async def test_remote_action_logs_events(
     assert events[2] == SlotSet("name", "rasa")
 
 
+async def test_remote_action_sends_compact_payload(
+    default_channel, default_nlg, default_domain, monkeypatch: MonkeyPatch
+):
+    monkeypatch.setattr(action, "_acknowledged_payloads", {})
+    endpoint = EndpointConfig(
+        "https://example.com/webhooks/actions", compact_payload=True
+    )
+    tracker = DialogueStateTracker.from_events(
+        "my-sender", [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hi")]
+    )
+
+    with aioresponses() as mocked:
+        mocked.post(
+            "https://example.com/webhooks/actions",
+            payload={
+                "events": [],
+                "responses": [],
+                "acknowledged": {
+                    "domain_fingerprint": default_domain.fingerprint,
+                    "number_of_events": 2,
+                },
+            },
+            repeat=True,
+        )
+
+        await action.RemoteAction("my_action", endpoint).run(
+            default_channel, default_nlg, tracker, default_domain
+        )
+        tracker.update(ActionExecuted("my_action"))
+        await action.RemoteAction("my_action", endpoint).run(
+            default_channel, default_nlg, tracker, default_domain
+        )
+
+        r = latest_request(mocked, "post", "https://example.com/webhooks/actions")
+
+    full_payload, compact_payload = [request.kwargs["json"] for request in r]
+
+    assert full_payload["domain"] == default_domain.as_dict()
+    assert full_payload["tracker"]["events_offset"] == 0
+    assert len(full_payload["tracker"]["events"]) == 2
+
+    assert "domain" not in compact_payload
+    assert compact_payload["domain_fingerprint"] == default_domain.fingerprint
+    assert compact_payload["tracker"]["events_offset"] == 2
+    assert compact_payload["tracker"]["events"] == [
+        ActionExecuted("my_action").as_dict()
+    ]
+    assert len(json.dumps(compact_payload)) < len(json.dumps(full_payload))
+
+
+async def test_remote_action_falls_back_to_full_payload(
+    default_channel, default_nlg, default_domain, monkeypatch: MonkeyPatch
+):
+    tracker = DialogueStateTracker.from_events(
+        "my-sender", [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hi")]
+    )
+    acknowledged = action.AcknowledgedPayload()
+    acknowledged.update(
+        tracker,
+        {"domain_fingerprint": default_domain.fingerprint, "number_of_events": 1},
+    )
+    monkeypatch.setattr(
+        action,
+        "_acknowledged_payloads",
+        {"https://example.com/webhooks/actions": acknowledged},
+    )
+    endpoint = EndpointConfig(
+        "https://example.com/webhooks/actions", compact_payload=True
+    )
+
+    with aioresponses() as mocked:
+        # the action server doesn't know the conversation anymore
+        mocked.post("https://example.com/webhooks/actions", status=409)
+        mocked.post(
+            "https://example.com/webhooks/actions",
+            payload={"events": [], "responses": []},
+        )
+
+        await action.RemoteAction("my_action", endpoint).run(
+            default_channel, default_nlg, tracker, default_domain
+        )
+
+        r = latest_request(mocked, "post", "https://example.com/webhooks/actions")
+
+    assert len(r) == 2
+    assert "domain" not in r[0].kwargs["json"]
+
+    full_payload = json_of_latest_request(r)
+    assert full_payload["domain"] == default_domain.as_dict()
+    assert full_payload["tracker"]["events_offset"] == 0
+    assert len(full_payload["tracker"]["events"]) == 2
+
+
+async def test_remote_action_sends_full_payload_after_session_restart(
+    default_channel, default_nlg, default_domain, monkeypatch: MonkeyPatch
+):
+    monkeypatch.setattr(action, "_acknowledged_payloads", {})
+    endpoint = EndpointConfig(
+        "https://example.com/webhooks/actions", compact_payload=True
+    )
+    # only loads the events of the latest conversation session
+    tracker_store = SQLTrackerStore(default_domain)
+    tracker = DialogueStateTracker.from_events(
+        "my-sender",
+        [
+            ActionExecuted(ACTION_LISTEN_NAME, timestamp=1),
+            UserUttered("hi", timestamp=2),
+        ],
+    )
+    tracker_store.save(tracker)
+
+    with aioresponses() as mocked:
+        mocked.post(
+            "https://example.com/webhooks/actions",
+            payload={
+                "events": [],
+                "responses": [],
+                "acknowledged": {
+                    "domain_fingerprint": default_domain.fingerprint,
+                    "number_of_events": 2,
+                },
+            },
+            repeat=True,
+        )
+
+        await action.RemoteAction("my_action", endpoint).run(
+            default_channel, default_nlg, tracker, default_domain
+        )
+
+        for event in [
+            ActionExecuted(ACTION_SESSION_START_NAME, timestamp=3),
+            SessionStarted(timestamp=4),
+            ActionExecuted(ACTION_LISTEN_NAME, timestamp=5),
+            UserUttered("hi again", timestamp=6),
+        ]:
+            tracker.update(event)
+        tracker_store.save(tracker)
+        tracker = tracker_store.retrieve("my-sender")
+
+        await action.RemoteAction("my_action", endpoint).run(
+            default_channel, default_nlg, tracker, default_domain
+        )
+
+        r = latest_request(mocked, "post", "https://example.com/webhooks/actions")
+
+    # the acknowledged events aren't the first events of the retrieved tracker
+    payload = json_of_latest_request(r)
+    assert payload["tracker"]["events_offset"] == 0
+    assert payload["tracker"]["events"] == [event.as_dict() for event in tracker.events]
+
+
 async def test_remote_action_utterances_with_none_values(
     default_channel, default_tracker, default_domain
 ):
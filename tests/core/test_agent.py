@@ -1,4 +1,5 @@
 import asyncio
+import logging
 from typing import Any, Dict, Text, List, Callable, Optional
 from unittest.mock import Mock
 
@@ -228,6 +229,31 @@ async def test_load_agent(trained_rasa_model: Text):
     assert agent.model_directory is not None
 
 
+async def test_load_agent_warms_up_model(
+    trained_rasa_model: Text, monkeypatch: MonkeyPatch
+):
+    warm_up = Mock()
+    monkeypatch.setattr(rasa.core.agent, "_warm_up_model", warm_up)
+
+    agent = await load_agent(model_path=trained_rasa_model)
+
+    warm_up.assert_called_once_with(
+        agent.domain, agent.policy_ensemble, agent.interpreter
+    )
+    assert agent.model_load_time > 0
+
+
+async def test_warm_up_model(trained_rasa_model: Text, caplog: LogCaptureFixture):
+    agent = await load_agent(model_path=trained_rasa_model)
+
+    with caplog.at_level(logging.WARNING):
+        rasa.core.agent._warm_up_model(
+            agent.domain, agent.policy_ensemble, agent.interpreter
+        )
+
+    assert "Failed to warm up" not in caplog.text
+
+
 @pytest.mark.parametrize(
     "policy_config", [{"policies": [{"name": "MemoizationPolicy"}]}]
 )
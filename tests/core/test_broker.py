@@ -3,7 +3,8 @@ import logging
 from pathlib import Path
 import textwrap
 
-from typing import Union, Text, List, Optional, Type
+from typing import Dict, Union, Text, List, Optional, Type
+from unittest.mock import Mock
 
 import pytest
 from _pytest.logging import LogCaptureFixture
@@ -56,6 +57,34 @@ def test_pika_message_property_app_id(monkeypatch: MonkeyPatch):
     assert pika_producer._get_message_properties().app_id == rasa_environment
 
 
+# noinspection PyProtectedMember
+def test_pika_publish_many_resumes_after_failure(monkeypatch: MonkeyPatch):
+    # patch PikaEventBroker so it doesn't try to connect to RabbitMQ on init
+    monkeypatch.setattr(PikaEventBroker, "_run_pika", lambda _: None)
+    pika_producer = PikaEventBroker("", "", "")
+
+    # the second event fails once
+    published_bodies = []
+    failures = [ValueError()]
+
+    def _publish(body: Text, headers: Optional[Dict[Text, Text]] = None) -> None:
+        if len(published_bodies) == 1 and failures:
+            raise failures.pop()
+        published_bodies.append(body)
+
+    monkeypatch.setattr(pika_producer, "_publish", _publish)
+
+    pika_producer.publish_many(
+        [e.as_dict() for e in TEST_EVENTS], retry_delay_in_seconds=0
+    )
+
+    assert [json.loads(body)["event"] for body in published_bodies] == [
+        "user",
+        "slot",
+        "restart",
+    ]
+
+
 @pytest.mark.parametrize(
     "queues_arg,expected,warning",
     [
@@ -120,6 +149,25 @@ def test_sql_broker_logs_to_sql_db():
     assert events_types == ["user", "slot", "restart"]
 
 
+def test_sql_broker_publishes_many_events_to_sql_db():
+    cfg = read_endpoint_config(
+        "data/test_endpoints/event_brokers/sql_endpoint.yml", "event_broker"
+    )
+    actual = EventBroker.create(cfg)
+
+    actual.publish_many([{"sender_id": "test", **e.as_dict()} for e in TEST_EVENTS])
+
+    with actual.session_scope() as session:
+        stored_events = session.query(actual.SQLBrokerEvent).all()
+
+    assert [json.loads(event.data)["event"] for event in stored_events] == [
+        "user",
+        "slot",
+        "restart",
+    ]
+    assert all(event.sender_id == "test" for event in stored_events)
+
+
 def test_file_broker_from_config(tmp_path: Path):
     # backslashes need to be encoded (windows...) otherwise we run into unicode issues
     path = str(tmp_path / "rasa_test_event.log").replace("\\", "\\\\")
@@ -158,6 +206,21 @@ def test_file_broker_logs_to_file(tmp_path: Path):
     assert recovered == TEST_EVENTS
 
 
+def test_file_broker_publishes_many_events_to_file(tmp_path: Path):
+    log_file_path = str(tmp_path / "events.log")
+
+    actual = EventBroker.create(
+        EndpointConfig(**{"type": "file", "path": log_file_path})
+    )
+
+    actual.publish_many([e.as_dict() for e in TEST_EVENTS])
+
+    with open(log_file_path, "r") as log_file:
+        recovered = [Event.from_parameters(json.loads(line)) for line in log_file]
+
+    assert recovered == TEST_EVENTS
+
+
 def test_file_broker_properly_logs_newlines(tmp_path):
     log_file_path = str(tmp_path / "events.log")
 
@@ -213,6 +276,30 @@ def test_kafka_broker_from_config():
     assert actual.topic == expected.topic
 
 
+def test_kafka_broker_reuses_producer(monkeypatch: MonkeyPatch):
+    import kafka
+
+    producer_class = Mock()
+    monkeypatch.setattr(kafka, "KafkaProducer", producer_class)
+
+    broker = KafkaEventBroker("localhost", topic="topic", linger_ms=10)
+    broker.publish({"event": "user"})
+    broker.publish({"event": "bot"})
+
+    producer_class.assert_called_once()
+    assert producer_class.call_args[1]["linger_ms"] == 10
+
+    producer = producer_class.return_value
+    assert producer.send.call_count == 2
+    producer.close.assert_not_called()
+
+    broker.close()
+
+    producer.flush.assert_called_once()
+    producer.close.assert_called_once()
+    assert broker.producer is None
+
+
 def test_no_pika_logs_if_no_debug_mode(caplog: LogCaptureFixture):
     from rasa.core.brokers import pika
 
@@ -3,6 +3,7 @@ from typing import List, Any, Text
 
 import pytest
 import copy
+from _pytest.monkeypatch import MonkeyPatch
 
 from rasa.shared.nlu.interpreter import NaturalLanguageInterpreter, RegexInterpreter
 
@@ -22,7 +23,7 @@ from rasa.core.policies.rule_policy import RulePolicy
 import rasa.core.actions.action
 
 from tests.core import utilities
-from rasa.core.constants import FORM_POLICY_PRIORITY
+from rasa.core.constants import FORM_POLICY_PRIORITY, POLICY_PREDICTION_THREADS
 from rasa.shared.core.events import ActionExecuted
 from rasa.core.policies.two_stage_fallback import TwoStageFallbackPolicy
 from rasa.core.policies.mapping_policy import MappingPolicy
@@ -135,6 +136,80 @@ def test_policy_priority():
     assert result == priority_2_result
 
 
+class EventAddingPolicy(ConstantPolicy):
+    ADDS_EVENTS_DURING_PREDICTION = True
+
+    def predict_action_probabilities(
+        self,
+        tracker: DialogueStateTracker,
+        domain: Domain,
+        interpreter: NaturalLanguageInterpreter,
+        **kwargs: Any,
+    ) -> List[float]:
+        tracker.update(ActiveLoop(f"loop_{self.predict_index}"))
+        return super().predict_action_probabilities(tracker, domain, interpreter)
+
+
+def test_concurrent_policy_predictions():
+    domain = Domain.load("data/test_domains/default.yml")
+    policies = [
+        EventAddingPolicy(priority=1, predict_index=0),
+        ConstantPolicy(priority=3, predict_index=1),
+        EventAddingPolicy(priority=2, predict_index=2),
+    ]
+
+    sequential_tracker = DialogueStateTracker.from_events("test", [UserUttered("hi")])
+    sequential_result = SimplePolicyEnsemble(
+        policies, prediction_threads=1
+    ).probabilities_using_best_policy(sequential_tracker, domain, RegexInterpreter())
+
+    concurrent_tracker = DialogueStateTracker.from_events("test", [UserUttered("hi")])
+    concurrent_result = SimplePolicyEnsemble(
+        policies, prediction_threads=3
+    ).probabilities_using_best_policy(concurrent_tracker, domain, RegexInterpreter())
+
+    assert concurrent_result == sequential_result
+    assert concurrent_result[1] == "policy_1_ConstantPolicy"
+    # events added by the policies are applied in the order of the policies
+    assert list(concurrent_tracker.events) == list(sequential_tracker.events)
+
+
+def test_prediction_threads_from_environment(monkeypatch: MonkeyPatch):
+    monkeypatch.setenv(POLICY_PREDICTION_THREADS, "4")
+
+    ensemble = SimplePolicyEnsemble([ConstantPolicy(priority=1, predict_index=0)])
+
+    assert ensemble.prediction_threads == 4
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "many"])
+def test_invalid_prediction_threads_from_environment(
+    monkeypatch: MonkeyPatch, value: Text
+):
+    monkeypatch.setenv(POLICY_PREDICTION_THREADS, value)
+
+    with pytest.raises(InvalidPolicyConfig):
+        SimplePolicyEnsemble([ConstantPolicy(priority=1, predict_index=0)])
+
+
+def test_concurrent_policy_predictions_with_capped_tracker():
+    domain = Domain.load("data/test_domains/default.yml")
+    policies = [
+        EventAddingPolicy(priority=1, predict_index=0),
+        ConstantPolicy(priority=2, predict_index=1),
+    ]
+    tracker = DialogueStateTracker.from_events(
+        "test", [UserUttered("hi")], max_event_history=1
+    )
+
+    SimplePolicyEnsemble(
+        policies, prediction_threads=2
+    ).probabilities_using_best_policy(tracker, domain, RegexInterpreter())
+
+    # the event is kept although the tracker was full before the prediction
+    assert list(tracker.events) == [ActiveLoop("loop_0")]
+
+
 def test_fallback_mapping_restart():
     domain = Domain.load("data/test_domains/default.yml")
     events = [
@@ -6,6 +6,7 @@ from pathlib import Path
 import numpy as np
 import pytest
 import time
+from typing import Any, Callable
 
 from _pytest.monkeypatch import MonkeyPatch
 from _pytest.tmpdir import TempdirFactory
@@ -137,6 +138,28 @@ def test_lock_expiration(lock_store: LockStore):
     assert lock.issue_ticket(10) == 1
 
 
+@pytest.mark.parametrize("lock_store", [InMemoryLockStore(), FakeRedisLockStore()])
+async def test_lock_is_acquired_once_released(lock_store: LockStore):
+    conversation_id = "my id 3"
+    holdup = 0.05
+
+    async def hold_lock() -> None:
+        async with lock_store.lock(conversation_id):
+            await asyncio.sleep(holdup)
+
+    holder = asyncio.ensure_future(hold_lock())
+    # let the holder acquire the lock first
+    await asyncio.sleep(0)
+
+    start_time = time.time()
+    # the waiting time wouldn't pass if the release didn't wake up the waiter
+    async with lock_store.lock(conversation_id, wait_time_in_seconds=10):
+        assert time.time() - start_time < 1
+
+    await holder
+    assert not lock_store.get_lock(conversation_id)
+
+
 async def test_multiple_conversation_ids(default_agent: Agent):
     text = INTENT_MESSAGE_PREFIX + 'greet{"name":"Rasa"}'
 
@@ -279,11 +302,109 @@ async def test_redis_lock_store_timeout(monkeypatch: MonkeyPatch):
 
     lock_store = FakeRedisLockStore()
     monkeypatch.setattr(
-        lock_store,
-        lock_store.get_or_create_lock.__name__,
-        Mock(side_effect=redis.exceptions.TimeoutError),
+        lock_store.red, "pipeline", Mock(side_effect=redis.exceptions.TimeoutError)
     )
 
     with pytest.raises(LockError):
         async with lock_store.lock("some sender"):
             pass
+
+
+def test_redis_lock_store_issues_unique_tickets():
+    lock_store = FakeRedisLockStore()
+    # a second worker which uses the same Redis instance
+    other_lock_store = FakeRedisLockStore()
+    other_lock_store.red = lock_store.red
+
+    conversation_id = "my id 4"
+    tickets = [
+        store.issue_ticket(conversation_id, 10)
+        for store in [lock_store, other_lock_store, lock_store]
+    ]
+    assert tickets == [0, 1, 2]
+
+    lock = other_lock_store.get_lock(conversation_id)
+    assert lock.now_serving == 0
+    assert lock.last_issued == 2
+
+    lock_store.cleanup(conversation_id, 0)
+    assert other_lock_store.get_lock(conversation_id).now_serving == 1
+    assert other_lock_store.issue_ticket(conversation_id, 10) == 3
+
+
+def test_redis_lock_store_issues_tickets_atomically(monkeypatch: MonkeyPatch):
+    import fakeredis
+
+    server = fakeredis.FakeServer()
+    lock_store = FakeRedisLockStore()
+    lock_store.red = fakeredis.FakeStrictRedis(server=server)
+    # a second worker which uses the same Redis server with its own connection
+    other_lock_store = FakeRedisLockStore()
+    other_lock_store.red = fakeredis.FakeStrictRedis(server=server)
+
+    conversation_id = "my id 6"
+    other_tickets = []
+    create_pipeline = lock_store.red.pipeline
+
+    def interleaving_pipeline(*args: Any, **kwargs: Any) -> Any:
+        pipeline = create_pipeline(*args, **kwargs)
+
+        def interleave(send_command: Callable) -> Callable:
+            def send(*command_args: Any, **command_kwargs: Any) -> Any:
+                result = send_command(*command_args, **command_kwargs)
+                if not other_tickets:
+                    # the other worker issues a ticket and checks whether it holds
+                    # the lock while the first worker is issuing its ticket
+                    ticket = other_lock_store.issue_ticket(conversation_id, 10)
+                    lock = other_lock_store.get_lock(conversation_id)
+                    other_tickets.append((ticket, lock.now_serving))
+                return result
+
+            return send
+
+        pipeline.immediate_execute_command = interleave(
+            pipeline.immediate_execute_command
+        )
+        pipeline.execute = interleave(pipeline.execute)
+        return pipeline
+
+    monkeypatch.setattr(lock_store.red, "pipeline", interleaving_pipeline)
+
+    ticket = lock_store.issue_ticket(conversation_id, 10)
+
+    # the other worker acquired the lock with the first ticket, hence the ticket
+    # which was issued concurrently has to be served after it
+    assert other_tickets == [(0, 0)]
+    assert ticket == 1
+    assert lock_store.get_lock(conversation_id).now_serving == 0
+
+
+def test_redis_lock_store_deletes_lock_once_released():
+    lock_store = FakeRedisLockStore()
+    other_lock_store = FakeRedisLockStore()
+    other_lock_store.red = lock_store.red
+
+    conversation_id = "my id 7"
+    ticket = lock_store.issue_ticket(conversation_id, 10)
+    other_ticket = other_lock_store.issue_ticket(conversation_id, 10)
+
+    lock_store.cleanup(conversation_id, ticket)
+    assert other_lock_store.get_lock(conversation_id).now_serving == other_ticket
+
+    other_lock_store.cleanup(conversation_id, other_ticket)
+    assert not lock_store.get_lock(conversation_id)
+    assert lock_store.issue_ticket(conversation_id, 10) == 0
+
+
+def test_redis_lock_store_removes_expired_tickets():
+    lock_store = FakeRedisLockStore()
+    conversation_id = "my id 5"
+
+    lock_store.issue_ticket(conversation_id, 0.001)
+    ticket = lock_store.issue_ticket(conversation_id, 10)
+    time.sleep(0.002)
+
+    assert lock_store.get_lock(conversation_id).now_serving == ticket
+
+    lock_store.cleanup(conversation_id, ticket)
+    assert not lock_store.is_someone_waiting(conversation_id)
@@ -9,6 +9,7 @@ from rasa.core.nlg.callback import (
     nlg_request_format_spec,
     CallbackNaturalLanguageGenerator,
 )
+from rasa.core.nlg import interpolator
 from rasa.core.nlg.template import TemplatedNaturalLanguageGenerator
 from rasa.utils.endpoints import EndpointConfig, read_endpoint_config
 from rasa.core.agent import Agent
@@ -309,3 +310,82 @@ def test_nlg_fill_template_quick_replies(
         filled_slots={quick_replies_slot_name: quick_replies_slot_value},
     )
     assert result == {"quick_replies": str(quick_replies_slot_value)}
+
+
+@pytest.mark.parametrize(
+    "template_text",
+    [
+        "{slot_1} and {slot_2}",
+        '{{"variable":"{slot_1}"}}',
+        "{{slot_1}}",
+        "{{{slot_1}}}",
+        "{missing_slot}",
+        "{tag.with.dot} {0}",
+        "no placeholders",
+        "{slot_1",
+    ],
+)
+def test_compiled_text_fills_like_interpolate_text(template_text: Text):
+    values = {"slot_1": "foo", "slot_2": 5, "tag.with.dot": None}
+
+    assert interpolator.CompiledText(template_text).fill(
+        values
+    ) == interpolator.interpolate_text(template_text, values)
+
+
+def test_nlg_generate_from_slots_prefers_channel_templates():
+    t = TemplatedNaturalLanguageGenerator(
+        templates={
+            "utter_greet": [
+                {"text": "Hey {name}!", "channel": "slack"},
+                {"text": "Hello {name}!"},
+            ]
+        }
+    )
+
+    assert t.generate_from_slots("utter_greet", {"name": "Rasa"}, "slack") == {
+        "text": "Hey Rasa!",
+        "channel": "slack",
+    }
+    assert t.generate_from_slots("utter_greet", {"name": "Rasa"}, "rest") == {
+        "text": "Hello Rasa!"
+    }
+    assert t.generate_from_slots("utter_unknown", {}, "rest") is None
+
+
+def test_nlg_generate_from_slots_does_not_change_templates():
+    template = {
+        "text": "Hi {name}",
+        "buttons": [{"title": "{name}", "payload": '/greet{{"name": "{name}"}}'}],
+        "custom": {"blocks": [{"text": "{name}"}], "count": 1},
+    }
+    t = TemplatedNaturalLanguageGenerator(templates={"utter_greet": [template]})
+
+    result = t.generate_from_slots("utter_greet", {"name": "Rasa"}, "rest")
+
+    assert result == {
+        "text": "Hi Rasa",
+        "buttons": [{"title": "Rasa", "payload": '/greet{"name": "Rasa"}'}],
+        "custom": {"blocks": [{"text": "Rasa"}], "count": 1},
+    }
+    assert t.templates["utter_greet"][0]["custom"]["blocks"][0]["text"] == "{name}"
+
+    t.templates = {"utter_greet": [{"text": "Bye {name}"}]}
+
+    assert t.generate_from_slots("utter_greet", {"name": "Rasa"}, "rest") == {
+        "text": "Bye Rasa"
+    }
+
+
+def test_nlg_generate_from_slots_with_templates_added_later():
+    templates = {"utter_greet": [{"text": "Hello!"}]}
+    t = TemplatedNaturalLanguageGenerator(templates=templates)
+    assert t.generate_from_slots("utter_greet", {}, "rest") == {"text": "Hello!"}
+
+    templates["utter_bye"] = [{"text": "Bye {name}!"}]
+    templates["utter_greet"] = [{"text": "Hey!"}]
+
+    assert t.generate_from_slots("utter_bye", {"name": "Rasa"}, "rest") == {
+        "text": "Bye Rasa!"
+    }
+    assert t.generate_from_slots("utter_greet", {}, "rest") == {"text": "Hey!"}
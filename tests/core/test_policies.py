@@ -633,6 +633,30 @@ class TestMemoizationPolicy(PolicyTestCollection):
         recalled = trained_policy.recall(states, tracker, default_domain)
         assert recalled is not None
 
+    def test_persisted_lookup_is_restored(
+        self, trained_policy: MemoizationPolicy, tmp_path: Path
+    ):
+        trained_policy.persist(str(tmp_path))
+        loaded = trained_policy.__class__.load(str(tmp_path))
+
+        assert loaded.lookup == trained_policy.lookup
+
+    def test_recall_with_legacy_lookup(self, trained_policy: MemoizationPolicy):
+        states = [
+            {
+                PREVIOUS_ACTION: {ACTION_NAME: ACTION_LISTEN_NAME},
+                USER: {INTENT: "greet"},
+            }
+        ]
+        # noinspection PyProtectedMember
+        legacy_lookup = {
+            trained_policy._create_legacy_feature_key(states): "utter_greet"
+        }
+        policy = trained_policy.__class__(lookup=legacy_lookup)
+
+        # noinspection PyProtectedMember
+        assert policy._recall_states(states) == "utter_greet"
+
 
 class TestAugmentedMemoizationPolicy(TestMemoizationPolicy):
     def create_policy(self, featurizer, priority):
@@ -604,6 +604,38 @@ async def test_get_tracker_with_session_start(
     ]
 
 
+async def test_execute_action_reuses_given_tracker(
+    default_channel: CollectingOutputChannel, default_processor: MessageProcessor
+):
+    sender_id = uuid.uuid4().hex
+    tracker = await default_processor.get_tracker_with_session_start(
+        sender_id, default_channel
+    )
+
+    with patch.object(
+        default_processor.tracker_store,
+        "retrieve",
+        wraps=default_processor.tracker_store.retrieve,
+    ) as retrieve:
+        executed_tracker = await default_processor.execute_action(
+            sender_id,
+            "utter_greet",
+            default_channel,
+            default_processor.nlg,
+            None,
+            1.0,
+            tracker,
+        )
+
+    retrieve.assert_not_called()
+    assert executed_tracker is tracker
+    assert tracker.latest_action_name == "utter_greet"
+
+    # the tracker was saved once the action was run
+    stored_tracker = default_processor.tracker_store.retrieve(sender_id)
+    assert stored_tracker.events[-1] == tracker.events[-1]
+
+
 async def test_handle_message_with_session_start(
     default_channel: CollectingOutputChannel,
     default_processor: MessageProcessor,
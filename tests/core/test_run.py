@@ -7,7 +7,9 @@ from sanic import Sanic
 from asyncio import AbstractEventLoop
 from pathlib import Path
 from rasa.core import run, interpreter, policies
+from rasa.core.channels.callback import CallbackInput
 from rasa.core.utils import AvailableEndpoints
+from rasa.utils.endpoints import EndpointConfig
 
 CREDENTIALS_FILE = "examples/moodbot/credentials.yml"
 
@@ -82,3 +84,23 @@ async def test_load_agent_on_start_with_bad_model_file(
     assert isinstance(agent.interpreter, rasa.shared.nlu.interpreter.RegexInterpreter)
     assert agent.policy_ensemble is None
     assert isinstance(agent.domain, rasa.shared.core.domain.Domain)
+
+
+async def test_close_http_sessions_of_pooled_endpoints(
+    rasa_server: Sanic, loop: AbstractEventLoop
+):
+    action_endpoint = EndpointConfig("https://example.com/webhook")
+    callback_endpoint = EndpointConfig("https://example.com/callback")
+    other_endpoint = EndpointConfig("https://example.com/other")
+
+    pooled_endpoints = run.pool_http_sessions(
+        AvailableEndpoints(action=action_endpoint), [CallbackInput(callback_endpoint)],
+    )
+    assert pooled_endpoints == [callback_endpoint, action_endpoint]
+
+    sessions = [await endpoint._pooled_session() for endpoint in pooled_endpoints]
+
+    await run.close_http_sessions(pooled_endpoints, rasa_server, loop)
+
+    assert all(session.closed for session in sessions)
+    assert not other_endpoint._pool_sessions
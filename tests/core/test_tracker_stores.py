@@ -41,7 +41,11 @@ from rasa.core.tracker_store import (
 )
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.utils.endpoints import EndpointConfig, read_endpoint_config
-from tests.core.conftest import DEFAULT_ENDPOINTS_FILE, MockedMongoTrackerStore
+from tests.core.conftest import (
+    DEFAULT_ENDPOINTS_FILE,
+    MockedMongoTrackerStore,
+    MockedRedisEventLogTrackerStore,
+)
 
 domain = Domain.load("data/test_domains/default.yml")
 
@@ -556,9 +560,105 @@ def test_sql_additional_events_with_session_start(default_domain: Domain):
         assert isinstance(additional_events[0], UserUttered)
 
 
+def test_sql_save_uses_cached_event_count(
+    default_domain: Domain, monkeypatch: MonkeyPatch
+):
+    tracker_store = SQLTrackerStore(default_domain)
+    sender_id = uuid.uuid4().hex
+    tracker_store.save(
+        DialogueStateTracker.from_events(sender_id, [UserUttered("hello")])
+    )
+
+    tracker = tracker_store.retrieve(sender_id)
+    tracker.update(BotUttered("hi"))
+
+    # the number of stored events is known, hence the events must not be counted
+    monkeypatch.setattr(tracker_store, "_event_query", Mock(side_effect=ValueError()))
+    tracker_store.save(tracker)
+    monkeypatch.undo()
+
+    with tracker_store.session_scope() as session:
+        # noinspection PyProtectedMember
+        assert tracker_store._event_query(session, sender_id).count() == 2
+
+
+def test_sql_retrieve_without_domain_caches_event_count(
+    default_domain: Domain, monkeypatch: MonkeyPatch
+):
+    tracker_store = SQLTrackerStore(default_domain)
+    sender_id = uuid.uuid4().hex
+    tracker_store.save(
+        DialogueStateTracker.from_events(sender_id, [UserUttered("hello")])
+    )
+    tracker_store.domain = None
+    # noinspection PyProtectedMember
+    tracker_store._stored_event_counts.clear()
+
+    assert tracker_store.retrieve(sender_id) is None
+
+    # the number of stored events is known, hence the events must not be counted
+    monkeypatch.setattr(tracker_store, "_event_query", Mock(side_effect=ValueError()))
+    assert tracker_store.number_of_existing_events(sender_id) == 1
+
+
+@pytest.mark.parametrize(
+    "tracker_store_type,tracker_store_kwargs",
+    [
+        (InMemoryTrackerStore, {}),
+        (MockedMongoTrackerStore, {}),
+        (SQLTrackerStore, {"host": "sqlite:///"}),
+        (MockedRedisEventLogTrackerStore, {}),
+    ],
+)
+def test_stream_events_without_retrieving_tracker_again(
+    tracker_store_type: Type[TrackerStore],
+    tracker_store_kwargs: Dict,
+    default_domain: Domain,
+    monkeypatch: MonkeyPatch,
+):
+    tracker_store = tracker_store_type(default_domain, **tracker_store_kwargs)
+    tracker_store.event_broker = Mock()
+    sender_id = uuid.uuid4().hex
+    tracker_store.save(
+        DialogueStateTracker.from_events(sender_id, [UserUttered("hello")])
+    )
+
+    tracker = tracker_store.retrieve(sender_id)
+    tracker.update(BotUttered("hi"))
+    tracker_store.event_broker.reset_mock()
+
+    # the number of stored events is known, hence the tracker must not be retrieved
+    monkeypatch.setattr(tracker_store, "retrieve", Mock(side_effect=ValueError()))
+    tracker_store.save(tracker)
+
+    tracker_store.event_broker.publish_many.assert_called_once()
+    assert tracker_store.event_broker.publish_many.call_args[0][0][0]["event"] == "bot"
+
+
+def test_sql_save_inserts_events_with_one_statement(default_domain: Domain):
+    tracker_store = SQLTrackerStore(default_domain)
+    events = [UserUttered("hello"), BotUttered("what"), UserUttered("123")]
+    tracker = DialogueStateTracker.from_events(uuid.uuid4().hex, events)
+
+    statements = []
+    sqlalchemy.event.listen(
+        tracker_store.engine,
+        "before_cursor_execute",
+        lambda _conn, _cursor, statement, *args: statements.append(statement),
+    )
+    tracker_store.save(tracker)
+
+    assert len([s for s in statements if s.startswith("INSERT")]) == 1
+    assert tracker_store.retrieve(tracker.sender_id).events == tracker.events
+
+
 @pytest.mark.parametrize(
     "tracker_store_type,tracker_store_kwargs",
-    [(MockedMongoTrackerStore, {}), (SQLTrackerStore, {"host": "sqlite:///"})],
+    [
+        (MockedMongoTrackerStore, {}),
+        (SQLTrackerStore, {"host": "sqlite:///"}),
+        (MockedRedisEventLogTrackerStore, {}),
+    ],
 )
 def test_tracker_store_retrieve_with_session_started_events(
     tracker_store_type: Type[TrackerStore],
@@ -589,7 +689,11 @@ def test_tracker_store_retrieve_with_session_started_events(
 
 @pytest.mark.parametrize(
     "tracker_store_type,tracker_store_kwargs",
-    [(MockedMongoTrackerStore, {}), (SQLTrackerStore, {"host": "sqlite:///"})],
+    [
+        (MockedMongoTrackerStore, {}),
+        (SQLTrackerStore, {"host": "sqlite:///"}),
+        (MockedRedisEventLogTrackerStore, {}),
+    ],
 )
 def test_tracker_store_retrieve_without_session_started_events(
     tracker_store_type: Type[TrackerStore],
@@ -626,6 +730,7 @@ def test_tracker_store_retrieve_without_session_started_events(
         (MockedMongoTrackerStore, {}),
         (SQLTrackerStore, {"host": "sqlite:///"}),
         (InMemoryTrackerStore, {}),
+        (MockedRedisEventLogTrackerStore, {}),
     ],
 )
 def test_tracker_store_retrieve_with_events_from_previous_sessions(
@@ -652,6 +757,101 @@ def test_tracker_store_retrieve_with_events_from_previous_sessions(
     assert len(actual.events) == len(tracker.events)
 
 
+def test_redis_event_log_only_appends_new_events(default_domain: Domain):
+    tracker_store = MockedRedisEventLogTrackerStore(default_domain)
+    events, tracker = create_tracker_with_partially_saved_events(tracker_store)
+
+    tracker_store.save(tracker)
+
+    # noinspection PyProtectedMember
+    stored = tracker_store.red.lrange(
+        tracker_store._event_log_key(tracker.sender_id), 0, -1
+    )
+    assert len(stored) == len(tracker.events)
+    assert tracker_store.retrieve(tracker.sender_id).events == tracker.events
+
+
+def test_redis_event_log_with_session_start(default_domain: Domain):
+    sender = "test_redis_event_log_with_session_start"
+    tracker_store = MockedRedisEventLogTrackerStore(default_domain)
+    tracker = _saved_tracker_with_multiple_session_starts(tracker_store, sender)
+
+    assert len(tracker.events) == 1
+
+    tracker.update(UserUttered("hi2"))
+    tracker_store.save(tracker)
+
+    # noinspection PyProtectedMember
+    stored = tracker_store.red.lrange(tracker_store._event_log_key(sender), 0, -1)
+    assert len(stored) == 6
+
+    retrieved = tracker_store.retrieve(sender)
+    assert len(retrieved.events) == 2
+    assert isinstance(retrieved.events[0], SessionStarted)
+    assert isinstance(retrieved.events[1], UserUttered)
+
+
+def test_redis_event_log_replaces_events_of_other_tracker(default_domain: Domain):
+    sender = "test_redis_event_log_replaces_events_of_other_tracker"
+    tracker_store = MockedRedisEventLogTrackerStore(default_domain)
+    tracker_store.save(
+        DialogueStateTracker.from_events(
+            sender, [UserUttered("hi"), UserUttered("how are you?"), Restarted()]
+        )
+    )
+
+    for events in [
+        [UserUttered("hello"), UserUttered("bye")],
+        [UserUttered("hello")],
+        [UserUttered("hello"), UserUttered("bye"), Restarted()],
+    ]:
+        tracker_store.save(DialogueStateTracker.from_events(sender, events))
+
+        assert list(tracker_store.retrieve(sender).events) == events
+
+
+def test_redis_event_log_appends_events_of_capped_tracker(default_domain: Domain):
+    sender = "test_redis_event_log_appends_events_of_capped_tracker"
+    tracker_store = MockedRedisEventLogTrackerStore(default_domain)
+    tracker = DialogueStateTracker(sender, default_domain.slots, max_event_history=2)
+
+    events = [UserUttered(str(index)) for index in range(4)]
+    for event in events:
+        tracker.update(event)
+        tracker_store.save(tracker)
+
+    # noinspection PyProtectedMember
+    stored = tracker_store.red.lrange(tracker_store._event_log_key(sender), 0, -1)
+    assert len(stored) == len(events)
+    assert list(tracker_store.retrieve(sender).events) == events
+
+
+def test_redis_event_log_appends_events_saved_by_other_store(default_domain: Domain,):
+    sender = "test_redis_event_log_appends_events_saved_by_other_store"
+    tracker_store = MockedRedisEventLogTrackerStore(default_domain)
+    # a second Rasa instance which uses the same Redis instance
+    other_tracker_store = MockedRedisEventLogTrackerStore(default_domain)
+    other_tracker_store.red = tracker_store.red
+
+    tracker = DialogueStateTracker.from_events(sender, [UserUttered("hi")])
+    tracker_store.save(tracker)
+
+    tracker.update(UserUttered("bye"))
+    other_tracker_store.save(tracker)
+
+    assert list(tracker_store.retrieve(sender).events) == list(tracker.events)
+
+
+@pytest.mark.parametrize("use_event_log", [True, False])
+def test_redis_keys(default_domain: Domain, use_event_log: bool):
+    tracker_store = MockedRedisEventLogTrackerStore(default_domain)
+    tracker_store.use_event_log = use_event_log
+    for sender_id in ["first", "second"]:
+        tracker_store.save(DialogueStateTracker.from_events(sender_id, [Restarted()]))
+
+    assert sorted(tracker_store.keys()) == ["first", "second"]
+
+
 def test_session_scope_error(
     monkeypatch: MonkeyPatch, capsys: CaptureFixture, default_domain: Domain
 ):
@@ -445,3 +445,41 @@ async def test_train_persist_load_with_composite_entities(
     assert loaded.pipeline
     text = "I am looking for an italian restaurant"
     assert loaded.parse(text) == trained.parse(text)
+
+
+async def test_process_batch_matches_process(component_builder, tmpdir):
+    pipeline = as_pipeline(
+        "WhitespaceTokenizer", "CountVectorsFeaturizer", "DIETClassifier"
+    )
+    pipeline[2].update({RANDOM_SEED: 1, EPOCHS: 1, BILOU_FLAG: True})
+
+    _config = RasaNLUModelConfig({"pipeline": pipeline, "language": "en"})
+    (_, trained, _) = await train(
+        _config,
+        path=tmpdir.strpath,
+        data="data/test/demo-rasa-composite-entities.md",
+        component_builder=component_builder,
+    )
+
+    texts = [
+        "I am looking for an italian restaurant",
+        "hello",
+        "",
+        "show me a mexican place in the centre of berlin",
+    ]
+    batch_results = trained.parse_batch(texts)
+
+    for text, batch_result in zip(texts, batch_results):
+        result = trained.parse(text)
+
+        assert batch_result[INTENT]["name"] == result[INTENT]["name"]
+        assert batch_result[INTENT]["confidence"] == pytest.approx(
+            result[INTENT]["confidence"], abs=1e-5
+        )
+        assert [
+            (entity["entity"], entity["start"], entity["end"])
+            for entity in batch_result["entities"]
+        ] == [
+            (entity["entity"], entity["start"], entity["end"])
+            for entity in result["entities"]
+        ]
@@ -3,6 +3,7 @@ import pytest
 
 import scipy.sparse
 from typing import Text
+from unittest.mock import patch
 
 from rasa.nlu.tokenizers.spacy_tokenizer import SpacyTokenizer
 from rasa.nlu.tokenizers.whitespace_tokenizer import WhitespaceTokenizer
@@ -195,3 +196,33 @@ def test_text_featurizer_using_pos_with_action_text(
 
     assert seq_vec is None
     assert sen_vec is None
+
+
+def test_text_featurizer_computes_training_features_once():
+    featurizer = LexicalSyntacticFeaturizer(
+        {"features": [["low"], ["BOS", "EOS", "title"], ["upper"]]}
+    )
+
+    train_messages = [
+        Message(data={TEXT: "Hello there"}),
+        Message(data={TEXT: "HI"}),
+        Message(data={ACTION_TEXT: "action text"}),
+    ]
+    test_message = Message(data={TEXT: "Hello there"})
+    for message in train_messages + [test_message]:
+        WhitespaceTokenizer().process(message)
+
+    with patch.object(
+        featurizer, "_tokens_to_features", wraps=featurizer._tokens_to_features
+    ) as tokens_to_features:
+        featurizer.train(TrainingData(train_messages))
+
+    assert tokens_to_features.call_count == 2
+
+    featurizer.process(test_message)
+
+    train_vec, _ = train_messages[0].get_sparse_features(TEXT, [])
+    test_vec, _ = test_message.get_sparse_features(TEXT, [])
+
+    assert train_vec.features.shape == (2, featurizer.number_of_features)
+    assert np.all(train_vec.features.toarray() == test_vec.features.toarray())
@@ -71,6 +71,29 @@ def test_spacy_training_sample_alignment(spacy_nlp_component):
     ]
 
 
+def test_spacy_process_batch_matches_process(spacy_nlp_component):
+    texts = ["I have a feeling", "", "I am the last message"]
+
+    single_messages = [Message(data={TEXT: text}) for text in texts]
+    for message in single_messages:
+        spacy_nlp_component.process(message)
+
+    batch_messages = [Message(data={TEXT: text}) for text in texts]
+    spacy_nlp_component.process_batch(batch_messages)
+
+    for single, batch in zip(single_messages, batch_messages):
+        if single.get(SPACY_DOCS[TEXT]) is None:
+            assert batch.get(SPACY_DOCS[TEXT]) is None
+            continue
+
+        assert [t.text for t in batch.get(SPACY_DOCS[TEXT])] == [
+            t.text for t in single.get(SPACY_DOCS[TEXT])
+        ]
+        assert np.allclose(
+            batch.get(SPACY_DOCS[TEXT]).vector, single.get(SPACY_DOCS[TEXT]).vector
+        )
+
+
 def test_spacy_intent_featurizer(spacy_nlp_component):
     from rasa.nlu.featurizers.dense_featurizer.spacy_featurizer import SpacyFeaturizer
 
@@ -95,6 +95,36 @@ def test_train_selector(pipeline, component_builder, tmpdir):
         assert rank.get("intent_response_key") is not None
 
 
+def test_process_batch_matches_process(component_builder, tmpdir):
+    training_data = rasa.shared.nlu.training_data.loading.load_data(
+        "data/examples/rasa/demo-rasa.md"
+    )
+    training_data_responses = rasa.shared.nlu.training_data.loading.load_data(
+        "data/examples/rasa/demo-rasa-responses.md"
+    )
+    training_data = training_data.merge(training_data_responses)
+
+    pipeline = [
+        {"name": "WhitespaceTokenizer"},
+        {"name": "CountVectorsFeaturizer"},
+        {"name": "ResponseSelector", EPOCHS: 1},
+    ]
+    nlu_config = RasaNLUModelConfig({"language": "en", "pipeline": pipeline})
+
+    trainer = Trainer(nlu_config)
+    interpreter = trainer.train(training_data)
+
+    texts = ["hello", "what is your name?", "how is the weather today where you are"]
+    batch_results = interpreter.parse_batch(texts)
+
+    for text, batch_result in zip(texts, batch_results):
+        response = batch_result["response_selector"]["default"]["response"]
+        expected = interpreter.parse(text)["response_selector"]["default"]["response"]
+
+        assert response["intent_response_key"] == expected["intent_response_key"]
+        assert response["confidence"] == pytest.approx(expected["confidence"], abs=1e-5)
+
+
 @pytest.mark.parametrize(
     "use_text_as_label, label_values",
     [
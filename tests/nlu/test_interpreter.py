@@ -1,3 +1,5 @@
+import asyncio
+
 import rasa.nlu
 
 import pytest
@@ -70,3 +72,37 @@ def test_create_interpreter(parameters, trained_nlu_model):
     )
 
     assert isinstance(interpreter, parameters["type"])
+
+
+def test_parse_batch_matches_parse(trained_nlu_model):
+    _, nlu_model_directory = get_model_subdirectories(get_model(trained_nlu_model))
+    interpreter = Interpreter.load(nlu_model_directory)
+
+    texts = ["hello", "", "goodbye", "I am sad"]
+    results = interpreter.parse_batch(texts)
+
+    assert results == [interpreter.parse(text) for text in texts]
+
+
+async def test_concurrent_messages_are_parsed_in_batches(
+    trained_nlu_model, monkeypatch
+):
+    _, nlu_model_directory = get_model_subdirectories(get_model(trained_nlu_model))
+    interpreter = RasaNLUInterpreter(
+        nlu_model_directory, batch_size=2, batch_wait_time=10
+    )
+
+    batches = []
+    parse_batch = interpreter.interpreter.parse_batch
+
+    def tracked_parse_batch(texts):
+        batches.append(texts)
+        return parse_batch(texts)
+
+    monkeypatch.setattr(interpreter.interpreter, "parse_batch", tracked_parse_batch)
+
+    texts = ["hello", "goodbye", "I am sad"]
+    results = await asyncio.gather(*[interpreter.parse(text) for text in texts])
+
+    assert batches == [["hello", "goodbye"], ["I am sad"]]
+    assert results == [interpreter.interpreter.parse(text) for text in texts]
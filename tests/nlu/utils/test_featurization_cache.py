@@ -0,0 +1,64 @@
+from pathlib import Path
+
+import numpy as np
+
+from rasa.nlu.utils.featurization_cache import (
+    FEATURIZATION_CACHE_DIR,
+    FeaturizationCache,
+    model_weights_fingerprint,
+)
+
+
+def test_featurization_cache_round_trip(tmp_path: Path):
+    cache = FeaturizationCache(str(tmp_path), {"model": "bert"})
+    value = (np.ones((2, 3)), np.zeros((1, 3)))
+
+    assert cache.get({"text": "hello"}) is None
+
+    cache.set({"text": "hello"}, value)
+    cached = cache.get({"text": "hello"})
+
+    assert np.array_equal(cached[0], value[0])
+    assert np.array_equal(cached[1], value[1])
+    assert cache.get({"text": "bye"}) is None
+
+
+def test_featurization_cache_misses_for_other_fingerprint(tmp_path: Path):
+    FeaturizationCache(str(tmp_path), {"model": "bert"}).set({"text": "hi"}, 1)
+
+    cache = FeaturizationCache(str(tmp_path), {"model": "bert"})
+    assert cache.get({"text": "hi"}) == 1
+
+    cache = FeaturizationCache(str(tmp_path), {"model": "gpt"})
+    assert cache.get({"text": "hi"}) is None
+
+
+def test_featurization_cache_ignores_corrupted_entries(tmp_path: Path):
+    cache = FeaturizationCache(str(tmp_path), {})
+    cache.set({"text": "hi"}, 1)
+
+    for path in tmp_path.rglob("*"):
+        if path.is_file():
+            path.write_bytes(b"not a pickle")
+
+    assert cache.get({"text": "hi"}) is None
+
+
+def test_featurization_cache_is_disabled_by_default(tmp_path: Path):
+    assert FeaturizationCache.create({}, {}) is None
+    assert FeaturizationCache.create({FEATURIZATION_CACHE_DIR: None}, {}) is None
+    assert FeaturizationCache.create({FEATURIZATION_CACHE_DIR: str(tmp_path)}, {})
+
+
+def test_model_weights_fingerprint_of_local_weights(tmp_path: Path):
+    assert model_weights_fingerprint("bert-base-uncased") == {
+        "model_weights": "bert-base-uncased"
+    }
+
+    weights = tmp_path / "weights.bin"
+    weights.write_bytes(b"123")
+    fingerprint = model_weights_fingerprint(str(tmp_path))
+
+    weights.write_bytes(b"12345")
+
+    assert model_weights_fingerprint(str(tmp_path)) != fingerprint
@@ -123,3 +123,28 @@ def test_attention_mask(
 
     assert np.all(mask_ones == 1)
     assert np.all(mask_zeros == 0)
+
+
+def test_docs_are_computed_in_batches_of_similar_length(monkeypatch):
+    component = HFTransformersNLP({"model_name": "bert"}, skip_model_load=True)
+    examples = [
+        Message.build(text=" ".join(["hi"] * length)) for length in [5, 1, 4, 2, 3]
+    ]
+
+    def tokenize(batch_examples, attribute):
+        token_ids = [[0] * len(ex.get(attribute).split()) for ex in batch_examples]
+        return token_ids, token_ids
+
+    batches = []
+
+    def compute_docs(batch_tokens, batch_token_ids, *args):
+        batches.append([len(token_ids) for token_ids in batch_token_ids])
+        return [{"length": len(token_ids)} for token_ids in batch_token_ids]
+
+    monkeypatch.setattr(component, "_get_token_ids_for_batch", tokenize)
+    monkeypatch.setattr(component, "_get_docs_for_tokens", compute_docs)
+
+    docs = component._get_docs_for_examples(examples, "text", batch_size=2)
+
+    assert batches == [[1, 2], [3, 4], [5]]
+    assert [doc["length"] for doc in docs] == [5, 1, 4, 2, 3]
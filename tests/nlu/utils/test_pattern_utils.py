@@ -1,3 +1,4 @@
+import re
 from typing import Dict, List, Text
 
 import pytest
@@ -171,3 +172,50 @@ def test_extract_patterns_use_only_lookup_tables_or_regex_features(
     )
 
     assert actual_patterns == expected_patterns
+
+
+@pytest.mark.parametrize(
+    "elements, text",
+    [
+        (["Max", "John"], "Max and John met Maxine"),
+        (["new", "new york"], "I live in new york"),
+        (["new york", "new"], "I live in new york"),
+        (["a.b", "c|d", "_x"], "a.b c|d _x a.bc"),
+        (["Berlin"], "berlin BERLIN Berlin"),
+    ],
+)
+def test_compiled_lookup_table_matches_like_regex(elements: List[Text], text: Text):
+    pattern = {
+        "name": "lookup",
+        "pattern": pattern_utils._generate_lookup_regex({"elements": elements}),
+    }
+
+    compiled_pattern = pattern_utils.compile_patterns([pattern])[0]
+
+    assert isinstance(compiled_pattern, pattern_utils.CompiledLookupTable)
+    assert compiled_pattern.spans(text) == [
+        match.span() for match in re.finditer(pattern["pattern"], text)
+    ]
+
+
+@pytest.mark.parametrize(
+    "pattern, case_sensitive",
+    [
+        ({"name": "zipcode", "pattern": "[0-9]{5}"}, True),
+        ({"name": "person", "pattern": "(\\bMax\\b|\\bJohn\\b)"}, False),
+        ({"name": "person", "pattern": "(\\bMax\\b|\\bJohn\\b|abc)"}, True),
+    ],
+)
+def test_compile_patterns_falls_back_to_regex(
+    pattern: Dict[Text, Text], case_sensitive: bool
+):
+    text = "max 12345 John"
+    flags = 0 if case_sensitive else re.IGNORECASE
+
+    compiled_pattern = pattern_utils.compile_patterns([pattern], case_sensitive)[0]
+
+    assert isinstance(compiled_pattern, pattern_utils.CompiledRegex)
+    assert compiled_pattern.name == pattern["name"]
+    assert compiled_pattern.spans(text) == [
+        match.span() for match in re.finditer(pattern["pattern"], text, flags)
+    ]
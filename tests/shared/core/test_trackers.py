@@ -1,9 +1,11 @@
 import json
 import logging
 import os
+from collections import deque
 from pathlib import Path
 import tempfile
 from typing import List, Text, Dict, Any, Type
+from unittest.mock import patch
 
 import fakeredis
 import pytest
@@ -74,6 +76,7 @@ class MockRedisTrackerStore(RedisTrackerStore):
     def __init__(self, _domain: Domain) -> None:
         self.red = fakeredis.FakeStrictRedis()
         self.record_exp = None
+        self.use_event_log = False
 
         # added in redis==3.3.0, but not yet in fakeredis
         self.red.connection_pool.connection_class.health_check_interval = 0
@@ -450,6 +453,110 @@ def test_revert_user_utterance_event(default_domain: Domain):
     assert len(list(tracker.generate_all_prior_trackers())) == 3
 
 
+@pytest.mark.parametrize(
+    "events",
+    [
+        [Restarted(), ActionExecuted(ACTION_LISTEN_NAME), user_uttered("greet")],
+        [ActionReverted()],
+        [UserUtteranceReverted()],
+        [
+            ActionExecuted("loop"),
+            ActiveLoop("loop"),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("affirm"),
+            ActionExecuted("loop"),
+        ],
+    ],
+)
+def test_past_states_are_updated_incrementally(
+    events: List[Event], default_domain: Domain
+):
+    tracker = DialogueStateTracker.from_events(
+        "default",
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("greet"),
+            ActionExecuted("utter_greet"),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("goodbye"),
+        ],
+        default_domain.slots,
+    )
+
+    assert tracker.past_states(default_domain) == (
+        default_domain.states_for_tracker_history(tracker)
+    )
+
+    for event in events:
+        tracker.update(event)
+        assert tracker.past_states(default_domain) == (
+            default_domain.states_for_tracker_history(tracker)
+        )
+
+
+def test_past_states_cannot_be_modified(default_domain: Domain):
+    tracker = DialogueStateTracker.from_events(
+        "default",
+        [ActionExecuted(ACTION_LISTEN_NAME), user_uttered("greet")],
+        default_domain.slots,
+    )
+
+    states = tracker.past_states(default_domain)
+    states[-1].clear()
+
+    assert tracker.past_states(default_domain)[-1]
+
+
+def test_applied_events_are_cached_until_events_change():
+    tracker = DialogueStateTracker.from_events(
+        "default", [ActionExecuted(ACTION_LISTEN_NAME), user_uttered("greet")]
+    )
+
+    applied_events = tracker.applied_events()
+    applied_events.clear()
+    assert tracker.applied_events() == list(tracker.events)
+
+    with patch.object(
+        tracker, "_compute_applied_events", wraps=tracker._compute_applied_events
+    ) as compute_applied_events:
+        tracker.applied_events()
+        compute_applied_events.assert_not_called()
+
+        tracker.update(UserUtteranceReverted())
+        assert tracker.applied_events() == []
+        compute_applied_events.assert_called_once()
+
+        tracker.events = deque([ActionExecuted(ACTION_LISTEN_NAME)])
+        assert tracker.applied_events() == list(tracker.events)
+        assert compute_applied_events.call_count == 2
+
+
+def test_applied_events_with_max_event_history():
+    tracker = DialogueStateTracker("default", None, max_event_history=2)
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+    tracker.update(user_uttered("greet"))
+    assert tracker.applied_events() == list(tracker.events)
+
+    # the oldest event is dropped while the number of events stays the same
+    tracker.update(ActionExecuted("utter_greet"))
+    assert tracker.applied_events() == list(tracker.events)
+
+
+def test_current_slot_values_are_updated_when_slots_are_set():
+    tracker = DialogueStateTracker("default", [TextSlot("name")])
+    assert tracker.current_slot_values() == {"name": None}
+
+    tracker.update(SlotSet("name", "Mary"))
+    slot_values = tracker.current_slot_values()
+    assert slot_values == {"name": "Mary"}
+
+    slot_values["name"] = "Jane"
+    assert tracker.current_slot_values() == {"name": "Mary"}
+
+    tracker.update(Restarted())
+    assert tracker.current_slot_values() == {"name": None}
+
+
 def test_traveling_back_in_time(default_domain: Domain):
     tracker = DialogueStateTracker("default", default_domain.slots)
     # the retrieved tracker should be empty
@@ -264,3 +264,38 @@ def test_build_from_action():
     assert Message.build_from_action(
         action_text=test_action_text, action_name=test_action_name
     ) == Message(data={ACTION_NAME: test_action_name, ACTION_TEXT: test_action_text})
+
+
+def test_copy_on_write():
+    features = Features(np.array([1, 1, 0]), FEATURE_TYPE_SENTENCE, TEXT, "test")
+    message = Message({TEXT: "hello", "entities": []}, features=[features])
+
+    copied = message.copy_on_write()
+    copied.set(TEXT, "bye", add_to_output=True)
+    copied.set("intent", "greet", add_to_output=True)
+    copied.add_features(
+        Features(np.array([0, 1]), FEATURE_TYPE_SENTENCE, ACTION_TEXT, "test")
+    )
+
+    assert message.data == {TEXT: "hello", "entities": []}
+    assert message.output_properties == {TEXT}
+    assert message.features == [features]
+
+    # values and features themselves are shared
+    assert copied.get("entities") is message.get("entities")
+    assert copied.features[0] is features
+
+
+def test_combined_features_do_not_change_original_features():
+    features = Features(np.array([[1, 1, 0]]), FEATURE_TYPE_SEQUENCE, TEXT, "a")
+    other_features = Features(np.array([[1, 0]]), FEATURE_TYPE_SEQUENCE, TEXT, "b")
+    message = Message({TEXT: "hello"}, features=[features, other_features])
+
+    sequence_features, _ = message.get_dense_features(TEXT, ["a"])
+    assert sequence_features.features is features.features
+    assert sequence_features.origin == ["a"]
+
+    sequence_features, _ = message.get_dense_features(TEXT, [])
+    assert np.all(sequence_features.features == [[1, 1, 0, 1, 0]])
+    assert np.all(features.features == [[1, 1, 0]])
+    assert features.origin == "a"
@@ -12,8 +12,10 @@ from rasa.shared.importers.importer import E2EImporter, TrainingDataImporter
 from rasa.shared.nlu.constants import TEXT, INTENT_RESPONSE_KEY
 from rasa.nlu.convert import convert_training_data
 from rasa.nlu.extractors.mitie_entity_extractor import MitieEntityExtractor
+from rasa.nlu.constants import TOKENS_NAMES
 from rasa.nlu.tokenizers.whitespace_tokenizer import WhitespaceTokenizer
 from rasa.shared.nlu.training_data.training_data import TrainingData
+from rasa.shared.nlu.training_data.message import Message
 from rasa.shared.nlu.training_data.loading import (
     guess_format,
     UNK,
@@ -641,3 +643,22 @@ async def test_without_additional_e2e_examples(tmp_path: Path):
     assert training_data.training_examples
     assert training_data.is_empty()
     assert not training_data.without_empty_e2e_examples().training_examples
+
+
+def test_copy_on_write():
+    examples = [
+        Message({TEXT: "hello", "intent": "greet"}),
+        Message({TEXT: "hello", "intent": "greet"}),
+    ]
+    training_data = TrainingData(
+        regex_features=[{"name": "zipcode", "pattern": "[0-9]{5}"}]
+    )
+    training_data.training_examples = examples
+
+    copied = training_data.copy_on_write()
+    WhitespaceTokenizer().train(copied)
+
+    assert len(copied.training_examples) == len(examples)
+    assert copied.regex_features == training_data.regex_features
+    assert all(example.get(TOKENS_NAMES[TEXT]) for example in copied.training_examples)
+    assert not any(example.get(TOKENS_NAMES[TEXT]) for example in examples)
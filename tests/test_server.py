@@ -1,3 +1,4 @@
+import json
 import os
 from multiprocessing.managers import DictProxy
 from pathlib import Path
@@ -7,7 +8,7 @@ import requests
 import time
 import uuid
 
-from typing import List, Text, Type, Generator, NoReturn, Dict
+from typing import Any, List, Text, Type, Generator, NoReturn, Dict
 from contextlib import ExitStack
 
 from _pytest import pathlib
@@ -371,6 +372,40 @@ def test_parse_with_different_emulation_mode(
     assert response.status == 200
 
 
+def test_parse_bulk(rasa_app: SanicTestClient):
+    texts = ["hello", "/greet", "hello ńöñàśçií"]
+    _, response = rasa_app.post(
+        "/model/parse/bulk", json=[texts[0], {"text": texts[1]}, {"text": texts[2]}]
+    )
+    assert response.status == 200
+    assert response.headers["Content-Type"] == rasa.server.NDJSON_CONTENT_TYPE
+
+    results = [json.loads(line) for line in response.text.splitlines()]
+    expected = [
+        rasa_app.post("/model/parse", json={"text": text})[1].json for text in texts
+    ]
+    assert results == expected
+
+
+def test_parse_bulk_with_ndjson(rasa_app: SanicTestClient):
+    texts = ["hello", "goodbye"]
+    _, response = rasa_app.post(
+        "/model/parse/bulk",
+        data="\n".join(json.dumps({"text": text}) for text in texts),
+        headers={"Content-type": rasa.server.NDJSON_CONTENT_TYPE},
+    )
+    assert response.status == 200
+
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert [result["text"] for result in results] == texts
+
+
+@pytest.mark.parametrize("payload", [{"text": "hello"}, [{"no_text": "hello"}]])
+def test_parse_bulk_with_invalid_request(rasa_app: SanicTestClient, payload: Any):
+    _, response = rasa_app.post("/model/parse/bulk", json=payload)
+    assert response.status == 400
+
+
 def test_parse_without_nlu_model(rasa_app_core: SanicTestClient):
     _, response = rasa_app_core.post("/model/parse", json={"text": "hello"})
     assert response.status == 200
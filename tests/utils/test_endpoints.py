@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 import pytest
@@ -120,3 +121,70 @@ async def test_request_non_json_response():
         response = await endpoint.request("post", subpath="test")
 
         assert not response
+
+
+async def test_requests_use_own_client_session_by_default():
+    with aioresponses() as mocked:
+        endpoint = endpoint_utils.EndpointConfig("https://example.com/")
+
+        mocked.post("https://example.com/test", payload={"ok": True})
+
+        await endpoint.request("post", subpath="test")
+
+        assert endpoint._session is None
+
+
+async def test_requests_reuse_client_session():
+    with aioresponses() as mocked:
+        endpoint = endpoint_utils.EndpointConfig("https://example.com/")
+        endpoint.enable_session_pooling()
+
+        mocked.post("https://example.com/test", payload={"ok": True}, repeat=True)
+
+        await endpoint.request("post", subpath="test")
+        session = endpoint._session
+
+        await endpoint.request("post", subpath="test")
+
+        assert endpoint._session is session
+        assert not session.closed
+
+        await endpoint.close()
+
+        assert session.closed
+        assert endpoint._session is None
+
+
+def test_client_session_is_closed_if_event_loop_changes():
+    endpoint = endpoint_utils.EndpointConfig("https://example.com/")
+    endpoint.enable_session_pooling()
+
+    old_loop = asyncio.new_event_loop()
+    old_session = old_loop.run_until_complete(endpoint._pooled_session())
+
+    new_loop = asyncio.new_event_loop()
+    new_session = new_loop.run_until_complete(endpoint._pooled_session())
+
+    assert new_session is not old_session
+    assert old_session.closed
+
+    new_loop.run_until_complete(endpoint.close())
+    old_loop.close()
+    new_loop.close()
+
+
+async def test_client_session_connection_limits():
+    endpoint = endpoint_utils.EndpointConfig.from_dict(
+        {
+            "url": "https://example.com/",
+            "connection_limit": 20,
+            "connection_limit_per_host": 5,
+        }
+    )
+
+    async with endpoint.session() as session:
+        assert session.connector.limit == 20
+        assert session.connector.limit_per_host == 5
+
+    assert "connection_limit" not in endpoint.kwargs
+    assert endpoint.copy().connection_limit_per_host == 5